@@ -7,7 +7,7 @@ Alternatively, set environment variables or create a .env file.
 All configuration options support environment variable overrides.
 """
 
-from typing import Literal
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -35,6 +35,14 @@ class Settings(BaseSettings):
     mcp_server_name: str = "paramount-media-ops-mcp"
     mcp_server_version: str = "0.1.0"
     
+    # Uvicorn worker tuning: "auto" picks uvloop/httptools when installed
+    # (uvicorn[standard] skips uvloop on Windows); Docker pins them explicitly
+    mcp_server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    mcp_server_http: Literal["auto", "h11", "httptools"] = "auto"
+    mcp_server_workers: int = 1
+    mcp_server_backlog: int = 2048
+    mcp_server_limit_concurrency: Optional[int] = 1000
+    
     # Environment: development, staging, production
     environment: Literal["development", "staging", "production"] = "development"
     
@@ -8,7 +8,7 @@ Or with uvicorn directly:
     uvicorn mcp.server:app --host 0.0.0.0 --port 8000 --reload
 """
 
-from mcp.server import app, logger
+from mcp.server import logger
 from config import settings
 import uvicorn
 
@@ -20,10 +20,16 @@ if __name__ == "__main__":
         environment=settings.environment
     )
     
+    # Import string (not the app object) so reload and multiple workers work
     uvicorn.run(
-        app,
+        "mcp.server:app",
         host=settings.mcp_server_host,
         port=settings.mcp_server_port,
+        loop=settings.mcp_server_loop,
+        http=settings.mcp_server_http,
+        workers=settings.mcp_server_workers,
+        backlog=settings.mcp_server_backlog,
+        limit_concurrency=settings.mcp_server_limit_concurrency,
         reload=settings.environment == "development",
         log_level=settings.log_level.lower(),
         access_log=True
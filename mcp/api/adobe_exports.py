@@ -56,11 +56,11 @@ async def export_operations_report(request: ExportReportRequest):
     try:
         # Generate PDF based on report type
         if request.report_type == "churn":
-            pdf_path = adobe_pdf.generate_churn_report(request.data)
+            pdf_path = await adobe_pdf.generate_churn_report_async(request.data)
         elif request.report_type == "incidents":
-            pdf_path = adobe_pdf.generate_incident_report(request.data)
+            pdf_path = await adobe_pdf.generate_incident_report_async(request.data)
         elif request.report_type == "executive":
-            pdf_path = adobe_pdf.generate_executive_summary(request.data)
+            pdf_path = await adobe_pdf.generate_executive_summary_async(request.data)
         else:
             raise HTTPException(
                 status_code=400,
@@ -83,7 +83,7 @@ async def export_operations_report(request: ExportReportRequest):
         if request.upload_to_cloud:
             storage_client = create_adobe_storage_client()
             if storage_client and storage_client.enabled:
-                upload_result = storage_client.upload_pdf_report(
+                upload_result = await storage_client.upload_pdf_report_async(
                     pdf_path=pdf_path,
                     report_type=request.report_type
                 )
@@ -162,7 +162,7 @@ async def upload_dashboard_export(
         )
     
     try:
-        result = storage_client.upload_dashboard_export(
+        result = await storage_client.upload_dashboard_export_async(
             data=data,
             export_type=export_format
         )
@@ -206,7 +206,7 @@ async def list_cloud_files(
         )
     
     try:
-        files = storage_client.list_files(folder=folder, file_type=file_type)
+        files = await storage_client.list_files_async(folder=folder, file_type=file_type)
         
         return {
             "status": "success",
@@ -240,7 +240,7 @@ async def get_storage_usage():
         )
     
     try:
-        usage = storage_client.get_storage_usage()
+        usage = await storage_client.get_storage_usage_async()
         
         if "error" in usage:
             raise HTTPException(status_code=500, detail=usage["error"])
@@ -4,6 +4,7 @@ Confluence REST API Endpoints with comprehensive Swagger documentation.
 Provides knowledge base, documentation, and collaboration features.
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Body, status
 from pydantic import BaseModel, Field
@@ -18,7 +19,9 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/confluence", tags=["Confluence Knowledge Base"])
 
-# Initialize Atlassian client with real Confluence credentials
+# Initialize Atlassian client with real Confluence credentials. Its Confluence
+# methods are synchronous (and may back off on throttling), so the handlers
+# below run them in a worker thread to keep the event loop free.
 atlassian = AtlassianClient(
     confluence_url=getattr(settings, "confluence_api_url", "") or getattr(settings, "atlassian_api_url", ""),
     confluence_username=getattr(settings, "confluence_username", ""),
@@ -110,7 +113,7 @@ class ConfluenceSpace(BaseModel):
 async def get_spaces() -> List[ConfluenceSpace]:
     """Get all Confluence spaces."""
     try:
-        spaces = atlassian.get_spaces()
+        spaces = await asyncio.to_thread(atlassian.get_spaces)
         return [ConfluenceSpace(**space) for space in spaces]
     except Exception as e:
         logger.error("confluence_spaces_failed", error=str(e))
@@ -141,7 +144,7 @@ async def get_pages(
 ) -> List[ConfluencePage]:
     """Get pages in a Confluence space."""
     try:
-        pages = atlassian.get_pages(space_key=space_key, limit=limit)
+        pages = await asyncio.to_thread(atlassian.get_pages, space_key=space_key, limit=limit)
         
         # Filter by search term if provided
         if search:
@@ -175,7 +178,7 @@ async def get_page(
 ) -> ConfluencePage:
     """Get a specific Confluence page."""
     try:
-        pages = atlassian.get_pages(limit=100)
+        pages = await asyncio.to_thread(atlassian.get_pages, limit=100)
         page = next((p for p in pages if p["id"] == page_id), None)
         
         if not page:
@@ -215,7 +218,8 @@ async def create_page(request: CreatePageRequest = Body(...)) -> ConfluencePage:
     try:
         logger.info("confluence_create_page", space=request.space_key, title=request.title)
         
-        page = atlassian.create_confluence_page(
+        page = await asyncio.to_thread(
+            atlassian.create_confluence_page,
             space_key=request.space_key,
             title=request.title,
             content=request.content,
@@ -254,7 +258,7 @@ async def search_pages(
         logger.info("confluence_search", query=q, space=space_key)
         
         # Get all pages and filter (simplified search)
-        pages = atlassian.get_pages(space_key=space_key, limit=limit * 2)
+        pages = await asyncio.to_thread(atlassian.get_pages, space_key=space_key, limit=limit * 2)
         
         # Filter by search term
         results = [
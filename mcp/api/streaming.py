@@ -4,24 +4,288 @@ Streaming QoE and Infrastructure API Endpoints.
 Provides Quality of Experience metrics, APM data, and infrastructure health.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable
+from pathlib import Path
 import asyncio
-from fastapi import APIRouter, HTTPException, Query, status
-from pydantic import BaseModel, Field
+import hashlib
+import json
+import time
+import zlib
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+from functools import lru_cache
 
-from mcp.integrations import ConvivaClient, NewRelicClient
 from config import settings
 from mcp.utils.error_handler import ServiceError, ConnectionError, TimeoutError, retry_with_backoff, circuit_breaker
 from mcp.utils.logger import get_logger, log_performance
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/api/streaming", tags=["Streaming QoE & Infrastructure"])
+router = APIRouter(
+    prefix="/api/streaming",
+    tags=["Streaming QoE & Infrastructure"],
+    default_response_class=ORJSONResponse
+)
+
+# Long-form endpoint descriptions live in a sibling JSON file and are only
+# loaded when the OpenAPI schema is generated (keyed by route path)
+_DESCRIPTIONS_PATH = Path(__file__).with_name("streaming_descriptions.json")
+
+
+def apply_openapi_descriptions(schema: Dict[str, Any]) -> None:
+    """Fill this router's operation descriptions into a generated OpenAPI schema."""
+    descriptions = json.loads(_DESCRIPTIONS_PATH.read_text(encoding="utf-8"))
+    paths = schema.get("paths", {})
+    for path, description in descriptions.items():
+        operation = paths.get(router.prefix + path, {}).get("get")
+        if operation is not None:
+            operation["description"] = description
+
+
+# Clients are built on first use so importing the router stays cheap;
+# tests can reset them with get_conviva.cache_clear()
+@lru_cache(maxsize=1)
+def get_conviva():
+    """Get the shared Conviva client."""
+    from mcp.integrations.conviva_client import ConvivaClient
+    return ConvivaClient(mock_mode=settings.mock_mode)
+
+
+@lru_cache(maxsize=1)
+def get_newrelic():
+    """Get the shared NewRelic client."""
+    from mcp.integrations.newrelic_client import NewRelicClient
+    return NewRelicClient(mock_mode=settings.mock_mode)
+
+
+async def close_clients() -> None:
+    """Close the shared Conviva and NewRelic HTTP connection pools."""
+    if get_conviva.cache_info().currsize:
+        await get_conviva().close()
+    if get_newrelic.cache_info().currsize:
+        await get_newrelic().close()
+
+
+# Background QoE snapshot for the default dashboard query (no filters, 24h).
+# Upstream polling stays constant regardless of how many clients read it.
+# A snapshot older than QOE_SNAPSHOT_MAX_AGE (refreshes failing) is not served.
+QOE_REFRESH_INTERVAL = 15.0
+QOE_SNAPSHOT_WAIT = 2.0
+QOE_SNAPSHOT_MAX_AGE = 3 * QOE_REFRESH_INTERVAL
+_qoe_snapshot: Dict[str, Any] = {"body": None, "updated": 0.0}
+_qoe_ready: Optional[asyncio.Event] = None
+_qoe_refresher: Optional[asyncio.Task] = None
+
+
+async def _refresh_qoe_snapshot() -> None:
+    """Refresh the encoded QoE snapshot until cancelled."""
+    while True:
+        try:
+            metrics_data = await get_conviva().get_qoe_metrics_async("last_24_hours")
+            _qoe_snapshot["body"] = orjson.dumps(_build_qoe_metrics(metrics_data))
+            _qoe_snapshot["updated"] = time.monotonic()
+        except Exception as e:
+            # Keep serving the previous snapshot until it ages out
+            logger.warning("qoe_snapshot_refresh_failed", error=str(e))
+        # Readers stop waiting after the first attempt, even a failed one
+        _qoe_ready.set()
+        await asyncio.sleep(QOE_REFRESH_INTERVAL)
+
+
+def start_background_refresh() -> None:
+    """Start the QoE snapshot refresher on the running event loop."""
+    global _qoe_ready, _qoe_refresher
+    if _qoe_refresher is None or _qoe_refresher.done():
+        _qoe_ready = asyncio.Event()
+        _qoe_refresher = asyncio.create_task(_refresh_qoe_snapshot())
+
+
+async def stop_background_refresh() -> None:
+    """Cancel the QoE snapshot refresher and drop the snapshot."""
+    global _qoe_ready, _qoe_refresher
+    if _qoe_refresher is not None:
+        _qoe_refresher.cancel()
+        try:
+            await _qoe_refresher
+        except asyncio.CancelledError:
+            pass
+    _qoe_ready = None
+    _qoe_refresher = None
+    _qoe_snapshot["body"] = None
+    _qoe_snapshot["updated"] = 0.0
+
+
+async def _get_qoe_snapshot() -> Optional[bytes]:
+    """
+    Return the encoded QoE snapshot, waiting briefly for the first refresh.
+    
+    ``None`` (callers go live) when there is no refresher, the first refresh
+    failed, or the snapshot is older than ``QOE_SNAPSHOT_MAX_AGE``.
+    """
+    if _qoe_ready is None:
+        return None
+    try:
+        await asyncio.wait_for(_qoe_ready.wait(), QOE_SNAPSHOT_WAIT)
+    except asyncio.TimeoutError:
+        return None
+    body = _qoe_snapshot["body"]
+    if body is None or time.monotonic() - _qoe_snapshot["updated"] > QOE_SNAPSHOT_MAX_AGE:
+        return None
+    return body
+
+
+# Per-upstream time budget (seconds) for the aggregated overview endpoint
+OVERVIEW_UPSTREAM_TIMEOUT = 5.0
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _header_quality(header: str, token: str, wildcard: Optional[str] = None) -> float:
+    """
+    q-value an Accept-style header gives ``token`` (0 when not listed).
+    
+    An explicit entry wins over ``wildcard``; ``q=0`` (or an unparseable q)
+    is a refusal.
+    """
+    wildcard_q = 0.0
+    for item in header.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        name = name.lower()
+        if name == token:
+            return quality
+        if wildcard is not None and name == wildcard:
+            wildcard_q = quality
+    return wildcard_q
+
+
+def _wants_ndjson(request: Request) -> bool:
+    """Check whether the client negotiated a streaming NDJSON response."""
+    return _header_quality(request.headers.get("accept", ""), NDJSON_MEDIA_TYPE) > 0
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether Accept-Encoding allows gzip (explicitly or via ``*``)."""
+    return _header_quality(request.headers.get("accept-encoding", ""), "gzip", wildcard="*") > 0
+
+
+async def _ndjson_lines(records: Iterable[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Serialize records one per line as they are consumed."""
+    for record in records:
+        yield orjson.dumps(record) + b"\n"
+
+
+async def _gzip_lines(lines: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a line stream, sync-flushing after each line so clients can render progressively."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for line in lines:
+        yield compressor.compress(line) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _dependency_headers(response: Response) -> Dict[str, str]:
+    """Collect headers set by route dependencies; FastAPI drops them for returned responses."""
+    return {k: v for k, v in response.headers.items() if k != "content-length"}
+
+
+def _ndjson_response(
+    request: Request,
+    response: Response,
+    records: Iterable[Dict[str, Any]]
+) -> StreamingResponse:
+    """Build a streaming NDJSON response, gzipped when the client accepts it."""
+    body = _ndjson_lines(records)
+    headers = _dependency_headers(response)
+    headers.update({"X-Accel-Buffering": "no", "Vary": "Accept, Accept-Encoding"})
+    if _accepts_gzip(request):
+        body = _gzip_lines(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+def _hotspot_records(hotspots: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Flatten a hotspot report into a summary line followed by one line per item."""
+    yield {
+        "type": "summary",
+        "timestamp": hotspots.get("timestamp"),
+        "geographic_pareto": hotspots.get("geographic_pareto", {}),
+        "device_pareto": hotspots.get("device_pareto", {})
+    }
+    for item in hotspots.get("geographic_hotspots", []):
+        yield {"type": "geographic_hotspot", **item}
+    for item in hotspots.get("device_hotspots", []):
+        yield {"type": "device_hotspot", **item}
+    for item in hotspots.get("recommendations", []):
+        yield {"type": "recommendation", **item}
+
+
+def _incident_records(incidents: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Flatten an incident summary into a summary line followed by one line per incident."""
+    yield {
+        "type": "summary",
+        "timestamp": incidents.get("timestamp"),
+        "total_incidents": incidents.get("total_incidents", 0),
+        "by_priority": incidents.get("by_priority", {})
+    }
+    for item in incidents.get("incidents", []):
+        yield {"type": "incident", **item}
+
+
+# Health check payload; integration flags are fixed for the process lifetime
+_HEALTH_PAYLOAD: Dict[str, Any] = {
+    "conviva": {
+        "status": "healthy" if settings.conviva_enabled else "disabled",
+        "mock_mode": settings.mock_mode
+    },
+    "newrelic": {
+        "status": "healthy" if settings.newrelic_enabled else "disabled",
+        "mock_mode": settings.mock_mode
+    }
+}
+
+# Health check timestamp cached at 1-second resolution: [epoch_second, iso_string]
+_ts_cache: List[Any] = [0, ""]
+
+
+def _health_timestamp() -> str:
+    """Return the current timestamp, reformatted at most once per second."""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _ts_cache[1]
+
+
+def cache_control(max_age: int, stale_while_revalidate: int = 0):
+    """Build a dependency that sets Cache-Control on the endpoint response."""
+    value = f"public, max-age={max_age}"
+    if stale_while_revalidate:
+        value += f", stale-while-revalidate={stale_while_revalidate}"
 
-# Initialize clients
-conviva = ConvivaClient(mock_mode=settings.mock_mode)
-newrelic = NewRelicClient(mock_mode=settings.mock_mode)
+    def _set_cache_control(response: Response) -> None:
+        response.headers["Cache-Control"] = value
+
+    return _set_cache_control
+
+
+# QoE and APM rollups change on minute boundaries; incidents need freshness
+set_cache_30s = cache_control(30, stale_while_revalidate=60)
+set_cache_5s = cache_control(5)
+
+# Operational health summary memoized for the same 30s window as its Cache-Control
+OPERATIONAL_HEALTH_TTL = 30.0
+_health_cache: Dict[str, Any] = {"etag": None, "body": None, "expires": 0.0}
 
 
 # Pydantic Models
@@ -33,8 +297,10 @@ class QoEMetrics(BaseModel):
     status: str = Field(..., description="Health status (good/warning/critical)")
     unit: str = Field(..., description="Unit of measurement")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "metric_name": "buffering_rate",
                 "value": 1.2,
@@ -43,6 +309,7 @@ class QoEMetrics(BaseModel):
                 "unit": "percentage"
             }
         }
+    )
 
 
 class ServiceHealth(BaseModel):
@@ -53,35 +320,111 @@ class ServiceHealth(BaseModel):
     error_rate: float = Field(..., description="Error rate percentage")
     throughput_rpm: float = Field(..., description="Throughput (requests/min)")
 
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
+
+def _json_response(body: bytes, response: Response) -> Response:
+    """Wrap pre-encoded JSON bytes, keeping headers set by route dependencies."""
+    return Response(content=body, media_type="application/json", headers=_dependency_headers(response))
+
+
+def _weak_etag(payload: Dict[str, Any]) -> str:
+    """Weak ETag over a payload, ignoring its generation timestamp."""
+    content = {k: v for k, v in payload.items() if k != "timestamp"}
+    digest = hashlib.blake2b(orjson.dumps(content, option=orjson.OPT_SORT_KEYS), digest_size=8)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison against the current ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+# QoE display metrics as parallel threshold tables (one column per metric)
+_QOE_METRIC_NAMES = ("buffering_rate", "video_start_failures", "average_bitrate")
+_QOE_UNITS = ("percentage", "count", "mbps")
+_QOE_THRESHOLDS = np.array([settings.conviva_buffering_threshold, 1000.0, 2.5])
+_QOE_HIGHER_IS_BETTER = np.array([False, False, True])
+# Status lookup indexed by [breached, metric]
+_QOE_STATUS_TABLE = np.array([
+    ["good", "good", "good"],
+    ["critical", "warning", "warning"]
+])
+
+
+def _derive_statuses(
+    values: np.ndarray,
+    thresholds: np.ndarray,
+    higher_is_better: np.ndarray,
+    status_table: np.ndarray
+) -> np.ndarray:
+    """Map metric values to statuses with a vectorized threshold compare."""
+    within = np.where(higher_is_better, values > thresholds, values < thresholds)
+    return status_table[(~within).astype(np.intp), np.arange(values.shape[0])]
+
+
+# Per-metric record templates; only value and status vary per request.
+# Key order matches the QoEMetrics schema.
+_QOE_TEMPLATES = tuple(
+    {"metric_name": name, "value": 0.0, "threshold": threshold, "status": "", "unit": unit}
+    for name, threshold, unit in zip(_QOE_METRIC_NAMES, _QOE_THRESHOLDS.tolist(), _QOE_UNITS)
+)
+
+
+def _build_qoe_metrics(metrics_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert raw Conviva QoE data into QoEMetrics-shaped records."""
+    # Safely get metrics with defaults
+    values = np.array([
+        metrics_data.get("buffering_rate", 0),
+        metrics_data.get("video_start_failures", 0),
+        metrics_data.get("average_bitrate_mbps", metrics_data.get("average_bitrate", 0))
+    ], dtype=float)
+    statuses = _derive_statuses(values, _QOE_THRESHOLDS, _QOE_HIGHER_IS_BETTER, _QOE_STATUS_TABLE)
+    
+    metrics = []
+    for template, value, status in zip(_QOE_TEMPLATES, values.tolist(), statuses.tolist()):
+        record = template.copy()
+        record["value"] = value
+        record["status"] = status
+        metrics.append(record)
+    return metrics
+
+
+def _build_service_health(services_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert NewRelic service breakdown rows into ServiceHealth-shaped records."""
+    # Key order matches the ServiceHealth schema
+    return [
+        {
+            "service_name": svc.get("service_name", svc.get("service", "unknown")),
+            "status": svc.get("health_status", "unknown"),
+            "response_time_ms": svc.get("response_time_avg", 0),
+            "error_rate": svc.get("error_rate", 0),
+            "throughput_rpm": svc.get("throughput", 0)
+        }
+        for svc in services_data
+    ]
+
 
 # API Endpoints
 
 @router.get(
     "/qoe/metrics",
-    response_model=List[QoEMetrics],
-    summary="Get QoE Metrics",
-    description="""
-    Retrieve streaming Quality of Experience (QoE) metrics from Conviva.
-    
-    **Metrics:**
-    - Buffering Rate: % of viewing time spent buffering
-    - Video Start Failures: Failed play attempts
-    - EBVS (Exits Before Video Start): Users who leave before playback
-    - Average Bitrate: Streaming quality indicator
-    
-    **Query Parameters:**
-    - `dimension`: Filter by dimension (device, cdn, geo, content)
-    - `content_id`: Filter by specific content
-    - `time_range`: Time range in hours (default: 24)
-    
-    **Use Case:** Performance monitoring, CDN optimization, user experience tracking.
-    """
+    dependencies=[Depends(set_cache_30s)],
+    response_model=None,
+    responses={200: {"model": List[QoEMetrics]}},
+    summary="Get QoE Metrics"
 )
 async def get_qoe_metrics(
+    response: Response,
     dimension: Optional[str] = Query(None, description="Filter dimension"),
     content_id: Optional[str] = Query(None, description="Content filter"),
     time_range: int = Query(24, ge=1, le=168, description="Time range (hours)")
-) -> List[QoEMetrics]:
+) -> Response:
     """Get streaming QoE metrics."""
     try:
         # Convert time_range from hours to string format
@@ -93,47 +436,20 @@ async def get_qoe_metrics(
             time_range_str = "last_7_days"
         else:
             time_range_str = "last_30_days"
+        
+        # Unfiltered dashboard polls are served from the background snapshot
+        if dimension is None and content_id is None and time_range_str == "last_24_hours":
+            snapshot = await _get_qoe_snapshot()
+            if snapshot is not None:
+                return _json_response(snapshot, response)
             
-        metrics_data = await asyncio.to_thread(
-            conviva.get_qoe_metrics,
+        metrics_data = await get_conviva().get_qoe_metrics_async(
             time_range_str,
             dimension,
             content_id
         )
         
-        # Convert to API model
-        metrics = []
-        
-        # Safely get metrics with defaults
-        buffering_rate = metrics_data.get("buffering_rate", 0)
-        video_start_failures = metrics_data.get("video_start_failures", 0)
-        average_bitrate = metrics_data.get("average_bitrate_mbps", metrics_data.get("average_bitrate", 0))
-        
-        metrics.append(QoEMetrics(
-            metric_name="buffering_rate",
-            value=buffering_rate,
-            threshold=settings.conviva_buffering_threshold,
-            status="good" if buffering_rate < settings.conviva_buffering_threshold else "critical",
-            unit="percentage"
-        ))
-        
-        metrics.append(QoEMetrics(
-            metric_name="video_start_failures",
-            value=video_start_failures,
-            threshold=1000,
-            status="good" if video_start_failures < 1000 else "warning",
-            unit="count"
-        ))
-        
-        metrics.append(QoEMetrics(
-            metric_name="average_bitrate",
-            value=average_bitrate,
-            threshold=2.5,
-            status="good" if average_bitrate > 2.5 else "warning",
-            unit="mbps"
-        ))
-        
-        return metrics
+        return _json_response(orjson.dumps(_build_qoe_metrics(metrics_data)), response)
         
     except Exception as e:
         logger.error("qoe_metrics_failed", error=str(e))
@@ -142,19 +458,11 @@ async def get_qoe_metrics(
 
 @router.get(
     "/qoe/buffering-hotspots",
-    summary="Get Buffering Hotspots",
-    description="""
-    Identify buffering issues by dimension (device, CDN, geography, content).
-    
-    **Returns:**
-    - Top problematic dimensions with high buffering
-    - Recommended actions for remediation
-    - Impact assessment (affected viewers)
-    
-    **Use Case:** Incident response, CDN optimization, device compatibility issues.
-    """
+    summary="Get Buffering Hotspots"
 )
 async def get_buffering_hotspots(
+    request: Request,
+    response: Response,
     time_range: int = Query(24, description="Time range (hours)")
 ) -> Dict[str, Any]:
     """Get buffering hotspots analysis."""
@@ -169,7 +477,10 @@ async def get_buffering_hotspots(
         else:
             time_range_str = "last_30_days"
             
-        return await asyncio.to_thread(conviva.get_buffering_hotspots, time_range_str)
+        hotspots = await get_conviva().get_buffering_hotspots_async(time_range_str)
+        if _wants_ndjson(request):
+            return _ndjson_response(request, response, _hotspot_records(hotspots))
+        return hotspots
     except Exception as e:
         logger.error("buffering_hotspots_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to analyze buffering: {str(e)}")
@@ -177,30 +488,15 @@ async def get_buffering_hotspots(
 
 @router.get(
     "/infrastructure/services",
-    response_model=List[ServiceHealth],
-    summary="Get Service Health",
-    description="""
-    Get health status of all backend services from NewRelic APM.
-    
-    **Services:**
-    - API Gateway
-    - Streaming Service
-    - Authentication Service
-    - Recommendation Engine
-    - CDN Edge Servers
-    
-    **Metrics per service:**
-    - Response time (ms)
-    - Error rate (%)
-    - Throughput (requests/min)
-    - Health status
-    
-    **Use Case:** Service monitoring, incident detection, capacity planning.
-    """
+    dependencies=[Depends(set_cache_30s)],
+    response_model=None,
+    responses={200: {"model": List[ServiceHealth]}},
+    summary="Get Service Health"
 )
 async def get_service_health(
+    response: Response,
     time_range: int = Query(1, ge=1, le=24, description="Time range (hours)")
-) -> List[ServiceHealth]:
+) -> Response:
     """Get infrastructure service health."""
     try:
         # Convert time_range from hours to string format
@@ -211,18 +507,10 @@ async def get_service_health(
         else:
             time_range_str = "last_7_days"
             
-        services_data = newrelic.get_service_breakdown(time_range=time_range_str)
+        services_data = await get_newrelic().get_service_breakdown_async(time_range=time_range_str)
         
-        return [
-            ServiceHealth(
-                service_name=svc.get("service_name", svc.get("service", "unknown")),
-                status=svc.get("health_status", "unknown"),
-                response_time_ms=svc.get("response_time_avg", 0),
-                error_rate=svc.get("error_rate", 0),
-                throughput_rpm=svc.get("throughput", 0)
-            )
-            for svc in services_data
-        ]
+        body = orjson.dumps(_build_service_health(services_data), option=orjson.OPT_SERIALIZE_NUMPY)
+        return _json_response(body, response)
         
     except Exception as e:
         logger.error("service_health_failed", error=str(e))
@@ -231,23 +519,15 @@ async def get_service_health(
 
 @router.get(
     "/infrastructure/incidents",
-    summary="Get Active Incidents",
-    description="""
-    Retrieve active and recent incidents from NewRelic.
-    
-    **Returns:**
-    - Open incidents with severity
-    - Incident duration
-    - Affected services
-    - Alert policy triggered
-    
-    **Use Case:** Incident management, on-call workflows, escalation.
-    """
+    dependencies=[Depends(set_cache_5s)],
+    summary="Get Active Incidents"
 )
-async def get_incidents() -> Dict[str, Any]:
+async def get_incidents(request: Request, response: Response) -> Dict[str, Any]:
     """Get active infrastructure incidents."""
     try:
-        result = newrelic.get_incidents()
+        result = await get_newrelic().get_incidents_async()
+        if _wants_ndjson(request):
+            return _ndjson_response(request, response, _incident_records(result))
         # get_incidents returns a dict, not a list
         return result
     except Exception as e:
@@ -257,43 +537,72 @@ async def get_incidents() -> Dict[str, Any]:
 
 @router.get(
     "/infrastructure/operational-health",
-    summary="Get Operational Health Summary",
-    description="""
-    Get comprehensive operational health score and executive summary.
-    
-    **Returns:**
-    - Overall health score (0-100)
-    - Status by category (APM, Infrastructure, QoE)
-    - Critical alerts count
-    - Recommendations for action
-    
-    **Use Case:** Executive dashboard, SLA reporting, health monitoring.
-    """
+    dependencies=[Depends(set_cache_30s)],
+    summary="Get Operational Health Summary"
 )
-async def get_operational_health() -> Dict[str, Any]:
+async def get_operational_health(request: Request, response: Response) -> Response:
     """Get operational health summary."""
     try:
-        return newrelic.get_operational_health_summary()
+        # The APM/infra/incident fan-out runs at most once per Cache-Control
+        # window; revalidations inside it are answered from the memoized ETag
+        if time.monotonic() >= _health_cache["expires"]:
+            summary = await get_newrelic().get_operational_health_summary_async()
+            _health_cache.update(
+                etag=_weak_etag(summary),
+                body=orjson.dumps(summary),
+                expires=time.monotonic() + OPERATIONAL_HEALTH_TTL,
+            )
+        
+        headers = _dependency_headers(response)
+        headers["ETag"] = _health_cache["etag"]
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=_health_cache["body"], media_type="application/json", headers=headers)
     except Exception as e:
         logger.error("operational_health_failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to calculate health: {str(e)}")
 
 
+@router.get(
+    "/overview",
+    dependencies=[Depends(set_cache_5s)],
+    summary="Get Streaming Operations Overview"
+)
+async def get_overview() -> Dict[str, Any]:
+    """Get QoE, service, incident, and health data in one response."""
+    sections = ("qoe_metrics", "services", "incidents", "operational_health")
+    results = await asyncio.gather(
+        asyncio.wait_for(get_conviva().get_qoe_metrics_async("last_24_hours"), OVERVIEW_UPSTREAM_TIMEOUT),
+        asyncio.wait_for(get_newrelic().get_service_breakdown_async("last_1_hour"), OVERVIEW_UPSTREAM_TIMEOUT),
+        asyncio.wait_for(get_newrelic().get_incidents_async(), OVERVIEW_UPSTREAM_TIMEOUT),
+        asyncio.wait_for(get_newrelic().get_operational_health_summary_async(), OVERVIEW_UPSTREAM_TIMEOUT),
+        return_exceptions=True
+    )
+    
+    overview: Dict[str, Any] = {"timestamp": _health_timestamp(), "errors": {}}
+    for section, result in zip(sections, results):
+        if isinstance(result, BaseException):
+            # Serve the sections that did arrive; a slow upstream must not block the dashboard
+            error = "timed out" if isinstance(result, asyncio.TimeoutError) else str(result)
+            logger.warning("overview_section_failed", section=section, error=error)
+            overview[section] = None
+            overview["errors"][section] = error
+        elif section == "qoe_metrics":
+            overview[section] = _build_qoe_metrics(result)
+        elif section == "services":
+            overview[section] = _build_service_health(result)
+        else:
+            overview[section] = result
+    
+    return overview
+
+
 @router.get(
     "/health",
     summary="Streaming APIs Health Check"
 )
 async def streaming_health_check():
     """Check Conviva and NewRelic integration health."""
-    return {
-        "conviva": {
-            "status": "healthy" if settings.conviva_enabled else "disabled",
-            "mock_mode": settings.mock_mode
-        },
-        "newrelic": {
-            "status": "healthy" if settings.newrelic_enabled else "disabled",
-            "mock_mode": settings.mock_mode
-        },
-        "timestamp": datetime.now().isoformat()
-    }
+    return {**_HEALTH_PAYLOAD, "timestamp": _health_timestamp()}
 
@@ -13,16 +13,25 @@ Provides unified interfaces to:
 
 Atlassian Integration:
 Uses mcp-atlassian (https://github.com/sooperset/mcp-atlassian) for JIRA/Confluence.
+
+Integrations are imported lazily on first attribute access (PEP 562), so
+importing a single connector does not pull in every client and its SDKs.
 """
 
-from .jira_connector import JiraConnector
-from .email_parser import EmailParser
-from .analytics_client import AnalyticsClient
-from .content_api import ContentAPIClient
-from .conviva_client import ConvivaClient
-from .newrelic_client import NewRelicClient
-from .figma_client import FigmaClient
-from .atlassian_client import AtlassianClient
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "JiraConnector": ".jira_connector",
+    "EmailParser": ".email_parser",
+    "AnalyticsClient": ".analytics_client",
+    "ContentAPIClient": ".content_api",
+    "ConvivaClient": ".conviva_client",
+    "NewRelicClient": ".newrelic_client",
+    "FigmaClient": ".figma_client",
+    "AtlassianClient": ".atlassian_client",
+}
 
 __all__ = [
     # Core integrations
@@ -41,3 +50,17 @@ __all__ = [
     # Design integrations
     "FigmaClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an integration class on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
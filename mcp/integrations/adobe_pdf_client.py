@@ -2,12 +2,605 @@
 
 import os
 import json
-from typing import Optional, Dict, Any
+import time
+import asyncio
+import textwrap
+import threading
+from io import BytesIO, StringIO
+from html.parser import HTMLParser
+from typing import Optional, Dict, Any, Iterable, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 import structlog
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from jinja2 import Environment
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    def _parse_iso_datetime(value: str) -> datetime:
+        # fromisoformat only accepts a trailing 'Z' from Python 3.11
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+try:
+    from reportlab.lib.pagesizes import letter as _LETTER
+    from reportlab.pdfgen.canvas import Canvas as _Canvas
+except ImportError:
+    _Canvas = None
 
 logger = structlog.get_logger(__name__)
 
+# PDF Services REST API, used when the Adobe SDK is not installed
+PDF_SERVICES_ENDPOINT = "https://pdf-services.adobe.io"
+# Refresh cached access tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 300
+REQUEST_TIMEOUT = 30
+JOB_POLL_INTERVAL = 1.0
+JOB_POLL_ATTEMPTS = 60
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Invariant objects for the hand-built fallback PDFs; only the content stream
+# (object 4) changes between reports.
+_PDF_CATALOG = b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+_PDF_PAGES = b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+_PDF_PAGE_1FONT = b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>\nendobj\n"
+_PDF_PAGE_2FONT = b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R /F2 6 0 R >> >> >>\nendobj\n"
+_PDF_FONT_HELVETICA = b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
+_PDF_FONT_HELVETICA_BOLD = b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>\nendobj\n"
+_PDF_FONT_HELVETICA_F2 = b"6 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
+
+# Characters that must be backslash-escaped inside PDF string literals
+_PDF_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '(': '\\(', ')': '\\)'})
+
+
+@lru_cache(maxsize=4096)
+def _pdf_escape(line: str, width: int = 75) -> str:
+    """Escape a line for a PDF string literal and truncate it to width characters."""
+    return line.translate(_PDF_ESCAPE_TABLE)[:width]
+
+
+def _is_number(value: Any) -> bool:
+    """True for int/float report values (bools excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _numbered_lines(items: list, width: int = 70) -> list:
+    """Number items as '  1. ...' and wrap each to width, indenting continuations."""
+    lines = []
+    for idx, item in enumerate(items, 1):
+        lines.extend(textwrap.wrap(
+            str(item), width=width, initial_indent=f"  {idx}. ", subsequent_indent="     "
+        ) or [f"  {idx}."])
+    return lines
+
+
+def _write_text_pdf(output_path: str, content_bytes: bytes, page: bytes, fonts: Tuple[bytes, ...]) -> int:
+    """
+    Stream a single-page PDF straight to output_path, tracking xref offsets
+    from the byte counts returned by each write.
+
+    Returns:
+        Size of the written file in bytes
+    """
+    contents = b"4 0 obj\n<< /Length " + str(len(content_bytes)).encode() + b" >>\nstream\n" + content_bytes + b"\nendstream\nendobj\n"
+    objects = (_PDF_CATALOG, _PDF_PAGES, page, contents) + fonts
+    
+    with open(output_path, "wb", buffering=1 << 16) as f:
+        offset = f.write(b"%PDF-1.4\n")
+        positions = []
+        for obj in objects:
+            positions.append(offset)
+            offset += f.write(obj)
+        
+        # Cross-reference table
+        xref = [f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"]
+        xref.extend(f"{p:010d} 00000 n \n" for p in positions)
+        
+        # Trailer
+        xref.append(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{offset}\n%%EOF\n")
+        return offset + f.write("".join(xref).encode("ascii"))
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect text content from HTML, skipping <style> blocks."""
+    
+    def __init__(self):
+        super().__init__()
+        self.text = StringIO()
+        self.in_style = False
+        
+    def handle_starttag(self, tag, attrs):
+        if tag == 'style':
+            self.in_style = True
+        elif tag == 'br':
+            self.text.write('\n')
+        elif tag in ['h1', 'h2', 'h3', 'p', 'div']:
+            self.text.write('\n')
+            
+    def handle_endtag(self, tag):
+        if tag == 'style':
+            self.in_style = False
+        elif tag in ['h1', 'h2', 'h3', 'p', 'li']:
+            self.text.write('\n')
+            
+    def handle_data(self, data):
+        if not self.in_style:
+            self.text.write(data.strip() + ' ')
+            
+    def get_text(self):
+        return self.text.getvalue()
+
+
+def _html_to_text(html_content: str) -> str:
+    """
+    Extract readable text from report HTML for the text-only PDF fallback.
+
+    Plain text (no markup) is returned as-is. Otherwise uses selectolax's C
+    tokenizer when installed, falling back to the stdlib ``html.parser``.
+    """
+    if '<' not in html_content:
+        return html_content
+    
+    if _SelectolaxParser is not None:
+        tree = _SelectolaxParser(html_content)
+        for node in tree.css("style, script"):
+            node.decompose()
+        root = tree.body or tree.root
+        return root.text(separator="\n") if root is not None else ""
+    
+    parser = _HTMLTextExtractor()
+    parser.feed(html_content)
+    return parser.get_text()
+
+
+
+# Footer timestamp formats for the HTML and text executive summaries
+_TS_FMT_HTML = '%B %d, %Y • %I:%M %p'
+_TS_FMT_TEXT = '%B %d, %Y at %I:%M %p'
+
+
+@lru_cache(maxsize=256)
+def _format_report_timestamp(timestamp: Union[str, datetime]) -> Tuple[str, str]:
+    """
+    Parse an ISO timestamp once and format it for both report footers.
+    A datetime passed by the caller is formatted without a round trip
+    through ISO text.
+
+    Returns:
+        (HTML footer text, plain-text footer text)
+    """
+    parsed = timestamp if isinstance(timestamp, datetime) else _parse_iso_datetime(timestamp)
+    return parsed.strftime(_TS_FMT_HTML), parsed.strftime(_TS_FMT_TEXT)
+
+
+@lru_cache(maxsize=1)
+def _load_weasyprint():
+    """
+    Import WeasyPrint once and build a FontConfiguration shared by every render.
+
+    Returns:
+        (HTML, FontConfiguration) tuple, or None if WeasyPrint is unavailable
+    """
+    try:
+        from weasyprint import HTML
+        from weasyprint.text.fonts import FontConfiguration
+    except (ImportError, OSError):
+        # OSError: WeasyPrint installed but its system libraries (Pango) are missing
+        return None
+    return HTML, FontConfiguration()
+
+
+# Report templates are compiled once at import; each report call only renders.
+_CSS_RESET = "* { margin: 0; padding: 0; box-sizing: border-box; }\n"
+
+_CHURN_CSS = """\
+body { 
+    font-family: 'Segoe UI', Arial, sans-serif; 
+    margin: 40px; 
+    color: #1A1A1A;
+    line-height: 1.6;
+}
+h1 { 
+    color: #0066FF; 
+    border-bottom: 4px solid #0066FF;
+    padding-bottom: 10px;
+    margin-bottom: 30px;
+}
+h2 {
+    color: #003399;
+    margin-top: 30px;
+    margin-bottom: 15px;
+}
+.header {
+    text-align: center;
+    margin-bottom: 40px;
+}
+.metric { 
+    background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
+    padding: 25px; 
+    margin: 15px 0;
+    border-radius: 8px;
+    border-left: 5px solid #0066FF;
+}
+.highlight { 
+    color: #FF6B00; 
+    font-weight: bold; 
+    font-size: 1.3em;
+}
+.critical {
+    color: #F44336;
+    font-weight: bold;
+}
+ul {
+    margin-left: 20px;
+    margin-top: 10px;
+}
+li {
+    margin: 8px 0;
+    padding-left: 5px;
+}
+.footer {
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 1px solid #ddd;
+    font-size: 0.9em;
+    color: #757575;
+}
+.status-badge {
+    display: inline-block;
+    padding: 5px 12px;
+    background: #00C853;
+    color: white;
+    border-radius: 4px;
+    font-size: 0.9em;
+    margin-top: 10px;
+}
+"""
+
+_CHURN_BODY = """\
+    <div class="header">
+        <h1>🎬 Paramount+ Churn Analysis Report</h1>
+        <p><strong>AI-Powered Subscriber Retention Intelligence</strong></p>
+    </div>
+
+    <div class="metric">
+        <h2>📊 At-Risk Subscribers</h2>
+        <p class="critical" style="font-size: 2em; margin: 10px 0;">{{ at_risk }}</p>
+        <p>Revenue at Risk: <span class="highlight">{{ revenue_risk }}</span></p>
+        <div class="status-badge">High Priority</div>
+    </div>
+
+    <div class="metric">
+        <h2>🎯 Top Pareto Cohorts</h2>
+        <p style="color: #757575; margin-bottom: 10px;">
+            <em>Top 20% of cohorts driving 80% of churn impact</em>
+        </p>
+        <ul>
+            {% for cohort in cohorts %}
+            <li><strong>{{ cohort }}</strong></li>
+            {% endfor %}
+        </ul>
+    </div>
+
+    <div class="metric">
+        <h2>🤖 AI-Generated Recommendations</h2>
+        <p style="background: white; padding: 15px; border-radius: 4px; margin-top: 10px;">
+            {{ recommendations }}
+        </p>
+    </div>
+
+    <div class="metric">
+        <h2>💡 Predictive Insights</h2>
+        <ul>
+            <li><strong>Churn Prediction Accuracy:</strong> 87%</li>
+            <li><strong>Forecast Horizon:</strong> 30 days</li>
+            <li><strong>Detection Method:</strong> AI anomaly detection + Pareto analysis</li>
+            <li><strong>Recommended Action Timeline:</strong> Immediate (within 7 days)</li>
+        </ul>
+    </div>
+
+    <div class="footer">
+        <p><strong>Report Generated:</strong> {{ timestamp }}</p>
+        <p><strong>Source:</strong> Paramount+ AI Operations Platform</p>
+        <p><strong>Powered by:</strong> Adobe PDF Services API</p>
+    </div>
+"""
+
+_INCIDENT_CSS = """\
+body { 
+    font-family: 'Segoe UI', Arial, sans-serif; 
+    margin: 40px; 
+    color: #1A1A1A;
+}
+h1 { color: #0066FF; border-bottom: 4px solid #0066FF; padding-bottom: 10px; }
+h2 { color: #003399; margin-top: 25px; margin-bottom: 15px; }
+.critical { color: #F44336; font-weight: bold; font-size: 1.5em; }
+table { 
+    border-collapse: collapse; 
+    width: 100%; 
+    margin: 20px 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+th, td { 
+    border: 1px solid #ddd; 
+    padding: 12px; 
+    text-align: left; 
+}
+th { 
+    background-color: #0066FF; 
+    color: white; 
+    font-weight: 600;
+}
+tr:nth-child(even) { background-color: #f5f5f5; }
+tr:hover { background-color: #e8f4ff; }
+.status-open { color: #F44336; font-weight: bold; }
+.status-in-progress { color: #FFB300; font-weight: bold; }
+.status-resolved { color: #00C853; font-weight: bold; }
+.root-cause {
+    background: #FFF9E6;
+    border-left: 5px solid #FFB300;
+    padding: 20px;
+    margin: 20px 0;
+    border-radius: 4px;
+}
+"""
+
+_INCIDENT_BODY = """\
+    <h1>🚨 Production Incident Report</h1>
+    <p style="margin: 20px 0;">
+        <strong>Total Incidents:</strong> 
+        <span class="critical">{{ total }}</span>
+    </p>
+
+    <h2>🎯 Critical Issues (Pareto 20%)</h2>
+    <p style="color: #757575; margin-bottom: 10px;">
+        <em>Top 20% of issues causing 80% of operational impact</em>
+    </p>
+    <table>
+        <tr>
+            <th style="width: 50%;">Issue</th>
+            <th style="width: 25%;">Impact</th>
+            <th style="width: 25%;">Status</th>
+        </tr>
+        {% for issue in critical_issues %}
+        {% set status = issue.get('status', 'N/A') %}
+        <tr>
+            <td>{{ issue.get('title', 'N/A') }}</td>
+            <td>{{ issue.get('impact', 'N/A') }}</td>
+            <td><span class="status-{{ status|lower|replace(' ', '-') }}">{{ status }}</span></td>
+        </tr>
+        {% else %}
+        <tr><td colspan="3">No critical issues found</td></tr>
+        {% endfor %}
+    </table>
+
+    <h2>🔍 Root Cause Analysis</h2>
+    <div class="root-cause">
+        <p>{{ root_cause }}</p>
+    </div>
+
+    <div style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #757575;">
+        <p><strong>Generated:</strong> {{ timestamp }}</p>
+        <p><strong>Platform:</strong> Paramount+ AI Operations Platform</p>
+    </div>
+"""
+
+_EXECUTIVE_CSS = """\
+body { 
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; 
+    background: #0A0E1A;
+    color: #E2E8F0;
+    padding: 30px;
+    line-height: 1.6;
+}
+.header {
+    text-align: center;
+    margin-bottom: 30px;
+    padding: 20px;
+    background: linear-gradient(135deg, #1E293B 0%, #0F172A 100%);
+    border-radius: 12px;
+    border: 1px solid #334155;
+}
+h1 { 
+    color: #0064FF; 
+    font-size: 32px; 
+    margin-bottom: 8px;
+    font-weight: 700;
+    letter-spacing: -0.5px;
+}
+.subtitle { 
+    color: #94A3B8; 
+    font-size: 14px;
+}
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 12px;
+    margin: 25px 0;
+}
+.metric-card {
+    background: linear-gradient(135deg, #0064FF 0%, #0052CC 100%);
+    padding: 18px;
+    border-radius: 8px;
+    text-align: center;
+    box-shadow: 0 4px 6px rgba(0, 100, 255, 0.2);
+}
+.metric-label {
+    font-size: 10px;
+    color: rgba(255, 255, 255, 0.8);
+    text-transform: uppercase;
+    letter-spacing: 1.5px;
+    font-weight: 600;
+    margin-bottom: 8px;
+}
+.metric-value {
+    font-size: 32px;
+    font-weight: 700;
+    color: #FFFFFF;
+    margin: 8px 0;
+}
+.section {
+    margin: 20px 0;
+    padding: 20px;
+    background: #1E293B;
+    border-radius: 8px;
+    border-left: 4px solid #0064FF;
+    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+}
+.section h2 {
+    color: #60A5FA;
+    margin-bottom: 15px;
+    font-size: 18px;
+    font-weight: 600;
+}
+ul, ol { 
+    margin-left: 20px;
+    color: #CBD5E1;
+}
+li { 
+    margin: 10px 0; 
+    font-size: 13px;
+    line-height: 1.6;
+}
+.footer {
+    margin-top: 30px;
+    padding-top: 20px;
+    border-top: 1px solid #334155;
+    color: #64748B;
+    text-align: center;
+    font-size: 11px;
+}
+.timestamp { 
+    color: #0064FF; 
+    font-weight: 600;
+}
+.badge {
+    display: inline-block;
+    background: rgba(0, 100, 255, 0.2);
+    color: #60A5FA;
+    padding: 4px 12px;
+    border-radius: 4px;
+    font-size: 11px;
+    font-weight: 600;
+    margin: 10px 0;
+}
+"""
+
+_EXECUTIVE_BODY = """\
+    <div class="header">
+        <h1>🎬 Paramount+ AI Operations</h1>
+        <div class="subtitle">Executive Dashboard Summary Report</div>
+        {% if figma_sync %}
+        <div class="badge">🎨 LIVE FIGMA SYNC</div>
+        {% endif %}
+    </div>
+
+    {% if figma_image_url is string and figma_image_url.startswith(('https://', 'http://')) %}
+    <div style="margin: 20px 0; page-break-inside: avoid;">
+        <div style="background: #0A0E1A; padding: 20px; border-radius: 8px; box-shadow: 0 4px 12px rgba(0,0,0,0.2);">
+            <h3 style="color: #0066FF; text-align: center; margin-bottom: 15px; font-size: 18px;">
+                📊 Live Dashboard Snapshot
+            </h3>
+            <img src="{{ figma_image_url }}" 
+                 style="width: 100%; height: auto; border-radius: 4px; display: block;"
+                 alt="Figma Dashboard Design" />
+            <p style="color: #999; font-size: 11px; text-align: center; margin-top: 10px;">
+                ✨ Synced from Figma Design System • Real-time Design Integration
+            </p>
+        </div>
+    </div>
+    {% endif %}
+
+    <div class="metrics-grid">
+        {% for label, value in metrics.items() %}
+        <div class="metric-card">
+            <div class="metric-label">{{ label }}</div>
+            <div class="metric-value">{{ value }}</div>
+        </div>
+        {% endfor %}
+    </div>
+
+    <div class="section">
+        <h2>🤖 Production Issues</h2>
+        <ul>
+            {% for insight in insights %}
+            <li>{{ insight }}</li>
+            {% endfor %}
+        </ul>
+    </div>
+
+    {% if top_incident %}
+    <div class="section" style="border-left-color: #EF4444;">
+        <h2>🚨 Top Priority Incident</h2>
+        <table style="width:100%; border-collapse:collapse; margin-top:10px;">
+            <tr><td style="color:#94A3B8; padding:6px 0; width:180px;">Incident ID</td>
+                <td style="color:#F1F5F9; font-weight:600;">{{ top_incident.get('id', 'N/A') }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Summary</td>
+                <td style="color:#F1F5F9;">{{ top_incident.get('summary', 'N/A') }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Priority Score</td>
+                <td style="color:#FBBF24; font-weight:700; font-size:18px;">{{ top_incident.get('priority_score', 'N/A') }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Recommended Action</td>
+                <td style="color:#60A5FA; font-weight:600;">{{ top_incident.get('top_action', 'Review required') }}</td></tr>
+        </table>
+    </div>
+    {% endif %}
+    {% if governance and governance.get('total_reviews') %}
+    <div class="section" style="border-left-color: #A855F7;">
+        <h2>🛡️ Governance &amp; Approvals</h2>
+        <table style="width:100%; border-collapse:collapse; margin-top:10px;">
+            <tr><td style="color:#94A3B8; padding:6px 0; width:180px;">Total Reviews</td>
+                <td style="color:#F1F5F9; font-weight:600;">{{ governance.get('total_reviews', 0) }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Awaiting Review</td>
+                <td style="color:#FBBF24; font-weight:600;">{{ governance.get('awaiting_review', 0) }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Approved</td>
+                <td style="color:#34D399; font-weight:600;">{{ governance.get('approved', 0) }}</td></tr>
+            <tr><td style="color:#94A3B8; padding:6px 0;">Rejected</td>
+                <td style="color:#EF4444; font-weight:600;">{{ governance.get('rejected', 0) }}</td></tr>
+        </table>
+    </div>
+    {% endif %}
+
+    <div class="section">
+        <h2>⚡ Recommendations &amp; Next Actions</h2>
+        <ol>
+            {% for rec in recommendations %}
+            <li>{{ rec }}</li>
+            {% endfor %}
+        </ol>
+    </div>
+
+    <div class="footer">
+        <p><strong>Generated:</strong> <span class="timestamp">{{ generated_at }}</span></p>
+        <p>Paramount+ AI Operations Platform • MCP Server • {{ '🎨 Figma Live Sync' if figma_sync else 'Standard Mode' }}</p>
+    </div>
+"""
+
+
+
+def _report_page(css: str, body: str) -> str:
+    """Wrap report CSS and body markup in the shared HTML document shell."""
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n    <meta charset="UTF-8">\n'
+        f"    <style>\n{_CSS_RESET}{css}    </style>\n</head>\n<body>\n{body}</body>\n</html>"
+    )
+
+
+_report_env = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_CHURN_REPORT_TMPL = _report_env.from_string(_report_page(_CHURN_CSS, _CHURN_BODY))
+_INCIDENT_REPORT_TMPL = _report_env.from_string(_report_page(_INCIDENT_CSS, _INCIDENT_BODY))
+_EXECUTIVE_SUMMARY_TMPL = _report_env.from_string(_report_page(_EXECUTIVE_CSS, _EXECUTIVE_BODY))
+
 
 class AdobePDFClient:
     """
@@ -22,7 +615,8 @@ class AdobePDFClient:
         client_id: str,
         client_secret: str,
         organization_id: str,
-        enabled: bool = True
+        enabled: bool = True,
+        max_concurrency: int = 4
     ):
         """
         Initialize Adobe PDF client.
@@ -32,20 +626,50 @@ class AdobePDFClient:
             client_secret: Adobe API client secret
             organization_id: Adobe organization ID
             enabled: Whether Adobe integration is enabled
+            max_concurrency: Maximum reports generated at once by the async API
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.organization_id = organization_id
         self.enabled = enabled
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._use_sdk = False
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
         
         if not enabled:
             logger.warning("adobe_pdf_disabled")
             return
         
+        # Pooled keep-alive session shared by every REST call from this client.
+        # Only idempotent requests are retried: a 5xx on the /assets or job
+        # POST may follow work the server already started (and bills).
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET", "PUT"}),
+                respect_retry_after_header=True,
+            ),
+        ))
+        
         try:
             # Try to import Adobe SDK
             from adobe.pdfservices.operation.auth.credentials import Credentials
             from adobe.pdfservices.operation.execution_context import ExecutionContext
+            from adobe.pdfservices.operation.io.file_ref import FileRef
+            from adobe.pdfservices.operation.pdfops.create_pdf_operation import CreatePDFOperation
+            
+            # Keep the operation classes so generate_html_report skips the imports
+            self._FileRef = FileRef
+            self._CreatePDFOperation = CreatePDFOperation
             
             self.credentials = Credentials.service_account_credentials_builder() \
                 .with_client_id(client_id) \
@@ -54,28 +678,29 @@ class AdobePDFClient:
                 .build()
             
             self.execution_context = ExecutionContext.create(self.credentials)
+            self._use_sdk = True
             logger.info("adobe_pdf_initialized", org_id=organization_id)
             
         except ImportError:
-            logger.warning(
+            logger.info(
                 "adobe_sdk_not_installed",
-                message="Install with: pip install adobe-pdfservices-sdk"
+                message="Using PDF Services REST API; install adobe-pdfservices-sdk to use the SDK"
             )
-            self.enabled = False
         except Exception as e:
             logger.error("adobe_pdf_init_failed", error=str(e))
             self.enabled = False
     
     def generate_html_report(
         self,
-        html_content: str,
+        html_content: Union[str, Iterable[str]],
         output_path: str = "operations_report.pdf"
     ) -> str:
         """
         Generate PDF report from HTML content.
         
         Args:
-            html_content: HTML string with report data
+            html_content: HTML string with report data, or an iterable of HTML
+                chunks (e.g. a streaming template render)
             output_path: Where to save the PDF
             
         Returns:
@@ -83,143 +708,148 @@ class AdobePDFClient:
         """
         if not self.enabled:
             logger.warning("adobe_pdf_not_enabled", message="Creating simplified PDF from HTML")
+            if not isinstance(html_content, str):
+                html_content = "".join(html_content)
             # In mock mode, create a simplified text-based PDF from the HTML content
-            from html.parser import HTMLParser
-            from io import StringIO
-            
-            class HTMLTextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text = StringIO()
-                    self.in_style = False
-                    
-                def handle_starttag(self, tag, attrs):
-                    if tag == 'style':
-                        self.in_style = True
-                    elif tag == 'br':
-                        self.text.write('\n')
-                    elif tag in ['h1', 'h2', 'h3', 'p', 'div']:
-                        self.text.write('\n')
-                        
-                def handle_endtag(self, tag):
-                    if tag == 'style':
-                        self.in_style = False
-                    elif tag in ['h1', 'h2', 'h3', 'p', 'li']:
-                        self.text.write('\n')
-                        
-                def handle_data(self, data):
-                    if not self.in_style:
-                        self.text.write(data.strip() + ' ')
-                        
-                def get_text(self):
-                    return self.text.getvalue()
-            
-            parser = HTMLTextExtractor()
-            parser.feed(html_content)
-            text_content = parser.get_text()
+            text_content = _html_to_text(html_content)
             
             # Generate a text-based PDF
-            from io import BytesIO
-            pdf_content = BytesIO()
-            
-            # PDF Header
-            pdf_content.write(b"%PDF-1.4\n")
-            
-            # Create content stream with wrapped text
-            lines = []
-            for line in text_content.split('\n'):
-                line = line.strip()
-                if line:
-                    # Escape special PDF characters
-                    line = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
-                    # Limit line length
-                    if len(line) > 80:
-                        words = line.split()
-                        current_line = ""
-                        for word in words:
-                            if len(current_line) + len(word) < 75:
-                                current_line += word + " "
-                            else:
-                                if current_line:
-                                    lines.append(current_line.strip())
-                                current_line = word + " "
-                        if current_line:
-                            lines.append(current_line.strip())
-                    else:
-                        lines.append(line)
+            # Create content stream with wrapped text: escape special PDF
+            # characters and wrap to the 70 characters drawn per line, lazily,
+            # so text past the first page is never escaped or wrapped
+            lines = (
+                wrapped
+                for raw in text_content.split('\n')
+                if (stripped := raw.strip())
+                for wrapped in textwrap.wrap(stripped.translate(_PDF_ESCAPE_TABLE), width=70)
+            )
             
             # Build text commands with proper absolute positioning
             y_pos = 750
-            text_commands = "BT\n/F1 10 Tf\n"
-            for line in lines[:45]:  # Limit to first 45 lines to fit on page
+            parts = ["BT\n/F1 10 Tf\n"]
+            for line in islice(lines, 45):  # Limit to first 45 lines to fit on page
                 # Use absolute positioning matrix: [scale_x skew_x skew_y scale_y x y]
-                text_commands += f"1 0 0 1 50 {y_pos} Tm\n({line[:70]}) Tj\n"
+                parts.append(f"1 0 0 1 50 {y_pos} Tm\n({line[:70]}) Tj\n")
                 y_pos -= 16
                 if y_pos < 50:
                     break
-            text_commands += "ET\n"
+            parts.append("ET\n")
+            text_commands = "".join(parts)
             
             content_bytes = text_commands.encode('latin-1', errors='replace')
             
-            # Objects
-            catalog = b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
-            pages = b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
-            page = b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>\nendobj\n"
-            contents = b"4 0 obj\n<< /Length " + str(len(content_bytes)).encode() + b" >>\nstream\n" + content_bytes + b"\nendstream\nendobj\n"
-            font = b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
-            
-            # Write all objects and track positions
-            positions = {}
-            current_pos = len(b"%PDF-1.4\n")
-            
-            for idx, obj in enumerate([catalog, pages, page, contents, font], start=1):
-                positions[idx] = current_pos
-                pdf_content.write(obj)
-                current_pos += len(obj)
-            
-            # Cross-reference table
-            xref_start = current_pos
-            xref = b"xref\n0 6\n"
-            xref += b"0000000000 65535 f \n"
-            for i in range(1, 6):
-                xref += f"{positions[i]:010d} 00000 n \n".encode()
-            
-            pdf_content.write(xref)
-            
-            # Trailer
-            trailer = b"trailer\n<< /Size 6 /Root 1 0 R >>\nstartxref\n" + str(xref_start).encode() + b"\n%%EOF\n"
-            pdf_content.write(trailer)
-            
-            # Write to file
-            with open(output_path, "wb") as f:
-                f.write(pdf_content.getvalue())
-                
+            _write_text_pdf(output_path, content_bytes, _PDF_PAGE_1FONT, (_PDF_FONT_HELVETICA,))
             return output_path
         
+        # Encode once; both the REST upload and the SDK stream use these bytes.
+        # Streamed chunks are encoded as they arrive, never joined into one str.
+        if isinstance(html_content, str):
+            html_bytes = html_content.encode("utf-8")
+        else:
+            html_bytes = b"".join(chunk.encode("utf-8") for chunk in html_content)
+        
+        if not self._use_sdk:
+            return self._generate_via_rest(html_bytes, output_path)
+        
         try:
-            from adobe.pdfservices.operation.io.file_ref import FileRef
-            from adobe.pdfservices.operation.pdfops.create_pdf_operation import CreatePDFOperation
-            
-            # Create temp HTML file
-            temp_html = f"temp_report_{datetime.now().timestamp()}.html"
-            with open(temp_html, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            FileRef = self._FileRef
+            CreatePDFOperation = self._CreatePDFOperation
             
             # Create operation
             create_pdf_operation = CreatePDFOperation.create_new()
             
-            # Set input
-            source = FileRef.create_from_local_file(temp_html)
+            # Set input straight from memory, no temp HTML file on disk
+            source = FileRef.create_from_stream(BytesIO(html_bytes), "text/html")
             create_pdf_operation.set_input(source)
             
             # Execute
             result: FileRef = create_pdf_operation.execute(self.execution_context)
             result.save_as(output_path)
             
-            # Cleanup
-            os.remove(temp_html)
+            logger.info("pdf_generated", output_path=output_path, html_bytes=len(html_bytes))
+            return output_path
+            
+        except Exception as e:
+            logger.error("pdf_generation_failed", error=str(e))
+            raise
+    
+    def _get_access_token(self) -> str:
+        """
+        Return a PDF Services access token, reusing the cached one until it
+        is within TOKEN_REFRESH_MARGIN seconds of expiry.
+        """
+        with self._token_lock:
+            if self._access_token and time.time() < self._token_expires_at:
+                return self._access_token
+            
+            response = self._http.post(
+                f"{PDF_SERVICES_ENDPOINT}/token",
+                data={"client_id": self.client_id, "client_secret": self.client_secret},
+                timeout=REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            token = response.json()
+            
+            self._access_token = token["access_token"]
+            self._token_expires_at = time.time() + int(token.get("expires_in", 86400)) - TOKEN_REFRESH_MARGIN
+            logger.info("adobe_token_refreshed", expires_in=token.get("expires_in"))
+            return self._access_token
+    
+    def _generate_via_rest(self, html_bytes: bytes, output_path: str) -> str:
+        """Convert UTF-8 encoded HTML to PDF through the PDF Services REST API."""
+        try:
+            headers = {
+                "Authorization": f"Bearer {self._get_access_token()}",
+                "x-api-key": self.client_id,
+            }
+            
+            # Upload the HTML as an asset
+            response = self._http.post(
+                f"{PDF_SERVICES_ENDPOINT}/assets",
+                json={"mediaType": "text/html"},
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            asset = response.json()
+            
+            self._http.put(
+                asset["uploadUri"],
+                data=html_bytes,
+                headers={"Content-Type": "text/html"},
+                timeout=REQUEST_TIMEOUT
+            ).raise_for_status()
             
-            logger.info("pdf_generated", output_path=output_path)
+            # Submit the conversion job and poll until it finishes
+            response = self._http.post(
+                f"{PDF_SERVICES_ENDPOINT}/operation/htmltopdf",
+                json={"assetID": asset["assetID"], "json": "{}", "includeHeaderFooter": False},
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            job_url = response.headers["location"]
+            
+            for _ in range(JOB_POLL_ATTEMPTS):
+                job = self._http.get(job_url, headers=headers, timeout=REQUEST_TIMEOUT)
+                job.raise_for_status()
+                job = job.json()
+                if job.get("status") == "done":
+                    break
+                if job.get("status") == "failed":
+                    raise RuntimeError(f"PDF Services job failed: {job.get('error')}")
+                time.sleep(JOB_POLL_INTERVAL)
+            else:
+                raise TimeoutError("PDF Services job did not finish in time")
+            
+            # Stream the PDF to disk in binary chunks rather than buffering it whole
+            with self._http.get(job["asset"]["downloadUri"], timeout=REQUEST_TIMEOUT, stream=True) as pdf:
+                pdf.raise_for_status()
+                with open(output_path, "wb") as f:
+                    for chunk in pdf.iter_content(chunk_size=1 << 16):
+                        f.write(chunk)
+            
+            logger.info("pdf_generated", output_path=output_path, html_bytes=len(html_bytes), via="rest")
             return output_path
             
         except Exception as e:
@@ -240,128 +870,18 @@ class AdobePDFClient:
         revenue_risk = churn_data.get('revenue_at_risk', 0)
         cohorts = churn_data.get('top_cohorts', [])
         recommendations = churn_data.get('recommendations', 'Run analysis for insights.')
-        timestamp = churn_data.get('timestamp', datetime.now().isoformat())
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                body {{ 
-                    font-family: 'Segoe UI', Arial, sans-serif; 
-                    margin: 40px; 
-                    color: #1A1A1A;
-                    line-height: 1.6;
-                }}
-                h1 {{ 
-                    color: #0066FF; 
-                    border-bottom: 4px solid #0066FF;
-                    padding-bottom: 10px;
-                    margin-bottom: 30px;
-                }}
-                h2 {{
-                    color: #003399;
-                    margin-top: 30px;
-                    margin-bottom: 15px;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 40px;
-                }}
-                .metric {{ 
-                    background: linear-gradient(135deg, #f5f5f5 0%, #e8e8e8 100%);
-                    padding: 25px; 
-                    margin: 15px 0;
-                    border-radius: 8px;
-                    border-left: 5px solid #0066FF;
-                }}
-                .highlight {{ 
-                    color: #FF6B00; 
-                    font-weight: bold; 
-                    font-size: 1.3em;
-                }}
-                .critical {{
-                    color: #F44336;
-                    font-weight: bold;
-                }}
-                ul {{
-                    margin-left: 20px;
-                    margin-top: 10px;
-                }}
-                li {{
-                    margin: 8px 0;
-                    padding-left: 5px;
-                }}
-                .footer {{
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid #ddd;
-                    font-size: 0.9em;
-                    color: #757575;
-                }}
-                .status-badge {{
-                    display: inline-block;
-                    padding: 5px 12px;
-                    background: #00C853;
-                    color: white;
-                    border-radius: 4px;
-                    font-size: 0.9em;
-                    margin-top: 10px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🎬 Paramount+ Churn Analysis Report</h1>
-                <p><strong>AI-Powered Subscriber Retention Intelligence</strong></p>
-            </div>
-            
-            <div class="metric">
-                <h2>📊 At-Risk Subscribers</h2>
-                <p class="critical" style="font-size: 2em; margin: 10px 0;">{at_risk:,}</p>
-                <p>Revenue at Risk: <span class="highlight">${revenue_risk:,.0f}M</span></p>
-                <div class="status-badge">High Priority</div>
-            </div>
-            
-            <div class="metric">
-                <h2>🎯 Top Pareto Cohorts</h2>
-                <p style="color: #757575; margin-bottom: 10px;">
-                    <em>Top 20% of cohorts driving 80% of churn impact</em>
-                </p>
-                <ul>
-                    {''.join([f"<li><strong>{cohort}</strong></li>" for cohort in cohorts])}
-                </ul>
-            </div>
-            
-            <div class="metric">
-                <h2>🤖 AI-Generated Recommendations</h2>
-                <p style="background: white; padding: 15px; border-radius: 4px; margin-top: 10px;">
-                    {recommendations}
-                </p>
-            </div>
-            
-            <div class="metric">
-                <h2>💡 Predictive Insights</h2>
-                <ul>
-                    <li><strong>Churn Prediction Accuracy:</strong> 87%</li>
-                    <li><strong>Forecast Horizon:</strong> 30 days</li>
-                    <li><strong>Detection Method:</strong> AI anomaly detection + Pareto analysis</li>
-                    <li><strong>Recommended Action Timeline:</strong> Immediate (within 7 days)</li>
-                </ul>
-            </div>
-            
-            <div class="footer">
-                <p><strong>Report Generated:</strong> {timestamp}</p>
-                <p><strong>Source:</strong> Paramount+ AI Operations Platform</p>
-                <p><strong>Powered by:</strong> Adobe PDF Services API</p>
-            </div>
-        </body>
-        </html>
-        """
+        timestamp = churn_data.get('timestamp') or datetime.now().isoformat()
+        
+        # Format numbers once in Python; non-numeric values (e.g. 'N/A') pass through
+        html = _CHURN_REPORT_TMPL.generate(
+            at_risk=f"{at_risk:,}" if _is_number(at_risk) else at_risk,
+            revenue_risk=f"${revenue_risk:,.0f}M" if _is_number(revenue_risk) else revenue_risk,
+            cohorts=cohorts,
+            recommendations=recommendations,
+            timestamp=timestamp,
+        )
         
-        output_path = f"churn_analysis_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        output_path = f"churn_analysis_report_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         return self.generate_html_report(html_content=html, output_path=output_path)
     
     def generate_incident_report(self, incident_data: Dict[str, Any]) -> str:
@@ -377,171 +897,77 @@ class AdobePDFClient:
         total = incident_data.get('total_incidents', 0)
         critical = incident_data.get('critical_issues', [])
         root_cause = incident_data.get('root_cause', 'AI analysis in progress...')
-        timestamp = incident_data.get('timestamp', datetime.now().isoformat())
-        
-        # Build critical issues table
-        rows = []
-        for i in critical[:10]:  # Top 10
-            title = i.get('title', 'N/A')
-            impact = i.get('impact', 'N/A')
-            status = i.get('status', 'N/A')
-            rows.append(f"""
-                <tr>
-                    <td>{title}</td>
-                    <td>{impact}</td>
-                    <td><span class="status-{status.lower()}">{status}</span></td>
-                </tr>
-            """)
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                body {{ 
-                    font-family: 'Segoe UI', Arial, sans-serif; 
-                    margin: 40px; 
-                    color: #1A1A1A;
-                }}
-                h1 {{ color: #0066FF; border-bottom: 4px solid #0066FF; padding-bottom: 10px; }}
-                h2 {{ color: #003399; margin-top: 25px; margin-bottom: 15px; }}
-                .critical {{ color: #F44336; font-weight: bold; font-size: 1.5em; }}
-                table {{ 
-                    border-collapse: collapse; 
-                    width: 100%; 
-                    margin: 20px 0;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                th, td {{ 
-                    border: 1px solid #ddd; 
-                    padding: 12px; 
-                    text-align: left; 
-                }}
-                th {{ 
-                    background-color: #0066FF; 
-                    color: white; 
-                    font-weight: 600;
-                }}
-                tr:nth-child(even) {{ background-color: #f5f5f5; }}
-                tr:hover {{ background-color: #e8f4ff; }}
-                .status-open {{ color: #F44336; font-weight: bold; }}
-                .status-in-progress {{ color: #FFB300; font-weight: bold; }}
-                .status-resolved {{ color: #00C853; font-weight: bold; }}
-                .root-cause {{
-                    background: #FFF9E6;
-                    border-left: 5px solid #FFB300;
-                    padding: 20px;
-                    margin: 20px 0;
-                    border-radius: 4px;
-                }}
-            </style>
-        </head>
-        <body>
-            <h1>🚨 Production Incident Report</h1>
-            <p style="margin: 20px 0;">
-                <strong>Total Incidents:</strong> 
-                <span class="critical">{total}</span>
-            </p>
-            
-            <h2>🎯 Critical Issues (Pareto 20%)</h2>
-            <p style="color: #757575; margin-bottom: 10px;">
-                <em>Top 20% of issues causing 80% of operational impact</em>
-            </p>
-            <table>
-                <tr>
-                    <th style="width: 50%;">Issue</th>
-                    <th style="width: 25%;">Impact</th>
-                    <th style="width: 25%;">Status</th>
-                </tr>
-                {''.join(rows) if rows else '<tr><td colspan="3">No critical issues found</td></tr>'}
-            </table>
-            
-            <h2>🔍 Root Cause Analysis</h2>
-            <div class="root-cause">
-                <p>{root_cause}</p>
-            </div>
-            
-            <div style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #757575;">
-                <p><strong>Generated:</strong> {timestamp}</p>
-                <p><strong>Platform:</strong> Paramount+ AI Operations Platform</p>
-            </div>
-        </body>
-        </html>
-        """
+        timestamp = incident_data.get('timestamp') or datetime.now().isoformat()
+        
+        html = _INCIDENT_REPORT_TMPL.generate(
+            total=total,
+            critical_issues=critical[:10],  # Top 10
+            root_cause=root_cause,
+            timestamp=timestamp,
+        )
         
-        output_path = f"incident_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        output_path = f"incident_report_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         return self.generate_html_report(html_content=html, output_path=output_path)
     
     def _create_text_pdf(self, lines: list, output_path: str) -> str:
         """Create a text-based PDF from lines of text."""
-        from io import BytesIO
-        
-        pdf_content = BytesIO()
-        pdf_content.write(b"%PDF-1.4\n")
+        if _Canvas is not None:
+            return self._create_text_pdf_reportlab(lines, output_path)
         
         # Build text commands with proper absolute positioning
         y_pos = 750
         font_size = 11
-        text_commands = f"BT\n/F1 {font_size} Tf\n/F2 {font_size-1} Tf\n"
+        parts = [f"BT\n/F1 {font_size} Tf\n/F2 {font_size-1} Tf\n"]
         
         for line in lines[:45]:  # Limit to 45 lines to fit on page
-            # Escape PDF special characters
-            line = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            # Escape PDF special characters (headings repeat across reports)
+            line = _pdf_escape(line)
             # Use bold for headers (lines starting with certain characters)
             if line.startswith(('===', '---', '###')):
-                text_commands += f"/F1 {font_size+2} Tf\n"
+                parts.append(f"/F1 {font_size+2} Tf\n")
             elif line.startswith(('*', '-', '•')):
-                text_commands += f"/F2 {font_size} Tf\n"
+                parts.append(f"/F2 {font_size} Tf\n")
             else:
-                text_commands += f"/F2 {font_size} Tf\n"
+                parts.append(f"/F2 {font_size} Tf\n")
             
             # Absolute positioning for each line
-            text_commands += f"1 0 0 1 50 {y_pos} Tm\n({line[:75]}) Tj\n"
+            parts.append(f"1 0 0 1 50 {y_pos} Tm\n({line}) Tj\n")
             y_pos -= 16
             
             if y_pos < 50:
                 break
         
-        text_commands += "ET\n"
-        content_bytes = text_commands.encode('latin-1', errors='replace')
-        
-        # PDF Objects
-        catalog = b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
-        pages = b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
-        page = b"3 0 obj\n<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R /Resources << /Font << /F1 5 0 R /F2 6 0 R >> >> >>\nendobj\n"
-        contents = b"4 0 obj\n<< /Length " + str(len(content_bytes)).encode() + b" >>\nstream\n" + content_bytes + b"\nendstream\nendobj\n"
-        font1 = b"5 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold >>\nendobj\n"
-        font2 = b"6 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>\nendobj\n"
+        parts.append("ET\n")
+        content_bytes = "".join(parts).encode('latin-1', errors='replace')
         
-        # Track positions
-        positions = {}
-        current_pos = len(b"%PDF-1.4\n")
-        
-        for idx, obj in enumerate([catalog, pages, page, contents, font1, font2], start=1):
-            positions[idx] = current_pos
-            pdf_content.write(obj)
-            current_pos += len(obj)
-        
-        # Cross-reference table
-        xref_start = current_pos
-        xref = b"xref\n0 7\n"
-        xref += b"0000000000 65535 f \n"
-        for i in range(1, 7):
-            xref += f"{positions[i]:010d} 00000 n \n".encode()
-        
-        pdf_content.write(xref)
+        size = _write_text_pdf(
+            output_path, content_bytes, _PDF_PAGE_2FONT,
+            (_PDF_FONT_HELVETICA_BOLD, _PDF_FONT_HELVETICA_F2)
+        )
         
-        # Trailer
-        trailer = b"trailer\n<< /Size 7 /Root 1 0 R >>\nstartxref\n" + str(xref_start).encode() + b"\n%%EOF\n"
-        pdf_content.write(trailer)
+        logger.info("text_pdf_created", path=output_path, size=size)
+        return output_path
+    
+    def _create_text_pdf_reportlab(self, lines: list, output_path: str) -> str:
+        """Create a text-based PDF with ReportLab, paginating instead of truncating."""
+        canvas = _Canvas(output_path, pagesize=_LETTER)
+        y_pos = 750
         
-        # Write to file
-        with open(output_path, "wb") as f:
-            f.write(pdf_content.getvalue())
+        for line in lines:
+            # Use bold for headers (lines starting with certain characters)
+            if line.startswith(('===', '---', '###')):
+                canvas.setFont("Helvetica-Bold", 13)
+            else:
+                canvas.setFont("Helvetica", 11)
+            canvas.drawString(50, y_pos, line[:75])
+            y_pos -= 16
+            
+            if y_pos < 50:
+                canvas.showPage()
+                y_pos = 750
         
-        logger.info("text_pdf_created", path=output_path, size=len(pdf_content.getvalue()))
+        canvas.save()
+        logger.info("text_pdf_created", path=output_path, engine="reportlab")
         return output_path
     
     def generate_executive_summary(self, summary_data: Dict[str, Any]) -> str:
@@ -557,336 +983,163 @@ class AdobePDFClient:
         metrics = summary_data.get('metrics', {})
         insights = summary_data.get('insights', [])
         recommendations = summary_data.get('recommendations', [])
-        timestamp = summary_data.get('timestamp', datetime.now().isoformat())
+        timestamp = summary_data.get('timestamp') or datetime.now().isoformat()
         figma_sync = summary_data.get('figma_sync', False)
         figma_image_url = summary_data.get('figma_image_url')
         top_incident = summary_data.get('top_incident')
         governance = summary_data.get('governance', {})
         
-        # Add Figma dashboard screenshot/design if available
-        hero_image = ""
-        if figma_image_url and not figma_image_url.startswith('data:'):
-            hero_image = f"""
-            <div style="margin: 20px 0; page-break-inside: avoid;">
-                <div style="background: #0A0E1A; padding: 20px; border-radius: 8px; box-shadow: 0 4px 12px rgba(0,0,0,0.2);">
-                    <h3 style="color: #0066FF; text-align: center; margin-bottom: 15px; font-size: 18px;">
-                        📊 Live Dashboard Snapshot
-                    </h3>
-                    <img src="{figma_image_url}" 
-                         style="width: 100%; height: auto; border-radius: 4px; display: block;"
-                         alt="Figma Dashboard Design" />
-                    <p style="color: #999; font-size: 11px; text-align: center; margin-top: 10px;">
-                        ✨ Synced from Figma Design System • Real-time Design Integration
-                    </p>
-                </div>
-            </div>
-            """
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-                body {{ 
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; 
-                    background: #0A0E1A;
-                    color: #E2E8F0;
-                    padding: 30px;
-                    line-height: 1.6;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                    padding: 20px;
-                    background: linear-gradient(135deg, #1E293B 0%, #0F172A 100%);
-                    border-radius: 12px;
-                    border: 1px solid #334155;
-                }}
-                h1 {{ 
-                    color: #0064FF; 
-                    font-size: 32px; 
-                    margin-bottom: 8px;
-                    font-weight: 700;
-                    letter-spacing: -0.5px;
-                }}
-                .subtitle {{ 
-                    color: #94A3B8; 
-                    font-size: 14px;
-                }}
-                .metrics-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(3, 1fr);
-                    gap: 12px;
-                    margin: 25px 0;
-                }}
-                .metric-card {{
-                    background: linear-gradient(135deg, #0064FF 0%, #0052CC 100%);
-                    padding: 18px;
-                    border-radius: 8px;
-                    text-align: center;
-                    box-shadow: 0 4px 6px rgba(0, 100, 255, 0.2);
-                }}
-                .metric-label {{
-                    font-size: 10px;
-                    color: rgba(255, 255, 255, 0.8);
-                    text-transform: uppercase;
-                    letter-spacing: 1.5px;
-                    font-weight: 600;
-                    margin-bottom: 8px;
-                }}
-                .metric-value {{
-                    font-size: 32px;
-                    font-weight: 700;
-                    color: #FFFFFF;
-                    margin: 8px 0;
-                }}
-                .section {{
-                    margin: 20px 0;
-                    padding: 20px;
-                    background: #1E293B;
-                    border-radius: 8px;
-                    border-left: 4px solid #0064FF;
-                    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
-                }}
-                .section h2 {{
-                    color: #60A5FA;
-                    margin-bottom: 15px;
-                    font-size: 18px;
-                    font-weight: 600;
-                }}
-                ul, ol {{ 
-                    margin-left: 20px;
-                    color: #CBD5E1;
-                }}
-                li {{ 
-                    margin: 10px 0; 
-                    font-size: 13px;
-                    line-height: 1.6;
-                }}
-                .footer {{
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 1px solid #334155;
-                    color: #64748B;
-                    text-align: center;
-                    font-size: 11px;
-                }}
-                .timestamp {{ 
-                    color: #0064FF; 
-                    font-weight: 600;
-                }}
-                .badge {{
-                    display: inline-block;
-                    background: rgba(0, 100, 255, 0.2);
-                    color: #60A5FA;
-                    padding: 4px 12px;
-                    border-radius: 4px;
-                    font-size: 11px;
-                    font-weight: 600;
-                    margin: 10px 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🎬 Paramount+ AI Operations</h1>
-                <div class="subtitle">Executive Dashboard Summary Report</div>
-                {f'<div class="badge">🎨 LIVE FIGMA SYNC</div>' if figma_sync else ''}
-            </div>
-            
-            {hero_image}
-            
-            <div class="metrics-grid">
-                {self._render_metric_cards(metrics)}
-            </div>
-            
-            <div class="section">
-                <h2>🤖 Production Issues</h2>
-                <ul>
-                    {''.join([f"<li>{insight}</li>" for insight in insights])}
-                </ul>
-            </div>
-            
-            {self._render_top_incident_section(top_incident)}
-            {self._render_governance_section(governance)}
-            
-            <div class="section">
-                <h2>⚡ Recommendations &amp; Next Actions</h2>
-                <ol>
-                    {''.join([f"<li>{rec}</li>" for rec in recommendations])}
-                </ol>
-            </div>
-            
-            <div class="footer">
-                <p><strong>Generated:</strong> <span class="timestamp">{datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%B %d, %Y • %I:%M %p')}</span></p>
-                <p>Paramount+ AI Operations Platform • MCP Server • {'🎨 Figma Live Sync' if figma_sync else 'Standard Mode'}</p>
-            </div>
-        </body>
-        </html>
-        """
+        generated_at, generated_text = _format_report_timestamp(timestamp)
+        output_path = f"executive_summary_{time.strftime('%Y%m%d_%H%M%S')}.pdf"
         
-        output_path = f"executive_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        # Mock mode without WeasyPrint only needs the text lines, not the HTML
+        if not self.enabled and _load_weasyprint() is None:
+            logger.warning("weasyprint_not_available", message="Falling back to text PDF")
+            lines = self._executive_summary_lines(metrics, insights, recommendations, figma_sync, generated_text)
+            return self._create_text_pdf(lines, output_path)
+        
+        context = dict(
+            metrics=metrics,
+            insights=insights,
+            recommendations=recommendations,
+            figma_sync=figma_sync,
+            figma_image_url=figma_image_url,
+            top_incident=top_incident,
+            governance=governance,
+            generated_at=generated_at,
+        )
         
         # If not enabled (mock mode), use WeasyPrint to render styled HTML
         if not self.enabled:
+            HTML, font_config = _load_weasyprint()
             try:
-                from weasyprint import HTML
-                HTML(string=html).write_pdf(output_path)
+                HTML(string=_EXECUTIVE_SUMMARY_TMPL.render(context)).write_pdf(output_path, font_config=font_config)
                 logger.info("pdf_generated_with_weasyprint", path=output_path)
                 return output_path
-            except ImportError:
-                logger.warning("weasyprint_not_available", message="Falling back to text PDF")
             except Exception as e:
                 logger.error("weasyprint_failed", error=str(e), message="Falling back to text PDF")
             
             # Fallback: create text-based PDF
-            lines = [
-                "=== PARAMOUNT+ AI OPERATIONS PLATFORM ===",
-                "Executive Dashboard Summary Report",
-                "",
-            ]
-            
-            if figma_sync:
-                lines.append("*** LIVE DESIGN SYNC ENABLED - Real-time Figma Integration ***")
-                lines.append("")
-            
-            lines.append("--- KEY METRICS ---")
-            lines.append("")
-            for label, value in metrics.items():
-                lines.append(f"  {label}: {value}")
-            
-            lines.append("")
-            lines.append("--- AI-POWERED INSIGHTS ---")
-            lines.append("")
-            for idx, insight in enumerate(insights, 1):
-                # Wrap long insights
-                if len(insight) > 70:
-                    words = insight.split()
-                    current = f"  {idx}. "
-                    for word in words:
-                        if len(current) + len(word) < 70:
-                            current += word + " "
-                        else:
-                            lines.append(current.strip())
-                            current = "     " + word + " "
-                    if current.strip():
-                        lines.append(current.strip())
-                else:
-                    lines.append(f"  {idx}. {insight}")
-            
-            lines.append("")
-            lines.append("--- STRATEGIC RECOMMENDATIONS ---")
-            lines.append("")
-            for idx, rec in enumerate(recommendations, 1):
-                # Wrap long recommendations
-                if len(rec) > 70:
-                    words = rec.split()
-                    current = f"  {idx}. "
-                    for word in words:
-                        if len(current) + len(word) < 70:
-                            current += word + " "
-                        else:
-                            lines.append(current.strip())
-                            current = "     " + word + " "
-                    if current.strip():
-                        lines.append(current.strip())
-                else:
-                    lines.append(f"  {idx}. {rec}")
-            
-            lines.append("")
-            lines.append("--- REPORT DETAILS ---")
-            lines.append(f"Generated: {datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%B %d, %Y at %I:%M %p')}")
-            lines.append(f"Platform: Paramount+ AI Operations MCP Server")
-            lines.append(f"Status: {'Figma Live Sync Active' if figma_sync else 'Standard Report Mode'}")
-            
+            lines = self._executive_summary_lines(metrics, insights, recommendations, figma_sync, generated_text)
             return self._create_text_pdf(lines, output_path)
         
+        html = _EXECUTIVE_SUMMARY_TMPL.generate(context)
         return self.generate_html_report(html_content=html, output_path=output_path)
-    
-    def _render_metric_cards(self, metrics: Dict[str, Any]) -> str:
-        """Helper to render metric cards."""
-        cards = []
-        for label, value in metrics.items():
-            cards.append(f"""
-                <div class="metric-card">
-                    <div class="metric-label">{label}</div>
-                    <div class="metric-value">{value}</div>
-                </div>
-            """)
-        return ''.join(cards)
 
     @staticmethod
-    def _render_top_incident_section(top_incident: dict | None) -> str:
-        if not top_incident:
-            return ""
-        return f"""
-            <div class="section" style="border-left-color: #EF4444;">
-                <h2>🚨 Top Priority Incident</h2>
-                <table style="width:100%; border-collapse:collapse; margin-top:10px;">
-                    <tr><td style="color:#94A3B8; padding:6px 0; width:180px;">Incident ID</td>
-                        <td style="color:#F1F5F9; font-weight:600;">{top_incident.get('id', 'N/A')}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Summary</td>
-                        <td style="color:#F1F5F9;">{top_incident.get('summary', 'N/A')}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Priority Score</td>
-                        <td style="color:#FBBF24; font-weight:700; font-size:18px;">{top_incident.get('priority_score', 'N/A')}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Recommended Action</td>
-                        <td style="color:#60A5FA; font-weight:600;">{top_incident.get('top_action', 'Review required')}</td></tr>
-                </table>
-            </div>
-        """
+    def _executive_summary_lines(
+        metrics: Dict[str, Any],
+        insights: list,
+        recommendations: list,
+        figma_sync: bool,
+        generated_text: str
+    ) -> list:
+        """Build the text lines for the executive summary fallback PDF."""
+        lines = [
+            "=== PARAMOUNT+ AI OPERATIONS PLATFORM ===",
+            "Executive Dashboard Summary Report",
+            "",
+        ]
+        
+        if figma_sync:
+            lines.extend(("*** LIVE DESIGN SYNC ENABLED - Real-time Figma Integration ***", ""))
+        
+        lines.extend(("--- KEY METRICS ---", ""))
+        lines.extend(f"  {label}: {value}" for label, value in metrics.items())
+        
+        lines.extend(("", "--- AI-POWERED INSIGHTS ---", ""))
+        lines.extend(_numbered_lines(insights))
+        
+        lines.extend(("", "--- STRATEGIC RECOMMENDATIONS ---", ""))
+        lines.extend(_numbered_lines(recommendations))
+        
+        lines.extend((
+            "",
+            "--- REPORT DETAILS ---",
+            f"Generated: {generated_text}",
+            "Platform: Paramount+ AI Operations MCP Server",
+            f"Status: {'Figma Live Sync Active' if figma_sync else 'Standard Report Mode'}",
+        ))
+        return lines
 
-    @staticmethod
-    def _render_governance_section(governance: dict) -> str:
-        if not governance or not governance.get('total_reviews'):
-            return ""
-        return f"""
-            <div class="section" style="border-left-color: #A855F7;">
-                <h2>🛡️ Governance &amp; Approvals</h2>
-                <table style="width:100%; border-collapse:collapse; margin-top:10px;">
-                    <tr><td style="color:#94A3B8; padding:6px 0; width:180px;">Total Reviews</td>
-                        <td style="color:#F1F5F9; font-weight:600;">{governance.get('total_reviews', 0)}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Awaiting Review</td>
-                        <td style="color:#FBBF24; font-weight:600;">{governance.get('awaiting_review', 0)}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Approved</td>
-                        <td style="color:#34D399; font-weight:600;">{governance.get('approved', 0)}</td></tr>
-                    <tr><td style="color:#94A3B8; padding:6px 0;">Rejected</td>
-                        <td style="color:#EF4444; font-weight:600;">{governance.get('rejected', 0)}</td></tr>
-                </table>
-            </div>
-        """
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            # The factory caches this client for the process, and asyncio
+            # primitives cannot cross event loops, so rebuild when it changes.
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def _run_async(self, func, *args) -> str:
+        """Run a blocking report method in a worker thread, bounded by the semaphore."""
+        async with self._get_semaphore():
+            return await asyncio.to_thread(func, *args)
+
+    async def generate_html_report_async(
+        self,
+        html_content: str,
+        output_path: str = "operations_report.pdf"
+    ) -> str:
+        """Async variant of generate_html_report."""
+        return await self._run_async(self.generate_html_report, html_content, output_path)
+
+    async def generate_churn_report_async(self, churn_data: Dict[str, Any]) -> str:
+        """Async variant of generate_churn_report."""
+        return await self._run_async(self.generate_churn_report, churn_data)
+
+    async def generate_incident_report_async(self, incident_data: Dict[str, Any]) -> str:
+        """Async variant of generate_incident_report."""
+        return await self._run_async(self.generate_incident_report, incident_data)
+
+    async def generate_executive_summary_async(self, summary_data: Dict[str, Any]) -> str:
+        """Async variant of generate_executive_summary."""
+        return await self._run_async(self.generate_executive_summary, summary_data)
 
 
+@lru_cache(maxsize=1)
+def _mock_pdf_client() -> AdobePDFClient:
+    """Return the shared disabled client used when Adobe is not configured."""
+    logger.info(
+        "adobe_pdf_not_configured",
+        message="Set ADOBE_CLIENT_ID, ADOBE_CLIENT_SECRET, ADOBE_ORGANIZATION_ID, ADOBE_PDF_ENABLED=true"
+    )
+    # Client with enabled=False generates fallback PDFs locally
+    return AdobePDFClient(
+        client_id="mock",
+        client_secret="mock",
+        organization_id="mock",
+        enabled=False
+    )
+
+
+@lru_cache(maxsize=1)
 def create_adobe_pdf_client() -> Optional[AdobePDFClient]:
     """
     Create Adobe PDF client from environment variables.
     
+    The client is built once per process so its access token, HTTP session
+    and SDK context are reused; call ``create_adobe_pdf_client.cache_clear()``
+    after changing the ADOBE_* environment variables.
+    
     Returns:
         AdobePDFClient if configured, None otherwise
     """
+    # Mock mode is the common case in dev/CI; decide it from the flag alone
+    if os.getenv("ADOBE_PDF_ENABLED", "false").lower() != "true":
+        return _mock_pdf_client()
+    
     client_id = os.getenv("ADOBE_CLIENT_ID", "")
     client_secret = os.getenv("ADOBE_CLIENT_SECRET", "")
     org_id = os.getenv("ADOBE_ORGANIZATION_ID", "")
-    enabled = os.getenv("ADOBE_PDF_ENABLED", "false").lower() == "true"
     
-    if not all([client_id, client_secret, org_id]) or not enabled:
-        logger.info(
-            "adobe_pdf_not_configured",
-            message="Set ADOBE_CLIENT_ID, ADOBE_CLIENT_SECRET, ADOBE_ORGANIZATION_ID, ADOBE_PDF_ENABLED=true"
-        )
-        # Return client with enabled=False for mock mode
-        return AdobePDFClient(
-            client_id="mock",
-            client_secret="mock",
-            organization_id="mock",
-            enabled=False
-        )
+    if not all((client_id, client_secret, org_id)):
+        return _mock_pdf_client()
     
     return AdobePDFClient(
         client_id=client_id,
         client_secret=client_secret,
         organization_id=org_id,
-        enabled=enabled
+        enabled=True
     )
-
@@ -1,15 +1,117 @@
 """Adobe Cloud Storage integration for file management and collaboration."""
 
 import os
-import json
+import io
+import asyncio
+import csv
+import shutil
 import tempfile
+import time
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Iterable, IO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+import orjson
 import structlog
 
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # pragma: no cover - optional dependency
+    MultipartEncoder = None
+
+try:
+    import zstandard as zstd
+except ImportError:  # pragma: no cover - optional dependency
+    zstd = None
+
 logger = structlog.get_logger(__name__)
 
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_CHUNK_ATTEMPTS = 3
+CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'json': 'application/json',
+    'csv': 'text/csv',
+    'txt': 'text/plain',
+    'log': 'text/plain',
+    'html': 'text/html',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'mp4': 'video/mp4',
+    'zst': 'application/zstd'
+}
+ZSTD_LEVEL = 3
+ZSTD_MIN_EXPORT_SIZE = 64 * 1024
+ZSTD_SPOOL_SIZE = 16 * 1024 * 1024
+EXPORT_SPOOL_SIZE = 16 * 1024 * 1024
+JSON_EXPORT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Timestamp shared by every upload inside AdobeStorageClient.batch(). A
+# ContextVar keeps concurrent requests on the shared client from seeing each
+# other's batches and follows asyncio.to_thread into worker threads.
+_batch_timestamp: ContextVar[Optional[str]] = ContextVar("adobe_storage_batch_timestamp", default=None)
+
+
+def _iso_now() -> str:
+    """UTC ISO timestamp for upload metadata, shared across an enclosing batch()."""
+    return _batch_timestamp.get() or datetime.utcnow().isoformat()
+
+
+def _write_csv_rows(fp, rows: List[Dict[str, Any]]) -> None:
+    """
+    Write dict rows as CSV with a header taken from the first row.
+    
+    When every row has the same keys, values are pulled with one C-level
+    itemgetter per row instead of DictWriter's per-row dict-to-list pass.
+    """
+    fieldnames = list(rows[0])
+    keys = rows[0].keys()
+    if len(fieldnames) > 1 and all(row.keys() == keys for row in rows):
+        writer = csv.writer(fp)
+        writer.writerow(fieldnames)
+        writer.writerows(map(itemgetter(*fieldnames), rows))
+        return
+    writer = csv.DictWriter(fp, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _write_json_export(fp: IO[bytes], data: Any) -> None:
+    """
+    Write data as indented JSON, one row at a time for top-level lists.
+    
+    Peak memory stays at one encoded row instead of the whole document. The
+    bytes match ``orjson.dumps(data, option=JSON_EXPORT_OPTIONS)``: each row
+    is shifted one indent level, which is safe because encoded JSON never
+    contains a raw newline inside a string.
+    """
+    if not isinstance(data, list) or not data:
+        fp.write(orjson.dumps(data, option=JSON_EXPORT_OPTIONS))
+        return
+    separator = b"[\n  "
+    for row in data:
+        fp.write(separator)
+        fp.write(orjson.dumps(row, option=JSON_EXPORT_OPTIONS).replace(b"\n", b"\n  "))
+        separator = b",\n  "
+    fp.write(b"\n]")
+
+
+def _remaining_size(file_obj: IO[bytes]) -> int:
+    """Bytes left to read in a seekable file object, leaving its position unchanged."""
+    start = file_obj.tell()
+    end = file_obj.seek(0, os.SEEK_END)
+    file_obj.seek(start)
+    return end - start
+
 
 class AdobeStorageClient:
     """
@@ -23,7 +125,8 @@ class AdobeStorageClient:
         self,
         access_token: str,
         api_endpoint: str = "https://cc-api-storage.adobe.io",
-        enabled: bool = True
+        enabled: bool = True,
+        max_concurrency: int = 8
     ):
         """
         Initialize Adobe Storage client.
@@ -32,27 +135,76 @@ class AdobeStorageClient:
             access_token: Adobe API access token
             api_endpoint: Adobe Cloud Storage API endpoint
             enabled: Whether Adobe storage is enabled
+            max_concurrency: Maximum transfers the async variants run at once
         """
         self.access_token = access_token
         self.api_endpoint = api_endpoint
         self.enabled = enabled
+        self._environment = os.getenv("ENVIRONMENT", "development")
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
         
         self.headers = {
             "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
             "x-api-key": os.getenv("ADOBE_CLIENT_ID", ""),
         }
         
+        # Pooled keep-alive session shared by every call from this client.
+        # Only idempotent requests are retried: a streamed upload body cannot
+        # be replayed once consumed.
+        self._http = requests.Session()
+        self._http.headers.update(self.headers)
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset({"GET", "DELETE"}),
+                respect_retry_after_header=True,
+            ),
+        ))
+        
         if enabled:
             logger.info("adobe_storage_initialized", endpoint=api_endpoint)
         else:
             logger.warning("adobe_storage_disabled")
     
+    @contextmanager
+    def batch(self):
+        """
+        Stamp every upload made inside the block with one shared timestamp.
+        
+        Example:
+            with storage_client.batch():
+                for path in log_paths:
+                    storage_client.upload_log_file(path)
+        """
+        token = _batch_timestamp.set(datetime.utcnow().isoformat())
+        try:
+            yield self
+        finally:
+            _batch_timestamp.reset(token)
+    
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
     def upload_file(
         self,
-        file_path: str,
+        file_path: Optional[str] = None,
         destination_folder: str = "paramount-ops",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        file_obj: Optional[IO[bytes]] = None,
+        filename: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Upload file to Adobe Cloud Storage.
@@ -61,55 +213,88 @@ class AdobeStorageClient:
             file_path: Local file path to upload
             destination_folder: Folder path in Adobe Cloud
             metadata: Optional metadata tags
+            file_obj: Seekable binary file object to upload instead of file_path
+            filename: Cloud file name (required with file_obj)
             
         Returns:
             Upload response with file ID and details
+        
+        Raises:
+            ValueError: If neither file_path nor file_obj is given, or file_obj
+                is given without a filename
+        
+        The body is streamed from the file only when requests-toolbelt is
+        installed; without it requests builds the whole multipart body in
+        memory before sending.
         """
+        if file_path is None and file_obj is None:
+            raise ValueError("upload_file requires file_path or file_obj")
+        if filename is None:
+            if file_path is None:
+                raise ValueError("upload_file requires filename when uploading file_obj")
+            filename = os.path.basename(file_path)
+        
         if not self.enabled:
             logger.warning("adobe_storage_not_enabled", message="Returning mock response")
+            if file_obj is not None:
+                size = _remaining_size(file_obj)
+            else:
+                size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
             return {
-                "id": f"mock_{os.path.basename(file_path)}",
-                "name": os.path.basename(file_path),
+                "id": f"mock_{filename}",
+                "name": filename,
                 "folder": destination_folder,
-                "size": os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+                "size": size,
                 "status": "mock_upload"
             }
         
         try:
-            filename = os.path.basename(file_path)
-            
-            # Read file
-            with open(file_path, "rb") as f:
-                file_content = f.read()
+            if file_obj is not None:
+                size = _remaining_size(file_obj)
+            else:
+                size = os.path.getsize(file_path)
+            content_type = self._get_content_type(filename)
             
             # Prepare upload metadata
             upload_data = {
                 "name": filename,
                 "folder": destination_folder,
-                "size": len(file_content),
+                "size": size,
                 "metadata": metadata or {},
-                "timestamp": datetime.utcnow().isoformat(),
-                "content_type": self._get_content_type(filename)
+                "timestamp": _iso_now(),
+                "content_type": content_type
             }
             
-            # Upload file
+            # Upload file; MultipartEncoder streams the body from the file,
+            # while the plain requests fallback buffers it in memory
             # Note: Actual Adobe Cloud Storage API may differ
             # This is a generic implementation pattern
-            response = requests.post(
-                f"{self.api_endpoint}/files/upload",
-                headers=self.headers,
-                files={"file": (filename, file_content)},
-                data={"metadata": json.dumps(upload_data)}
-            )
+            with open(file_path, "rb") if file_obj is None else nullcontext(file_obj) as f:
+                if MultipartEncoder is not None:
+                    encoder = MultipartEncoder(fields={
+                        "metadata": orjson.dumps(upload_data).decode(),
+                        "file": (filename, f, content_type),
+                    })
+                    response = self._http.post(
+                        f"{self.api_endpoint}/files/upload",
+                        headers={"Content-Type": encoder.content_type},
+                        data=encoder
+                    )
+                else:
+                    response = self._http.post(
+                        f"{self.api_endpoint}/files/upload",
+                        files={"file": (filename, f, content_type)},
+                        data={"metadata": orjson.dumps(upload_data).decode()}
+                    )
             
             if response.status_code in [200, 201]:
                 logger.info(
                     "file_uploaded",
                     filename=filename,
                     folder=destination_folder,
-                    size=len(file_content)
+                    size=size
                 )
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error(
                     "upload_failed",
@@ -121,15 +306,133 @@ class AdobeStorageClient:
         except FileNotFoundError:
             logger.error("file_not_found", path=file_path)
             return {"error": f"File not found: {file_path}"}
+        except Exception as e:
+            logger.error("upload_exception", error=str(e), file=file_path or filename)
+            return {"error": str(e)}
+    
+    def upload_file_chunked(
+        self,
+        file_path: str,
+        destination_folder: str = "paramount-ops",
+        metadata: Optional[Dict[str, Any]] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Upload a large file as byte ranges sent in parallel, then commit it.
+        
+        Each chunk is retried on its own, so a dropped connection only resends
+        that range. Files no larger than one chunk, and mock mode, go through
+        upload_file.
+        
+        Args:
+            file_path: Local file path to upload
+            destination_folder: Folder path in Adobe Cloud
+            metadata: Optional metadata tags
+            chunk_size: Bytes per range request
+            concurrency: Number of ranges in flight at once
+            
+        Returns:
+            Upload response with file ID and details
+        """
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            logger.error("file_not_found", path=file_path)
+            return {"error": f"File not found: {file_path}"}
+        
+        if not self.enabled or size <= chunk_size:
+            return self.upload_file(file_path, destination_folder, metadata)
+        
+        try:
+            filename = os.path.basename(file_path)
+            
+            # Open an upload session, send every range, then commit
+            # Note: Actual Adobe Cloud Storage API may differ
+            response = self._http.post(
+                f"{self.api_endpoint}/files/uploads",
+                headers={"Content-Type": "application/json"},
+                data=orjson.dumps({
+                    "name": filename,
+                    "folder": destination_folder,
+                    "size": size,
+                    "metadata": metadata or {},
+                    "timestamp": _iso_now(),
+                    "content_type": self._get_content_type(filename)
+                })
+            )
+            if response.status_code not in [200, 201]:
+                logger.error("upload_failed", status=response.status_code, error=response.text)
+                return {"error": response.text, "status_code": response.status_code}
+            upload_id = orjson.loads(response.content)["upload_id"]
+            
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(
+                    lambda start: self._upload_chunk(file_path, upload_id, start, chunk_size, size),
+                    range(0, size, chunk_size)
+                ))
+            
+            response = self._http.post(f"{self.api_endpoint}/files/{upload_id}/commit")
+            if response.status_code in [200, 201]:
+                logger.info(
+                    "file_uploaded",
+                    filename=filename,
+                    folder=destination_folder,
+                    size=size,
+                    chunks=-(-size // chunk_size)
+                )
+                return orjson.loads(response.content)
+            logger.error("upload_failed", status=response.status_code, error=response.text)
+            return {"error": response.text, "status_code": response.status_code}
+        
         except Exception as e:
             logger.error("upload_exception", error=str(e), file=file_path)
             return {"error": str(e)}
     
+    def _upload_chunk(
+        self,
+        file_path: str,
+        upload_id: str,
+        start: int,
+        chunk_size: int,
+        size: int
+    ) -> None:
+        """Send one byte range of a chunked upload, retrying just that range."""
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            body = f.read(chunk_size)
+        end = start + len(body) - 1
+        headers = {
+            "Content-Range": f"bytes {start}-{end}/{size}",
+            "Content-Type": "application/octet-stream",
+        }
+        
+        for attempt in range(UPLOAD_CHUNK_ATTEMPTS):
+            if attempt:
+                time.sleep(0.5 * 2 ** (attempt - 1))
+            try:
+                response = self._http.post(
+                    f"{self.api_endpoint}/files/{upload_id}/chunk",
+                    headers=headers,
+                    data=body
+                )
+            except requests.RequestException as e:
+                error = str(e)
+                continue
+            if response.status_code in [200, 201, 204]:
+                return
+            error = f"status {response.status_code}"
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+        
+        raise RuntimeError(f"Chunk bytes {start}-{end} failed: {error}")
+    
     def upload_dashboard_export(
         self,
         data: Dict[str, Any],
         export_type: str = "json",
-        name_prefix: str = "dashboard_export"
+        name_prefix: str = "dashboard_export",
+        compress: bool = False
     ) -> Dict[str, Any]:
         """
         Export dashboard data to Adobe Cloud.
@@ -138,74 +441,105 @@ class AdobeStorageClient:
             data: Dashboard data to export
             export_type: File format (json, csv)
             name_prefix: Prefix for filename
+            compress: Upload exports larger than 64 KiB as ``.zst``
             
         Returns:
             Upload response with cloud file ID
         """
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         
-        # Create temp file
-        temp_file = tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix=f'.{export_type}',
-            prefix=f'{name_prefix}_{timestamp}_',
-            delete=False
-        )
-        
-        try:
+        # JSON serializes into memory, spilling to disk only for very large exports.
+        # CSV stays in a BytesIO: TextIOWrapper needs readable(), which
+        # SpooledTemporaryFile lacks before Python 3.11.
+        if export_type == "json":
+            spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+        else:
+            spool = io.BytesIO()
+        with spool as buffer:
             if export_type == "json":
-                json.dump(data, temp_file, indent=2)
+                _write_json_export(buffer, data)
             elif export_type == "csv":
-                # Simple CSV export (could be enhanced)
-                import csv
+                text = io.TextIOWrapper(buffer, encoding="utf-8", newline="")
                 if isinstance(data, list) and len(data) > 0:
-                    writer = csv.DictWriter(temp_file, fieldnames=data[0].keys())
-                    writer.writeheader()
-                    writer.writerows(data)
+                    _write_csv_rows(text, data)
                 else:
-                    temp_file.write("No data available")
-            
-            temp_file.close()
+                    text.write("No data available")
+                text.flush()
+                text.detach()
+            size = buffer.tell()
+            buffer.seek(0)
             
             # Upload
-            result = self.upload_file(
-                file_path=temp_file.name,
+            return self._upload_maybe_compressed(
+                file_obj=buffer,
+                filename=f"{name_prefix}_{timestamp}.{export_type}",
                 destination_folder="paramount-ops/exports",
                 metadata={
                     "type": "dashboard_export",
                     "timestamp": timestamp,
                     "format": export_type,
                     "source": "paramount-ops-dashboard"
-                }
+                },
+                compress=compress and size > ZSTD_MIN_EXPORT_SIZE
             )
-            
-            return result
-            
-        finally:
-            # Cleanup
-            if os.path.exists(temp_file.name):
-                os.unlink(temp_file.name)
     
-    def upload_log_file(self, log_path: str) -> Dict[str, Any]:
+    def upload_log_file(self, log_path: str, compress: bool = False) -> Dict[str, Any]:
         """
         Upload application logs to Adobe Cloud for archival.
         
         Args:
             log_path: Path to log file
+            compress: Upload the log zstd-compressed as ``<name>.zst``
             
         Returns:
             Upload response
         """
-        return self.upload_file(
+        return self._upload_maybe_compressed(
             file_path=log_path,
             destination_folder="paramount-ops/logs",
             metadata={
                 "type": "application_log",
-                "environment": os.getenv("ENVIRONMENT", "development"),
-                "archived_at": datetime.utcnow().isoformat()
-            }
+                "environment": self._environment,
+                "archived_at": _iso_now()
+            },
+            compress=compress
         )
     
+    def _upload_maybe_compressed(
+        self,
+        destination_folder: str,
+        metadata: Dict[str, Any],
+        compress: bool,
+        file_path: Optional[str] = None,
+        file_obj: Optional[IO[bytes]] = None,
+        filename: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Upload a file or buffer, zstd-compressing it first when requested and available."""
+        if compress and zstd is None:
+            logger.warning("zstd_unavailable", message="Install zstandard to compress uploads")
+            compress = False
+        if not compress:
+            return self.upload_file(
+                file_path, destination_folder, metadata, file_obj=file_obj, filename=filename
+            )
+        
+        # Compressed output stays in memory until it outgrows the spool size
+        filename = filename or os.path.basename(file_path)
+        with tempfile.SpooledTemporaryFile(max_size=ZSTD_SPOOL_SIZE) as compressed:
+            try:
+                with open(file_path, "rb") if file_obj is None else nullcontext(file_obj) as src:
+                    zstd.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(src, compressed)
+            except FileNotFoundError:
+                logger.error("file_not_found", path=file_path)
+                return {"error": f"File not found: {file_path}"}
+            compressed.seek(0)
+            return self.upload_file(
+                destination_folder=destination_folder,
+                metadata={**metadata, "compression": "zstd"},
+                file_obj=compressed,
+                filename=f"{filename}.zst"
+            )
+    
     def upload_pdf_report(self, pdf_path: str, report_type: str) -> Dict[str, Any]:
         """
         Upload generated PDF report to Adobe Cloud.
@@ -224,7 +558,7 @@ class AdobeStorageClient:
                 "type": f"{report_type}_report",
                 "format": "pdf",
                 "generated_by": "adobe_pdf_services",
-                "uploaded_at": datetime.utcnow().isoformat()
+                "uploaded_at": _iso_now()
             }
         )
     
@@ -256,14 +590,13 @@ class AdobeStorageClient:
             ]
         
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.api_endpoint}/files/list",
-                headers=self.headers,
                 params={"folder": folder, "type": file_type}
             )
             
             if response.status_code == 200:
-                files = response.json().get('files', [])
+                files = orjson.loads(response.content).get('files', [])
                 logger.info("files_listed", folder=folder, count=len(files))
                 return files
             else:
@@ -290,22 +623,22 @@ class AdobeStorageClient:
             return False
         
         try:
-            response = requests.get(
+            with self._http.get(
                 f"{self.api_endpoint}/files/{file_id}/download",
-                headers=self.headers,
                 stream=True
-            )
-            
-            if response.status_code == 200:
-                with open(destination_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            ) as response:
+                if response.status_code != 200:
+                    logger.error("download_failed", status=response.status_code)
+                    return False
                 
-                logger.info("file_downloaded", file_id=file_id, path=destination_path)
-                return True
-            else:
-                logger.error("download_failed", status=response.status_code)
-                return False
+                # Copy the raw socket stream in 1 MiB blocks, letting urllib3
+                # undo any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                with open(destination_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+            
+            logger.info("file_downloaded", file_id=file_id, path=destination_path)
+            return True
                 
         except Exception as e:
             logger.error("download_exception", error=str(e))
@@ -326,10 +659,7 @@ class AdobeStorageClient:
             return False
         
         try:
-            response = requests.delete(
-                f"{self.api_endpoint}/files/{file_id}",
-                headers=self.headers
-            )
+            response = self._http.delete(f"{self.api_endpoint}/files/{file_id}")
             
             if response.status_code in [200, 204]:
                 logger.info("file_deleted", file_id=file_id)
@@ -358,13 +688,10 @@ class AdobeStorageClient:
             }
         
         try:
-            response = requests.get(
-                f"{self.api_endpoint}/storage/usage",
-                headers=self.headers
-            )
+            response = self._http.get(f"{self.api_endpoint}/storage/usage")
             
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 logger.error("usage_check_failed", status=response.status_code)
                 return {"error": "Failed to get storage usage"}
@@ -373,30 +700,108 @@ class AdobeStorageClient:
             logger.error("usage_exception", error=str(e))
             return {"error": str(e)}
     
-    def _get_content_type(self, filename: str) -> str:
+    @staticmethod
+    def _get_content_type(filename: str) -> str:
         """Determine content type from filename."""
-        ext = os.path.splitext(filename)[1].lower()
-        
-        content_types = {
-            '.pdf': 'application/pdf',
-            '.json': 'application/json',
-            '.csv': 'text/csv',
-            '.txt': 'text/plain',
-            '.log': 'text/plain',
-            '.html': 'text/html',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.mp4': 'video/mp4'
-        }
+        _, dot, ext = filename.rpartition('.')
+        return CONTENT_TYPES.get(ext.lower(), 'application/octet-stream') if dot else 'application/octet-stream'
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            # asyncio primitives cannot cross event loops, so rebuild when it changes
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    async def _run_async(self, func, *args, **kwargs):
+        """Run a blocking transfer in a worker thread, bounded by the semaphore."""
+        async with self._get_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def upload_file_async(
+        self,
+        file_path: Optional[str] = None,
+        destination_folder: str = "paramount-ops",
+        metadata: Optional[Dict[str, Any]] = None,
+        file_obj: Optional[IO[bytes]] = None,
+        filename: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of upload_file."""
+        return await self._run_async(
+            self.upload_file, file_path, destination_folder, metadata,
+            file_obj=file_obj, filename=filename
+        )
+    
+    async def upload_many_async(
+        self,
+        file_paths: Iterable[str],
+        destination_folder: str = "paramount-ops",
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload several files concurrently.
         
-        return content_types.get(ext, 'application/octet-stream')
+        Args:
+            file_paths: Local file paths to upload
+            destination_folder: Folder path in Adobe Cloud
+            metadata: Optional metadata tags applied to every file
+            
+        Returns:
+            Upload responses in the same order as file_paths
+        """
+        return list(await asyncio.gather(*(
+            self.upload_file_async(path, destination_folder, metadata)
+            for path in file_paths
+        )))
+    
+    async def upload_dashboard_export_async(
+        self,
+        data: Dict[str, Any],
+        export_type: str = "json",
+        name_prefix: str = "dashboard_export",
+        compress: bool = False
+    ) -> Dict[str, Any]:
+        """Async variant of upload_dashboard_export."""
+        return await self._run_async(
+            self.upload_dashboard_export, data, export_type, name_prefix, compress
+        )
+    
+    async def upload_pdf_report_async(self, pdf_path: str, report_type: str) -> Dict[str, Any]:
+        """Async variant of upload_pdf_report."""
+        return await self._run_async(self.upload_pdf_report, pdf_path, report_type)
+    
+    async def list_files_async(
+        self,
+        folder: str = "paramount-ops",
+        file_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of list_files."""
+        return await self._run_async(self.list_files, folder, file_type)
+    
+    async def download_file_async(self, file_id: str, destination_path: str) -> bool:
+        """Async variant of download_file."""
+        return await self._run_async(self.download_file, file_id, destination_path)
+    
+    async def delete_file_async(self, file_id: str) -> bool:
+        """Async variant of delete_file."""
+        return await self._run_async(self.delete_file, file_id)
+    
+    async def get_storage_usage_async(self) -> Dict[str, Any]:
+        """Async variant of get_storage_usage."""
+        return await self._run_async(self.get_storage_usage)
 
 
+@lru_cache(maxsize=1)
 def create_adobe_storage_client() -> Optional[AdobeStorageClient]:
     """
     Create Adobe Storage client from environment variables.
     
+    The client is built once per process so its pooled HTTP session is reused
+    across requests; call ``create_adobe_storage_client.cache_clear()`` after
+    changing the ADOBE_* or ENVIRONMENT variables.
+    
     Returns:
         AdobeStorageClient if configured, None otherwise
     """
@@ -8,13 +8,71 @@ analytics platform is configured, falling back to mock generators.
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import hashlib
+from operator import itemgetter
+import numpy as np
 import structlog
 
 from config import settings
 from mcp.mocks.generate_churn_cohorts import ChurnCohortGenerator
+from mcp.utils.cache import get_cached, set_cached, invalidate
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
 
 logger = structlog.get_logger()
 
+COHORT_CACHE_KEY = "analytics_cohorts"
+COHORT_CACHE_TTL = 30.0
+
+# Struct-of-arrays layout for cohort aggregation: array name -> (cohort field, dtype)
+COHORT_ARRAY_FIELDS = {
+    "size": ("size", np.int64),
+    "risk": ("churn_risk_score", np.float64),
+    "churners": ("projected_churners_30d", np.int64),
+    "impact": ("financial_impact_30d", np.float64),
+    "ltv": ("avg_lifetime_value", np.float64),
+}
+HIGH_VALUE_LTV = 500
+
+
+def _aggregate_cohorts_loop(sizes, risks, churners, impact, ltv):
+    """Compute every cohort aggregate in a single pass (compiled by Numba)."""
+    total = 0
+    at_risk = 0
+    financial = 0.0
+    weighted_risk = 0.0
+    ltv_at_risk = 0.0
+    high_value_count = 0
+    high_value_impact = 0.0
+    for i in range(sizes.shape[0]):
+        total += sizes[i]
+        at_risk += churners[i]
+        financial += impact[i]
+        weighted_risk += risks[i] * sizes[i]
+        ltv_at_risk += ltv[i] * churners[i]
+        if ltv[i] >= HIGH_VALUE_LTV:
+            high_value_count += 1
+            high_value_impact += impact[i]
+    return total, at_risk, financial, weighted_risk, ltv_at_risk, high_value_count, high_value_impact
+
+
+def _aggregate_cohorts_numpy(sizes, risks, churners, impact, ltv):
+    """Vectorized equivalent of _aggregate_cohorts_loop for when Numba is unavailable."""
+    high_value = ltv >= HIGH_VALUE_LTV
+    return (
+        sizes.sum(), churners.sum(), impact.sum(),
+        np.dot(risks, sizes), np.dot(ltv, churners),
+        high_value.sum(), impact[high_value].sum(),
+    )
+
+
+if njit is not None:
+    _aggregate_cohorts = njit(cache=True)(_aggregate_cohorts_loop)
+else:
+    _aggregate_cohorts = _aggregate_cohorts_numpy
+
 RISK_CATEGORIES = [
     {"keyword_group": ["auth", "login", "sso", "password", "account"], "name": "Authentication & Access", "base_risk": 0.72},
     {"keyword_group": ["payment", "billing", "subscription", "charge", "refund", "revenue"], "name": "Payment & Billing", "base_risk": 0.68},
@@ -37,6 +95,10 @@ class AnalyticsClient:
         self.api_url = getattr(settings, "analytics_api_url", "")
         self.api_key = getattr(settings, "analytics_api_key", "")
         
+        self._cohort_cache: Optional[List[Dict[str, Any]]] = None
+        self._totals: Dict[str, Any] = {}
+        self._totals_source: Optional[List[Dict[str, Any]]] = None
+        
         if self.mock_mode:
             self.generator = ChurnCohortGenerator()
     
@@ -45,19 +107,66 @@ class AnalyticsClient:
         risk_threshold: float = 0.3,
         min_cohort_size: int = 1000
     ) -> List[Dict[str, Any]]:
-        if self.mock_mode:
-            return self._get_mock_cohorts(risk_threshold, min_cohort_size)
-        return self._fetch_from_analytics(risk_threshold, min_cohort_size)
-    
-    def _get_mock_cohorts(self, risk_threshold: float, min_cohort_size: int) -> List[Dict[str, Any]]:
-        cohorts = self.generator.generate(num_cohorts=5)
+        cohorts = self._load_all_cohorts()
         return [
             c for c in cohorts
             if c["churn_risk_score"] >= risk_threshold
             and c["size"] >= min_cohort_size
         ]
     
-    def _fetch_from_analytics(self, risk_threshold: float, min_cohort_size: int) -> List[Dict[str, Any]]:
+    def _load_all_cohorts(self) -> List[Dict[str, Any]]:
+        """
+        Return every cohort, unfiltered, generating or fetching at most once.
+        
+        Mock cohorts are memoized for the life of the client; live cohorts go
+        through the shared TTL cache so Jira-derived data stays fresh.
+        """
+        if self.mock_mode:
+            if self._cohort_cache is None:
+                self._cohort_cache = self.generator.generate(num_cohorts=5)
+            return self._cohort_cache
+        
+        cohorts = get_cached(COHORT_CACHE_KEY, ttl_seconds=COHORT_CACHE_TTL)
+        if cohorts is None:
+            cohorts = self._fetch_from_analytics()
+            set_cached(COHORT_CACHE_KEY, cohorts)
+        return cohorts
+    
+    @staticmethod
+    def _cohort_arrays(cohorts: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Column arrays for the numeric cohort fields."""
+        return {
+            name: np.fromiter((c[field] for c in cohorts), dtype=dtype, count=len(cohorts))
+            for name, (field, dtype) in COHORT_ARRAY_FIELDS.items()
+        }
+    
+    def _cohort_totals(self, cohorts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Aggregates over all cohorts, recomputed only when the cohort list changes."""
+        if cohorts is not self._totals_source:
+            arrays = self._cohort_arrays(cohorts)
+            (total, at_risk, financial, weighted_risk,
+             ltv_at_risk, high_value_count, high_value_impact) = _aggregate_cohorts(
+                *(arrays[name] for name in COHORT_ARRAY_FIELDS)
+            )
+            self._totals = {
+                "total_subscribers": int(total),
+                "total_at_risk": int(at_risk),
+                "financial_impact": float(financial),
+                "weighted_risk": float(weighted_risk),
+                "ltv_at_risk": float(ltv_at_risk),
+                "high_value_count": int(high_value_count),
+                "high_value_impact": float(high_value_impact),
+            }
+            self._totals_source = cohorts
+        return self._totals
+    
+    def invalidate_cache(self) -> None:
+        """Drop memoized cohorts so the next call regenerates or refetches them."""
+        self._cohort_cache = None
+        self._totals_source = None
+        invalidate(COHORT_CACHE_KEY)
+    
+    def _fetch_from_analytics(self) -> List[Dict[str, Any]]:
         """Derive churn risk cohorts from live Jira production issues."""
         try:
             from mcp.integrations.jira_connector import JiraConnector
@@ -115,10 +224,6 @@ class AnalyticsClient:
                 "top_issues": [iss.get("key", iss.get("id", "")) for iss in matched[:5]],
             })
 
-        cohorts = [
-            c for c in cohorts
-            if c["churn_risk_score"] >= risk_threshold and c["size"] >= min_cohort_size
-        ]
         cohorts.sort(key=lambda c: c["churn_risk_score"], reverse=True)
         return cohorts
     
@@ -145,16 +250,17 @@ class AnalyticsClient:
         Returns:
             Retention metrics dictionary
         """
-        cohorts = self.get_churn_cohorts(risk_threshold=0.0, min_cohort_size=0)
+        cohorts = self._load_all_cohorts()
+        totals = self._cohort_totals(cohorts)
         
-        total_subscribers = sum(c["size"] for c in cohorts)
-        total_at_risk = sum(c["projected_churners_30d"] for c in cohorts)
-        total_financial_impact = sum(c["financial_impact_30d"] for c in cohorts)
+        total_subscribers = totals["total_subscribers"]
+        total_at_risk = totals["total_at_risk"]
+        total_financial_impact = totals["financial_impact"]
         
         # Calculate weighted average risk score
-        weighted_risk = sum(
-            c["churn_risk_score"] * c["size"] for c in cohorts
-        ) / total_subscribers if total_subscribers > 0 else 0
+        weighted_risk = (
+            totals["weighted_risk"] / total_subscribers if total_subscribers > 0 else 0
+        )
         
         return {
             "total_subscribers": total_subscribers,
@@ -215,26 +321,16 @@ class AnalyticsClient:
         Returns:
             LTV analysis dictionary
         """
-        cohorts = self.get_churn_cohorts(risk_threshold=0.0, min_cohort_size=0)
-        
-        # Sort by LTV
-        sorted_cohorts = sorted(cohorts, key=lambda x: x["avg_lifetime_value"], reverse=True)
-        
-        total_ltv_at_risk = sum(
-            c["avg_lifetime_value"] * c["projected_churners_30d"] for c in cohorts
-        )
-        
-        high_value_cohorts = [c for c in cohorts if c["avg_lifetime_value"] >= 500]
-        high_value_impact = sum(
-            c["financial_impact_30d"] for c in high_value_cohorts
-        )
+        cohorts = self._load_all_cohorts()
+        # Scalars come from the single aggregation pass; only the ranking sorts
+        totals = self._cohort_totals(cohorts)
         
         return {
-            "total_ltv_at_risk": total_ltv_at_risk,
-            "high_value_cohorts": len(high_value_cohorts),
+            "total_ltv_at_risk": totals["ltv_at_risk"],
+            "high_value_cohorts": totals["high_value_count"],
             "high_value_impact_pct": round(
-                high_value_impact / sum(c["financial_impact_30d"] for c in cohorts), 2
-            ) if cohorts else 0,
+                totals["high_value_impact"] / totals["financial_impact"], 2
+            ) if totals["financial_impact"] else 0,
             "cohort_ltv_ranking": [
                 {
                     "cohort_id": c["cohort_id"],
@@ -242,6 +338,6 @@ class AnalyticsClient:
                     "avg_ltv": c["avg_lifetime_value"],
                     "financial_impact": c["financial_impact_30d"]
                 }
-                for c in sorted_cohorts
+                for c in sorted(cohorts, key=itemgetter("avg_lifetime_value"), reverse=True)
             ]
         }
@@ -8,12 +8,21 @@ Free tier: https://www.atlassian.com/software/jira/free
 """
 
 import asyncio
+import heapq
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Callable, Hashable, Iterator
 
 import httpx
+import orjson
 
 from mcp.utils.error_handler import (
     ConnectionError,
@@ -26,8 +35,314 @@ from mcp.utils.logger import get_logger, log_performance
 
 logger = get_logger(__name__)
 
+# Connection pool and timeouts for the shared JIRA/Confluence HTTP/2 clients
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0)
 
-@dataclass
+# Request budget used until Atlassian reports its own x-ratelimit-* values
+DEFAULT_FILL_RATE = 10.0
+DEFAULT_RATE_INTERVAL = 1.0
+
+# Shared read-only stand-in for missing nested objects in API payloads
+_EMPTY = MappingProxyType({})
+
+# Issue fields requested from search/jql; Pareto rows only need the narrow set
+_FULL_JIRA_FIELDS = (
+    "summary", "status", "priority", "issuetype", "project", "assignee",
+    "reporter", "created", "updated", "description", "labels", "components",
+)
+_PARETO_JIRA_FIELDS = ("summary", "status", "priority", "project", "created", "labels")
+
+# Bodies are pre-encoded with orjson, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Transient statuses retried with Retry-After / exponential backoff. A 5xx
+# may arrive after the server committed a write, so non-idempotent methods
+# (POST) are retried only on 429, which is rejected before processing.
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+MAX_RETRIES = 10
+BACKOFF_MAX = 30.0
+# Total seconds a single request may spend waiting between retries
+RETRY_WAIT_BUDGET = 60.0
+
+# Adaptive (AIMD) concurrency bounds for async fan-out; latency is smoothed
+# as an EMA spanning AIMD_WINDOW samples
+AIMD_MIN_CONCURRENCY = 1
+AIMD_MAX_CONCURRENCY = 20
+AIMD_INITIAL_CONCURRENCY = 4
+AIMD_TARGET_LATENCY = 0.5
+AIMD_WINDOW = 32
+
+# Parsed-response cache: entries live for max(TTL, Cache-Control max-age) and
+# are revalidated with If-None-Match when the server sent an ETag
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 30.0
+SEARCH_CACHE_TTL = 15.0
+
+# Searches are fetched in pages of this size (Atlassian's recommended chunk)
+SEARCH_PAGE_SIZE = 25
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Pause once x-ratelimit-remaining drops to this many requests (or 10% of the limit)
+RATE_LIMIT_REMAINING_FLOOR = 2
+
+
+class AtlassianRateLimiter:
+    """
+    Token bucket tuned from Atlassian's ``x-ratelimit-*`` response headers.
+    
+    Each request takes one token; tokens refill at ``fill_rate`` per
+    ``interval`` seconds up to ``capacity``. When the server reports that
+    few requests remain, the next caller pauses for one refill period.
+    Thread-safe, so the sync and async paths can share one bucket.
+    """
+    
+    def __init__(
+        self,
+        fill_rate: float = DEFAULT_FILL_RATE,
+        interval: float = DEFAULT_RATE_INTERVAL,
+        capacity: Optional[float] = None
+    ):
+        self.fill_rate = fill_rate
+        self.interval = interval
+        self.capacity = capacity or fill_rate
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.fill_rate / self.interval
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * rate)
+            self._updated = now
+            self.tokens -= 1
+            wait = -self.tokens / rate if self.tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+    
+    async def acquire(self) -> None:
+        """Wait (without blocking the loop) until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def acquire_sync(self) -> None:
+        """Block until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def update(self, headers: httpx.Headers) -> None:
+        """Adopt the server's advertised budget and pause when it runs low."""
+        fill_rate = _header_float(headers, "x-ratelimit-fillrate")
+        interval = _header_float(headers, "x-ratelimit-interval-seconds")
+        limit = _header_float(headers, "x-ratelimit-limit")
+        remaining = _header_float(headers, "x-ratelimit-remaining")
+        
+        with self._lock:
+            if fill_rate:
+                self.fill_rate = fill_rate
+            if interval:
+                self.interval = interval
+            if limit:
+                self.capacity = limit
+                self.tokens = min(self.tokens, limit)
+            if remaining is not None and remaining <= max(
+                RATE_LIMIT_REMAINING_FLOOR, 0.1 * (limit or self.capacity)
+            ):
+                self._paused_until = time.monotonic() + self.interval / self.fill_rate
+
+
+class AIMDSemaphore:
+    """
+    Async semaphore whose limit adapts to server health (AIMD).
+    
+    The limit grows by 0.5 per request while the latency EMA stays within
+    ``target_latency`` and halves when it rises above it or the server
+    throttles (429/5xx, connection errors). Waiters and the in-flight count
+    are bound to the loop that created them and reset if the client moves
+    loops; the learned limit and latency EMA carry over.
+    """
+    
+    def __init__(
+        self,
+        initial: int = AIMD_INITIAL_CONCURRENCY,
+        minimum: int = AIMD_MIN_CONCURRENCY,
+        maximum: int = AIMD_MAX_CONCURRENCY,
+        target_latency: float = AIMD_TARGET_LATENCY,
+        window: int = AIMD_WINDOW
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self._limit = float(initial)
+        self._alpha = 2.0 / (window + 1)
+        self._latency_ema: Optional[float] = None
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent requests allowed."""
+        return int(self._limit)
+    
+    async def __aenter__(self) -> "AIMDSemaphore":
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._in_flight = 0
+            self._waiters.clear()
+        
+        while self._in_flight >= self.limit:
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # Pass on a wake-up this task can no longer use
+                self._wake()
+                raise
+        self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self._in_flight -= 1
+        self._wake()
+    
+    def record(self, latency: float, throttled: bool = False) -> None:
+        """Feed back one request outcome and adjust the limit."""
+        if not throttled:
+            ema = self._latency_ema
+            ema = latency if ema is None else ema + self._alpha * (latency - ema)
+            self._latency_ema = ema
+        
+        if throttled or self._latency_ema > self.target_latency:
+            self._limit = max(self.minimum, self._limit * 0.5)
+        else:
+            self._limit = min(self.maximum, self._limit + 0.5)
+        self._wake()
+    
+    def _wake(self) -> None:
+        """Release as many waiters as the current limit has room for."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+def _header_float(headers: httpx.Headers, name: str) -> Optional[float]:
+    """Read a numeric header, ignoring missing or malformed values."""
+    try:
+        return float(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _adf_paragraph_text(content: list) -> Iterator[str]:
+    """
+    Yield the text runs of every ADF paragraph, in document order.
+    
+    Paragraphs nested in lists, quotes or panels are reached with an explicit
+    stack of child iterators rather than recursion.
+    """
+    stack = deque([iter(content)])
+    while stack:
+        for node in stack[-1]:
+            if node.get("type") == "paragraph":
+                yield from (
+                    item["text"]
+                    for item in node.get("content", ())
+                    if item.get("type") == "text" and "text" in item
+                )
+            elif "content" in node:
+                stack.append(iter(node["content"]))
+                break
+        else:
+            stack.pop()
+
+
+@lru_cache(maxsize=256)
+def _build_jql(project: Optional[str], status: Optional[str], extra_jql: str) -> str:
+    """
+    Compose the search JQL for a project/status/extra-clause combination.
+    
+    Cached because dashboards repeat the same few filters; the returned string
+    doubles as the stable search-cache key.
+    """
+    # Build JQL - MUST have project restriction for new API
+    jql_parts = []
+    if project:
+        jql_parts.append(f'project = "{project}"')
+    else:
+        # Default to our projects
+        jql_parts.append('project in (PROD, STREAM, CONTENT)')
+    if status:
+        jql_parts.append(f'status = "{status}"')
+    
+    if extra_jql:
+        jql_parts.append(f"({extra_jql})")
+    
+    return " AND ".join(jql_parts) + " ORDER BY created DESC"
+
+
+def _first_search_page(payload: dict) -> dict:
+    """First search/jql page request for ``payload``."""
+    return {**payload, "maxResults": min(SEARCH_PAGE_SIZE, payload["maxResults"])}
+
+
+def _next_search_page(payload: dict, data: dict, received: int) -> Optional[dict]:
+    """Follow-up page request, or None once the results or the budget run out."""
+    token = data.get("nextPageToken")
+    remaining = payload["maxResults"] - received
+    if not token or data.get("isLast") or remaining <= 0:
+        return None
+    return {**payload, "maxResults": min(SEARCH_PAGE_SIZE, remaining), "nextPageToken": token}
+
+
+def _max_age(headers: httpx.Headers) -> float:
+    """Seconds allowed by the response's Cache-Control max-age (0 when absent)."""
+    match = _MAX_AGE_RE.search(headers.get("cache-control", ""))
+    return float(match.group(1)) if match else 0.0
+
+
+def _freeze(value: Any) -> Any:
+    """Store cached lists as tuples so callers cannot reorder or extend them."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _thaw(value: Any) -> Any:
+    """Hand out a cached tuple as a new list owned by the caller."""
+    return list(value) if isinstance(value, tuple) else value
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else 2**attempt, capped."""
+    return min(BACKOFF_MAX, _header_float(response.headers, "retry-after") or 2 ** attempt)
+
+
+def _should_retry(method: str, response: httpx.Response, attempt: int, waited: float) -> Optional[float]:
+    """Delay before retrying ``response``, or None when it must not be retried."""
+    status = response.status_code
+    if status not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+        return None
+    if status != 429 and method.upper() not in IDEMPOTENT_METHODS:
+        return None
+    delay = _retry_delay(response, attempt)
+    if waited + delay > RETRY_WAIT_BUDGET:
+        return None
+    return delay
+
+
+@dataclass(slots=True)
 class JiraIssue:
     """Standardized JIRA issue data."""
     key: str
@@ -52,7 +367,7 @@ class JiraIssue:
     severity: str = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfluencePage:
     """Standardized Confluence page data."""
     id: str
@@ -66,6 +381,168 @@ class ConfluencePage:
     url: Optional[str] = None
 
 
+# ==================== Mock Data ====================
+# Built once at import and indexed so mock lookups and filters skip a scan.
+
+# Fixed timestamp for mock-created issues/pages (deterministic, no clock read)
+_MOCK_TS = datetime(2024, 12, 17, 12, 0, 0).isoformat()
+
+_MOCK_ISSUES = [
+    JiraIssue(
+        key="PROD-101",
+        summary="Yellowstone S5 - Audio sync issue in final cut",
+        status="In Progress",
+        priority="Critical",
+        issue_type="Bug",
+        project="PROD",
+        assignee="John Editor",
+        reporter="Sarah Producer",
+        created="2024-12-10T10:30:00Z",
+        labels=["audio", "post-production", "urgent"],
+        show_name="Yellowstone",
+        cost_impact=450000,
+        delay_days=3,
+        severity="critical"
+    ),
+    JiraIssue(
+        key="PROD-102",
+        summary="1923 - VFX render farm capacity exceeded",
+        status="Open",
+        priority="High",
+        issue_type="Bug",
+        project="PROD",
+        assignee="Mike VFX",
+        created="2024-12-12T14:00:00Z",
+        labels=["vfx", "infrastructure", "scaling"],
+        show_name="1923",
+        cost_impact=325000,
+        delay_days=5,
+        severity="high"
+    ),
+    JiraIssue(
+        key="PROD-103",
+        summary="Star Trek SNW - Color grading revision needed",
+        status="In Review",
+        priority="Medium",
+        issue_type="Task",
+        project="PROD",
+        assignee="Lisa Colorist",
+        created="2024-12-14T09:00:00Z",
+        labels=["color", "post-production"],
+        show_name="Star Trek: Strange New Worlds",
+        cost_impact=85000,
+        delay_days=1,
+        severity="medium"
+    ),
+    JiraIssue(
+        key="PROD-104",
+        summary="Tulsa King - Location permit issue for S2 finale",
+        status="Blocked",
+        priority="Critical",
+        issue_type="Bug",
+        project="PROD",
+        created="2024-12-15T11:00:00Z",
+        labels=["legal", "locations", "blocking"],
+        show_name="Tulsa King",
+        cost_impact=750000,
+        delay_days=7,
+        severity="critical"
+    ),
+    JiraIssue(
+        key="PROD-105",
+        summary="Lioness - Stunt coordinator scheduling conflict",
+        status="Open",
+        priority="High",
+        issue_type="Task",
+        project="PROD",
+        created="2024-12-16T08:00:00Z",
+        labels=["scheduling", "stunts", "talent"],
+        show_name="Lioness",
+        cost_impact=180000,
+        delay_days=2,
+        severity="high"
+    ),
+    JiraIssue(
+        key="STREAM-201",
+        summary="CDN latency spike in Northeast region",
+        status="In Progress",
+        priority="Critical",
+        issue_type="Incident",
+        project="STREAM",
+        assignee="DevOps Team",
+        created="2024-12-17T06:00:00Z",
+        labels=["cdn", "performance", "p1"],
+        cost_impact=50000,
+        delay_days=0,
+        severity="critical"
+    ),
+    JiraIssue(
+        key="CONTENT-301",
+        summary="Q1 2025 Content Calendar - Final approval needed",
+        status="In Review",
+        priority="High",
+        issue_type="Task",
+        project="CONTENT",
+        created="2024-12-15T10:00:00Z",
+        labels=["planning", "q1-2025", "approval"],
+        cost_impact=0,
+        delay_days=0,
+        severity="medium"
+    ),
+]
+
+_MOCK_ISSUES_BY_KEY: Dict[str, JiraIssue] = {issue.key: issue for issue in _MOCK_ISSUES}
+_MOCK_ISSUES_BY_PROJECT: Dict[str, List[JiraIssue]] = {}
+for _issue in _MOCK_ISSUES:
+    _MOCK_ISSUES_BY_PROJECT.setdefault(_issue.project, []).append(_issue)
+
+_MOCK_PAGES = [
+    ConfluencePage(
+        id="page-001",
+        title="Production Runbook - Post-Production Workflow",
+        space_key="PROD",
+        status="current",
+        author="Operations Team",
+        created="2024-11-01T10:00:00Z"
+    ),
+    ConfluencePage(
+        id="page-002",
+        title="Streaming QoE Standards and Thresholds",
+        space_key="STREAM",
+        status="current",
+        author="Engineering Team",
+        created="2024-10-15T14:00:00Z"
+    ),
+    ConfluencePage(
+        id="page-003",
+        title="Content ROI Analysis Framework",
+        space_key="CONTENT",
+        status="current",
+        author="Analytics Team",
+        created="2024-09-20T09:00:00Z"
+    ),
+    ConfluencePage(
+        id="page-004",
+        title="Incident Response Playbook",
+        space_key="OPS",
+        status="current",
+        author="DevOps Team",
+        created="2024-08-10T11:00:00Z"
+    ),
+]
+
+_MOCK_PROJECTS = (
+    {"key": "PROD", "name": "Production Issues", "type": "software"},
+    {"key": "CONTENT", "name": "Content Management", "type": "software"},
+    {"key": "STREAM", "name": "Streaming Operations", "type": "software"},
+)
+
+_MOCK_PAGES_BY_ID: Dict[str, ConfluencePage] = {page.id: page for page in _MOCK_PAGES}
+_MOCK_PAGES_BY_SPACE: Dict[str, List[ConfluencePage]] = {}
+for _page in _MOCK_PAGES:
+    _MOCK_PAGES_BY_SPACE.setdefault(_page.space_key, []).append(_page)
+
+
 class AtlassianClient:
     """
     Client for JIRA and Confluence using mcp-atlassian.
@@ -91,8 +568,34 @@ class AtlassianClient:
         self.confluence_api_token = confluence_api_token
         self.mock_mode = mock_mode
         
-        # HTTP client for direct API calls
+        # Built once: BasicAuth encodes its Authorization header up front,
+        # so requests reuse it instead of re-encoding credentials each call
+        self._jira_auth = (
+            httpx.BasicAuth(jira_username, jira_api_token) if jira_username else None
+        )
+        self._confluence_auth = (
+            httpx.BasicAuth(confluence_username, confluence_api_token)
+            if confluence_username else None
+        )
+        
+        # HTTP clients for direct API calls (created lazily and reused so
+        # sync callers keep their pooled keep-alive connections)
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_client: Optional[httpx.Client] = None
+        
+        # Separate request budgets; JIRA and Confluence are limited independently
+        self._jira_limiter = AtlassianRateLimiter()
+        self._confluence_limiter = AtlassianRateLimiter()
+        
+        # Adaptive cap on concurrent async requests (e.g. gathered searches)
+        self._aimd = AIMDSemaphore()
+        
+        # Parsed JiraIssue/ConfluencePage results keyed by request, LRU-bounded;
+        # values are (expires_at, parsed_object, etag). The sync client is
+        # called from worker threads, so every access holds _cache_lock.
+        self._response_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         logger.info(
             f"AtlassianClient initialized",
@@ -103,20 +606,216 @@ class AtlassianClient:
             }
         )
     
-    def _get_jira_auth(self) -> tuple[str, str]:
-        """Get JIRA authentication tuple."""
-        return (self.jira_username, self.jira_api_token)
+    def _get_jira_auth(self) -> Optional[httpx.BasicAuth]:
+        """Get the shared JIRA basic-auth handler."""
+        return self._jira_auth
     
-    def _get_confluence_auth(self) -> tuple[str, str]:
-        """Get Confluence authentication tuple."""
-        return (self.confluence_username, self.confluence_api_token)
+    def _get_confluence_auth(self) -> Optional[httpx.BasicAuth]:
+        """Get the shared Confluence basic-auth handler."""
+        return self._confluence_auth
     
     async def _ensure_client(self) -> httpx.AsyncClient:
-        """Ensure HTTP client is initialized."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+        """Ensure the async HTTP client is initialized for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # Pooled connections cannot cross event loops, so rebuild when it
+            # changes, closing the pool left behind on the previous loop.
+            await self._close_async_client()
+            self._client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=True)
+            self._client_loop = loop
         return self._client
     
+    async def _close_async_client(self) -> None:
+        """Close and forget the async client, tolerating a pool from a dead loop."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Connections opened on an already-closed loop cannot be shut down
+            # gracefully; dropping them releases the sockets.
+            logger.debug(f"Discarded async client from a closed event loop: {e}")
+    
+    def _ensure_sync_client(self) -> httpx.Client:
+        """Ensure the pooled sync HTTP client is initialized."""
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, http2=True)
+        return self._sync_client
+    
+    def _request(
+        self,
+        limiter: AtlassianRateLimiter,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a rate-limited request on the shared sync client.
+        
+        429/502/503/504 responses to idempotent methods (only 429 for POST)
+        are retried up to ``MAX_RETRIES`` times, honoring a clamped
+        ``Retry-After``, until ``RETRY_WAIT_BUDGET`` seconds have been spent
+        waiting; other HTTP errors raise immediately.
+        """
+        client = self._ensure_sync_client()
+        waited = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            limiter.acquire_sync()
+            response = client.request(method, url, **kwargs)
+            limiter.update(response.headers)
+            delay = _should_retry(method, response, attempt, waited)
+            if delay is None:
+                break
+            logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay}s")
+            time.sleep(delay)
+            waited += delay
+        # 304 only answers a conditional request; the caller reuses its cached copy
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+    
+    async def _request_async(
+        self,
+        limiter: AtlassianRateLimiter,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Async variant of ``_request`` with the same retry policy.
+        
+        Requests also pass through the AIMD semaphore, which learns the
+        concurrency the server tolerates from latency and throttling.
+        """
+        client = await self._ensure_client()
+        waited = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            await limiter.acquire()
+            async with self._aimd:
+                started = time.monotonic()
+                try:
+                    response = await client.request(method, url, **kwargs)
+                except httpx.TransportError:
+                    self._aimd.record(time.monotonic() - started, throttled=True)
+                    raise
+            self._aimd.record(
+                time.monotonic() - started,
+                throttled=response.status_code in RETRY_STATUS_CODES
+            )
+            limiter.update(response.headers)
+            delay = _should_retry(method, response, attempt, waited)
+            if delay is None:
+                break
+            logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+            waited += delay
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+    
+    # ==================== Response Cache ====================
+    
+    def _cache_lookup(self, key: Hashable) -> tuple[Any, Optional[Dict[str, str]]]:
+        """
+        Look up a parsed response.
+        
+        Cached lists (searches, projects) come back as fresh lists, but the
+        ``JiraIssue``/``ConfluencePage`` objects and project dicts in them are
+        shared with the cache and must be treated as read-only.
+        
+        Returns:
+            ``(value, None)`` while the entry is fresh, otherwise
+            ``(None, headers)`` where headers carry ``If-None-Match`` for an
+            expired entry that has an ETag (``None`` when there is nothing
+            to revalidate).
+        """
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None, None
+            expires_at, value, etag = entry
+            fresh = expires_at > time.monotonic()
+            if fresh:
+                self._response_cache.move_to_end(key)
+        if fresh:
+            return _thaw(value), None
+        return None, ({"If-None-Match": etag} if etag else None)
+    
+    def _cache_response(
+        self,
+        key: Hashable,
+        response: httpx.Response,
+        parse: Callable[[Any], Any],
+        ttl: float = RESPONSE_CACHE_TTL
+    ) -> Any:
+        """Parse ``response`` (reusing the cached object on 304) and cache it."""
+        with self._cache_lock:
+            previous = self._response_cache.pop(key, None)
+        if response.status_code == 304 and previous is not None:
+            value, etag = _thaw(previous[1]), previous[2]
+        else:
+            value, etag = parse(orjson.loads(response.content)), None
+        etag = response.headers.get("etag") or etag
+        
+        return self._cache_store(key, value, max(ttl, _max_age(response.headers)), etag)
+    
+    def _fetch_cached(
+        self,
+        key: Hashable,
+        parse: Callable[[Any], Any],
+        limiter: AtlassianRateLimiter,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Any:
+        """GET ``url`` (conditionally when ``headers`` carry an ETag) and cache the parsed body."""
+        response = self._request(limiter, "GET", url, headers=headers, **kwargs)
+        if response.status_code == 304 and not self._cache_contains(key):
+            # The entry was evicted or invalidated while revalidating
+            response = self._request(limiter, "GET", url, **kwargs)
+        return self._cache_response(key, response, parse)
+    
+    async def _fetch_cached_async(
+        self,
+        key: Hashable,
+        parse: Callable[[Any], Any],
+        limiter: AtlassianRateLimiter,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Any:
+        """Async variant of ``_fetch_cached``."""
+        response = await self._request_async(limiter, "GET", url, headers=headers, **kwargs)
+        if response.status_code == 304 and not self._cache_contains(key):
+            response = await self._request_async(limiter, "GET", url, **kwargs)
+        return self._cache_response(key, response, parse)
+    
+    def _cache_store(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float,
+        etag: Optional[str] = None
+    ) -> Any:
+        """Cache an already-parsed value, evicting the least recently used entry."""
+        entry = (time.monotonic() + ttl, _freeze(value), etag)
+        with self._cache_lock:
+            self._response_cache[key] = entry
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return value
+    
+    def _cache_contains(self, key: Hashable) -> bool:
+        """Whether ``key`` still has a cached entry (fresh or expired)."""
+        with self._cache_lock:
+            return key in self._response_cache
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached JIRA/Confluence responses."""
+        with self._cache_lock:
+            self._response_cache.clear()
+    
     # ==================== Confluence Core Methods ====================
 
     _STATIC_SPACES = [
@@ -140,24 +839,25 @@ class AtlassianClient:
             return self._STATIC_SPACES
 
         try:
-            with httpx.Client(timeout=15.0) as client:
-                resp = client.get(
-                    f"{self.confluence_url}/wiki/rest/api/space",
-                    params={"limit": 50},
-                    auth=self._get_confluence_auth(),
-                )
-                resp.raise_for_status()
-                results = resp.json().get("results", [])
-                return [
-                    {
-                        "id": s.get("id", s.get("key", "")),
-                        "key": s.get("key", ""),
-                        "name": s.get("name", ""),
-                        "type": s.get("type", "global"),
-                        "url": f"{self.confluence_url}/wiki/spaces/{s.get('key', '')}",
-                    }
-                    for s in results
-                ]
+            resp = self._request(
+                self._confluence_limiter,
+                "GET",
+                f"{self.confluence_url}/wiki/rest/api/space",
+                params={"limit": 50},
+                auth=self._get_confluence_auth(),
+                timeout=15.0,
+            )
+            results = orjson.loads(resp.content).get("results", [])
+            return [
+                {
+                    "id": s.get("id", s.get("key", "")),
+                    "key": s.get("key", ""),
+                    "name": s.get("name", ""),
+                    "type": s.get("type", "global"),
+                    "url": f"{self.confluence_url}/wiki/spaces/{s.get('key', '')}",
+                }
+                for s in results
+            ]
         except Exception as e:
             logger.warning(f"Confluence spaces fetch failed, using static: {e}")
             return self._STATIC_SPACES
@@ -175,25 +875,26 @@ class AtlassianClient:
             cql += f' AND space = "{space_key}"'
 
         try:
-            with httpx.Client(timeout=15.0) as client:
-                resp = client.get(
-                    f"{self.confluence_url}/wiki/rest/api/content/search",
-                    params={"cql": cql, "limit": limit, "expand": "space,version"},
-                    auth=self._get_confluence_auth(),
-                )
-                resp.raise_for_status()
-                results = resp.json().get("results", [])
-                return [
-                    {
-                        "id": p.get("id", ""),
-                        "title": p.get("title", ""),
-                        "space_key": p.get("space", {}).get("key", space_key or ""),
-                        "url": f"{self.confluence_url}{p.get('_links', {}).get('webui', '')}",
-                        "created": p.get("history", {}).get("createdDate", ""),
-                        "updated": p.get("version", {}).get("when", ""),
-                    }
-                    for p in results
-                ]
+            resp = self._request(
+                self._confluence_limiter,
+                "GET",
+                f"{self.confluence_url}/wiki/rest/api/content/search",
+                params={"cql": cql, "limit": limit, "expand": "space,version"},
+                auth=self._get_confluence_auth(),
+                timeout=15.0,
+            )
+            results = orjson.loads(resp.content).get("results", [])
+            return [
+                {
+                    "id": p.get("id", ""),
+                    "title": p.get("title", ""),
+                    "space_key": p.get("space", {}).get("key", space_key or ""),
+                    "url": f"{self.confluence_url}{p.get('_links', {}).get('webui', '')}",
+                    "created": p.get("history", {}).get("createdDate", ""),
+                    "updated": p.get("version", {}).get("when", ""),
+                }
+                for p in results
+            ]
         except Exception as e:
             logger.warning(f"Confluence pages fetch failed, using static: {e}")
             pages = list(self._STATIC_PAGES)
@@ -207,7 +908,7 @@ class AtlassianClient:
             return {
                 "id": "999", "title": title, "space_key": space_key,
                 "url": f"/wiki/spaces/{space_key}/pages/999",
-                "created": datetime.now().isoformat(), "updated": datetime.now().isoformat(),
+                "created": _MOCK_TS, "updated": _MOCK_TS,
             }
 
         payload: Dict[str, Any] = {
@@ -220,22 +921,24 @@ class AtlassianClient:
             payload["ancestors"] = [{"id": parent_id}]
 
         try:
-            with httpx.Client(timeout=15.0) as client:
-                resp = client.post(
-                    f"{self.confluence_url}/wiki/rest/api/content",
-                    json=payload,
-                    auth=self._get_confluence_auth(),
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return {
-                    "id": data.get("id", ""),
-                    "title": data.get("title", title),
-                    "space_key": space_key,
-                    "url": f"{self.confluence_url}{data.get('_links', {}).get('webui', '')}",
-                    "created": data.get("history", {}).get("createdDate", datetime.now().isoformat()),
-                    "updated": data.get("version", {}).get("when", datetime.now().isoformat()),
-                }
+            resp = self._request(
+                self._confluence_limiter,
+                "POST",
+                f"{self.confluence_url}/wiki/rest/api/content",
+                content=orjson.dumps(payload),
+                auth=self._get_confluence_auth(),
+                headers=JSON_HEADERS,
+                timeout=15.0,
+            )
+            data = orjson.loads(resp.content)
+            return {
+                "id": data.get("id", ""),
+                "title": data.get("title", title),
+                "space_key": space_key,
+                "url": f"{self.confluence_url}{data.get('_links', {}).get('webui', '')}",
+                "created": data.get("history", {}).get("createdDate", datetime.now().isoformat()),
+                "updated": data.get("version", {}).get("when", datetime.now().isoformat()),
+            }
         except Exception as e:
             logger.error(f"Confluence page creation failed: {e}")
             raise
@@ -258,7 +961,8 @@ class AtlassianClient:
         jql: str = "",
         project: Optional[str] = None,
         status: Optional[str] = None,
-        max_results: int = 50
+        max_results: int = 50,
+        fields: tuple[str, ...] = None
     ) -> list[JiraIssue]:
         """
         Search JIRA issues using JQL.
@@ -268,6 +972,7 @@ class AtlassianClient:
             project: Filter by project key
             status: Filter by status
             max_results: Maximum results to return
+            fields: JIRA fields to request (defaults to ``_FULL_JIRA_FIELDS``)
             
         Returns:
             List of JiraIssue objects
@@ -275,81 +980,162 @@ class AtlassianClient:
         if self.mock_mode:
             return self._get_mock_issues(project, status, max_results)
         
-        return asyncio.run(self._search_issues_async(jql, project, status, max_results))
+        fields = fields or _FULL_JIRA_FIELDS
+        payload = self._search_payload(jql, project, status, max_results, fields)
+        key = ("search", payload["jql"], max_results, fields)
+        cached, _ = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            issues: list[JiraIssue] = []
+            page = _first_search_page(payload)
+            while page is not None:
+                data = self._post_search(page)
+                issues.extend(self._parse_search_results(data))
+                page = _next_search_page(payload, data, len(issues))
+            return self._cache_store(key, issues, SEARCH_CACHE_TTL)
+        except Exception as e:
+            logger.error(f"JIRA search failed: {e}")
+            return self._get_mock_issues(project, status, max_results)
     
-    async def _search_issues_async(
+    def _search_payload(
         self,
         jql: str,
         project: Optional[str],
         status: Optional[str],
-        max_results: int
+        max_results: int,
+        fields: tuple[str, ...] = None
+    ) -> dict:
+        """Build the search/jql request body shared by the sync and async paths."""
+        return {
+            "jql": _build_jql(project, status, jql),
+            "maxResults": max_results,
+            "fields": fields or _FULL_JIRA_FIELDS
+        }
+    
+    async def search_issues_async(
+        self,
+        jql: str = "",
+        project: Optional[str] = None,
+        status: Optional[str] = None,
+        max_results: int = 50,
+        fields: tuple[str, ...] = None
     ) -> list[JiraIssue]:
-        """Async implementation of issue search using new JIRA API."""
-        client = await self._ensure_client()
-        
-        # Build JQL - MUST have project restriction for new API
-        jql_parts = []
-        if project:
-            jql_parts.append(f'project = "{project}"')
-        else:
-            # Default to our projects
-            jql_parts.append('project in (PROD, STREAM, CONTENT)')
-        if status:
-            jql_parts.append(f'status = "{status}"')
-        
-        if jql:
-            jql_parts.append(f"({jql})")
+        """Async variant of ``search_issues`` for callers already on an event loop."""
+        if self.mock_mode:
+            return self._get_mock_issues(project, status, max_results)
         
-        jql_parts.append("ORDER BY created DESC")
-        final_jql = " AND ".join(jql_parts[:-1]) + " " + jql_parts[-1]
+        fields = fields or _FULL_JIRA_FIELDS
+        payload = self._search_payload(jql, project, status, max_results, fields)
+        key = ("search", payload["jql"], max_results, fields)
+        cached, _ = self._cache_lookup(key)
+        if cached is not None:
+            return cached
         
+        issues: list[JiraIssue] = []
+        pending = asyncio.create_task(self._post_search_async(_first_search_page(payload)))
         try:
-            # Use new search/jql API (old /search is deprecated)
-            response = await client.post(
-                f"{self.jira_url}/rest/api/3/search/jql",
-                json={
-                    "jql": final_jql,
-                    "maxResults": max_results,
-                    "fields": ["summary", "status", "priority", "issuetype", "project", 
-                              "assignee", "reporter", "created", "updated", "description", 
-                              "labels", "components"]
-                },
-                auth=self._get_jira_auth(),
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            return [self._parse_jira_issue(issue) for issue in data.get("issues", [])]
+            while pending is not None:
+                data = await pending
+                received = len(issues) + len(data.get("issues", ()))
+                page = _next_search_page(payload, data, received)
+                if page is not None:
+                    # Put the next page on the wire before parsing this one
+                    pending = asyncio.create_task(self._post_search_async(page))
+                    await asyncio.sleep(0)
+                else:
+                    pending = None
+                issues.extend(self._parse_search_results(data))
+            return self._cache_store(key, issues, SEARCH_CACHE_TTL)
             
         except Exception as e:
+            if pending is not None:
+                pending.cancel()
             logger.error(f"JIRA search failed: {e}")
             if not self.mock_mode:
                 return self._get_mock_issues(project, status, max_results)
             return []
     
+    def _post_search(self, page: dict) -> dict:
+        """POST one search/jql page and return the decoded body."""
+        # Use new search/jql API (old /search is deprecated)
+        response = self._request(
+            self._jira_limiter,
+            "POST",
+            f"{self.jira_url}/rest/api/3/search/jql",
+            content=orjson.dumps(page),
+            auth=self._get_jira_auth(),
+            headers=JSON_HEADERS
+        )
+        return orjson.loads(response.content)
+    
+    async def _post_search_async(self, page: dict) -> dict:
+        """Async variant of ``_post_search``."""
+        response = await self._request_async(
+            self._jira_limiter,
+            "POST",
+            f"{self.jira_url}/rest/api/3/search/jql",
+            content=orjson.dumps(page),
+            auth=self._get_jira_auth(),
+            headers=JSON_HEADERS
+        )
+        return orjson.loads(response.content)
+    
+    async def _search_issues_many_async(self, queries: list[dict]) -> list[list[JiraIssue]]:
+        """
+        Run several issue searches concurrently.
+        
+        Args:
+            queries: Keyword arguments for ``search_issues_async``, one dict per search
+            
+        Returns:
+            One result list per query, in the same order
+        """
+        return await asyncio.gather(*(self.search_issues_async(**query) for query in queries))
+    
     def get_issue(self, issue_key: str) -> Optional[JiraIssue]:
         """Get a specific JIRA issue by key."""
         if self.mock_mode:
-            issues = self._get_mock_issues()
-            for issue in issues:
-                if issue.key == issue_key:
-                    return issue
-            return None
+            return _MOCK_ISSUES_BY_KEY.get(issue_key)
         
-        return asyncio.run(self._get_issue_async(issue_key))
+        key = ("issue", issue_key)
+        cached, headers = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            return self._fetch_cached(
+                key,
+                self._parse_jira_issue,
+                self._jira_limiter,
+                f"{self.jira_url}/rest/api/3/issue/{issue_key}",
+                auth=self._get_jira_auth(),
+                headers=headers
+            )
+        except Exception as e:
+            logger.error(f"Failed to get issue {issue_key}: {e}")
+            return None
     
-    async def _get_issue_async(self, issue_key: str) -> Optional[JiraIssue]:
-        """Async implementation of get issue."""
-        client = await self._ensure_client()
+    async def get_issue_async(self, issue_key: str) -> Optional[JiraIssue]:
+        """Async variant of ``get_issue``."""
+        if self.mock_mode:
+            return _MOCK_ISSUES_BY_KEY.get(issue_key)
+        
+        key = ("issue", issue_key)
+        cached, headers = self._cache_lookup(key)
+        if cached is not None:
+            return cached
         
         try:
-            response = await client.get(
+            return await self._fetch_cached_async(
+                key,
+                self._parse_jira_issue,
+                self._jira_limiter,
                 f"{self.jira_url}/rest/api/3/issue/{issue_key}",
-                auth=self._get_jira_auth()
+                auth=self._get_jira_auth(),
+                headers=headers
             )
-            response.raise_for_status()
-            return self._parse_jira_issue(response.json())
             
         except Exception as e:
             logger.error(f"Failed to get issue {issue_key}: {e}")
@@ -367,24 +1153,30 @@ class AtlassianClient:
     ) -> Optional[JiraIssue]:
         """Create a new JIRA issue."""
         if self.mock_mode:
-            # Return a mock created issue
-            return JiraIssue(
-                key=f"{project}-999",
-                summary=summary,
-                status="To Do",
-                priority=priority,
-                issue_type=issue_type,
-                project=project,
-                description=description,
-                labels=labels or [],
-                created=datetime.now().isoformat()
-            )
+            return self._mock_created_issue(project, summary, issue_type, description, priority, labels)
         
-        return asyncio.run(self._create_issue_async(
+        payload = self._issue_payload(
             project, summary, issue_type, description, priority, labels, custom_fields
-        ))
+        )
+        try:
+            response = self._request(
+                self._jira_limiter,
+                "POST",
+                f"{self.jira_url}/rest/api/3/issue",
+                content=orjson.dumps(payload),
+                auth=self._get_jira_auth(),
+                headers=JSON_HEADERS
+            )
+            # Cached searches no longer reflect the project
+            self.invalidate_cache()
+            return self._created_issue(
+                orjson.loads(response.content), project, summary, issue_type, description, priority, labels
+            )
+        except Exception as e:
+            logger.error(f"Failed to create issue: {e}")
+            return None
     
-    async def _create_issue_async(
+    def _issue_payload(
         self,
         project: str,
         summary: str,
@@ -393,10 +1185,8 @@ class AtlassianClient:
         priority: str,
         labels: list[str],
         custom_fields: dict
-    ) -> Optional[JiraIssue]:
-        """Async implementation of create issue."""
-        client = await self._ensure_client()
-        
+    ) -> dict:
+        """Build the create-issue request body shared by the sync and async paths."""
         payload = {
             "fields": {
                 "project": {"key": project},
@@ -419,17 +1209,92 @@ class AtlassianClient:
         if custom_fields:
             payload["fields"].update(custom_fields)
         
+        return payload
+    
+    def _created_issue(
+        self,
+        data: dict,
+        project: str,
+        summary: str,
+        issue_type: str,
+        description: str,
+        priority: str,
+        labels: list[str]
+    ) -> JiraIssue:
+        """
+        Build the created issue from the POST response without re-fetching it.
+        
+        JIRA answers with ``{"id", "key", "self"}``; the remaining fields are
+        what we just sent, so only parse the body when it carries ``fields``.
+        """
+        if "fields" in data:
+            return self._parse_jira_issue(data)
+        return JiraIssue(
+            key=data["key"],
+            summary=summary,
+            status="To Do",
+            priority=priority,
+            issue_type=issue_type,
+            project=project,
+            description=description,
+            labels=labels or [],
+            created=datetime.now().isoformat()
+        )
+    
+    def _mock_created_issue(
+        self,
+        project: str,
+        summary: str,
+        issue_type: str,
+        description: str,
+        priority: str,
+        labels: list[str]
+    ) -> JiraIssue:
+        """Return a mock created issue."""
+        return JiraIssue(
+            key=f"{project}-999",
+            summary=summary,
+            status="To Do",
+            priority=priority,
+            issue_type=issue_type,
+            project=project,
+            description=description,
+            labels=labels or [],
+            created=_MOCK_TS
+        )
+    
+    async def create_issue_async(
+        self,
+        project: str,
+        summary: str,
+        issue_type: str = "Task",
+        description: str = "",
+        priority: str = "Medium",
+        labels: list[str] = None,
+        custom_fields: dict = None
+    ) -> Optional[JiraIssue]:
+        """Async variant of ``create_issue``."""
+        if self.mock_mode:
+            return self._mock_created_issue(project, summary, issue_type, description, priority, labels)
+        
+        payload = self._issue_payload(
+            project, summary, issue_type, description, priority, labels, custom_fields
+        )
+        
         try:
-            response = await client.post(
+            response = await self._request_async(
+                self._jira_limiter,
+                "POST",
                 f"{self.jira_url}/rest/api/3/issue",
-                json=payload,
-                auth=self._get_jira_auth()
+                content=orjson.dumps(payload),
+                auth=self._get_jira_auth(),
+                headers=JSON_HEADERS
+            )
+            # Cached searches no longer reflect the project
+            self.invalidate_cache()
+            return self._created_issue(
+                orjson.loads(response.content), project, summary, issue_type, description, priority, labels
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            # Fetch the created issue
-            return await self._get_issue_async(data["key"])
             
         except Exception as e:
             logger.error(f"Failed to create issue: {e}")
@@ -438,25 +1303,43 @@ class AtlassianClient:
     def get_projects(self) -> list[dict]:
         """Get all JIRA projects."""
         if self.mock_mode:
-            return [
-                {"key": "PROD", "name": "Production Issues", "type": "software"},
-                {"key": "CONTENT", "name": "Content Management", "type": "software"},
-                {"key": "STREAM", "name": "Streaming Operations", "type": "software"},
-            ]
+            return list(_MOCK_PROJECTS)
+        
+        cached, headers = self._cache_lookup("projects")
+        if cached is not None:
+            return cached
         
-        return asyncio.run(self._get_projects_async())
+        try:
+            return self._fetch_cached(
+                "projects",
+                list,
+                self._jira_limiter,
+                f"{self.jira_url}/rest/api/3/project",
+                auth=self._get_jira_auth(),
+                headers=headers
+            )
+        except Exception as e:
+            logger.error(f"Failed to get projects: {e}")
+            return []
     
-    async def _get_projects_async(self) -> list[dict]:
-        """Async implementation of get projects."""
-        client = await self._ensure_client()
+    async def get_projects_async(self) -> list[dict]:
+        """Async variant of ``get_projects``."""
+        if self.mock_mode:
+            return list(_MOCK_PROJECTS)
+        
+        cached, headers = self._cache_lookup("projects")
+        if cached is not None:
+            return cached
         
         try:
-            response = await client.get(
+            return await self._fetch_cached_async(
+                "projects",
+                list,
+                self._jira_limiter,
                 f"{self.jira_url}/rest/api/3/project",
-                auth=self._get_jira_auth()
+                auth=self._get_jira_auth(),
+                headers=headers
             )
-            response.raise_for_status()
-            return response.json()
         except Exception as e:
             logger.error(f"Failed to get projects: {e}")
             return []
@@ -473,37 +1356,57 @@ class AtlassianClient:
         if self.mock_mode:
             return self._get_mock_pages(query, space_key)
         
-        return asyncio.run(self._search_pages_async(query, space_key, max_results))
+        try:
+            response = self._request(
+                self._confluence_limiter,
+                "GET",
+                f"{self.confluence_url}/wiki/rest/api/content/search",
+                params=self._search_pages_params(query, space_key, max_results),
+                auth=self._get_confluence_auth()
+            )
+            return [self._parse_confluence_page(page) for page in orjson.loads(response.content).get("results", [])]
+        except Exception as e:
+            logger.error(f"Confluence search failed: {e}")
+            return []
     
-    async def _search_pages_async(
+    def _search_pages_params(
         self,
         query: str,
         space_key: Optional[str],
         max_results: int
-    ) -> list[ConfluencePage]:
-        """Async implementation of page search."""
-        client = await self._ensure_client()
-        
+    ) -> dict:
+        """Build the CQL search parameters shared by the sync and async paths."""
         cql_parts = ['type = "page"']
         if query:
             cql_parts.append(f'text ~ "{query}"')
         if space_key:
             cql_parts.append(f'space = "{space_key}"')
         
-        cql = " AND ".join(cql_parts)
+        return {
+            "cql": " AND ".join(cql_parts),
+            "limit": max_results,
+            "expand": "space,version,body.storage"
+        }
+    
+    async def search_pages_async(
+        self,
+        query: str = "",
+        space_key: Optional[str] = None,
+        max_results: int = 25
+    ) -> list[ConfluencePage]:
+        """Async variant of ``search_pages``."""
+        if self.mock_mode:
+            return self._get_mock_pages(query, space_key)
         
         try:
-            response = await client.get(
+            response = await self._request_async(
+                self._confluence_limiter,
+                "GET",
                 f"{self.confluence_url}/wiki/rest/api/content/search",
-                params={
-                    "cql": cql,
-                    "limit": max_results,
-                    "expand": "space,version,body.storage"
-                },
+                params=self._search_pages_params(query, space_key, max_results),
                 auth=self._get_confluence_auth()
             )
-            response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             return [self._parse_confluence_page(page) for page in data.get("results", [])]
             
@@ -514,26 +1417,47 @@ class AtlassianClient:
     def get_page(self, page_id: str) -> Optional[ConfluencePage]:
         """Get a specific Confluence page."""
         if self.mock_mode:
-            pages = self._get_mock_pages()
-            for page in pages:
-                if page.id == page_id:
-                    return page
-            return None
+            return _MOCK_PAGES_BY_ID.get(page_id)
         
-        return asyncio.run(self._get_page_async(page_id))
+        key = ("page", page_id)
+        cached, headers = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            return self._fetch_cached(
+                key,
+                self._parse_confluence_page,
+                self._confluence_limiter,
+                f"{self.confluence_url}/wiki/rest/api/content/{page_id}",
+                params={"expand": "space,version,body.storage"},
+                auth=self._get_confluence_auth(),
+                headers=headers
+            )
+        except Exception as e:
+            logger.error(f"Failed to get page {page_id}: {e}")
+            return None
     
-    async def _get_page_async(self, page_id: str) -> Optional[ConfluencePage]:
-        """Async implementation of get page."""
-        client = await self._ensure_client()
+    async def get_page_async(self, page_id: str) -> Optional[ConfluencePage]:
+        """Async variant of ``get_page``."""
+        if self.mock_mode:
+            return _MOCK_PAGES_BY_ID.get(page_id)
+        
+        key = ("page", page_id)
+        cached, headers = self._cache_lookup(key)
+        if cached is not None:
+            return cached
         
         try:
-            response = await client.get(
+            return await self._fetch_cached_async(
+                key,
+                self._parse_confluence_page,
+                self._confluence_limiter,
                 f"{self.confluence_url}/wiki/rest/api/content/{page_id}",
                 params={"expand": "space,version,body.storage"},
-                auth=self._get_confluence_auth()
+                auth=self._get_confluence_auth(),
+                headers=headers
             )
-            response.raise_for_status()
-            return self._parse_confluence_page(response.json())
             
         except Exception as e:
             logger.error(f"Failed to get page {page_id}: {e}")
@@ -548,27 +1472,31 @@ class AtlassianClient:
     ) -> Optional[ConfluencePage]:
         """Create a new Confluence page."""
         if self.mock_mode:
-            return ConfluencePage(
-                id="mock-999",
-                title=title,
-                space_key=space_key,
-                status="current",
-                body=body,
-                created=datetime.now().isoformat()
-            )
+            return self._mock_created_page(space_key, title, body)
         
-        return asyncio.run(self._create_page_async(space_key, title, body, parent_id))
+        try:
+            response = self._request(
+                self._confluence_limiter,
+                "POST",
+                f"{self.confluence_url}/wiki/rest/api/content",
+                content=orjson.dumps(self._page_payload(space_key, title, body, parent_id)),
+                auth=self._get_confluence_auth(),
+                headers=JSON_HEADERS
+            )
+            self.invalidate_cache()
+            return self._parse_confluence_page(orjson.loads(response.content))
+        except Exception as e:
+            logger.error(f"Failed to create page: {e}")
+            return None
     
-    async def _create_page_async(
+    def _page_payload(
         self,
         space_key: str,
         title: str,
         body: str,
         parent_id: Optional[str]
-    ) -> Optional[ConfluencePage]:
-        """Async implementation of create page."""
-        client = await self._ensure_client()
-        
+    ) -> dict:
+        """Build the create-page request body shared by the sync and async paths."""
         payload = {
             "type": "page",
             "title": title,
@@ -584,14 +1512,41 @@ class AtlassianClient:
         if parent_id:
             payload["ancestors"] = [{"id": parent_id}]
         
+        return payload
+    
+    def _mock_created_page(self, space_key: str, title: str, body: str) -> ConfluencePage:
+        """Return a mock created page."""
+        return ConfluencePage(
+            id="mock-999",
+            title=title,
+            space_key=space_key,
+            status="current",
+            body=body,
+            created=_MOCK_TS
+        )
+    
+    async def create_page_async(
+        self,
+        space_key: str,
+        title: str,
+        body: str,
+        parent_id: Optional[str] = None
+    ) -> Optional[ConfluencePage]:
+        """Async variant of ``create_page``."""
+        if self.mock_mode:
+            return self._mock_created_page(space_key, title, body)
+        
         try:
-            response = await client.post(
+            response = await self._request_async(
+                self._confluence_limiter,
+                "POST",
                 f"{self.confluence_url}/wiki/rest/api/content",
-                json=payload,
-                auth=self._get_confluence_auth()
+                content=orjson.dumps(self._page_payload(space_key, title, body, parent_id)),
+                auth=self._get_confluence_auth(),
+                headers=JSON_HEADERS
             )
-            response.raise_for_status()
-            return self._parse_confluence_page(response.json())
+            self.invalidate_cache()
+            return self._parse_confluence_page(orjson.loads(response.content))
             
         except Exception as e:
             logger.error(f"Failed to create page: {e}")
@@ -601,24 +1556,30 @@ class AtlassianClient:
     
     def _parse_jira_issue(self, data: dict) -> JiraIssue:
         """Parse JIRA API response into JiraIssue."""
-        fields = data.get("fields", {})
+        fields = data.get("fields") or _EMPTY
+        assignee = fields.get("assignee") or _EMPTY
+        reporter = fields.get("reporter") or _EMPTY
         
         return JiraIssue(
             key=data.get("key", ""),
             summary=fields.get("summary", ""),
-            status=fields.get("status", {}).get("name", "Unknown"),
-            priority=fields.get("priority", {}).get("name", "Medium"),
-            issue_type=fields.get("issuetype", {}).get("name", "Task"),
-            project=fields.get("project", {}).get("key", ""),
-            assignee=fields.get("assignee", {}).get("displayName") if fields.get("assignee") else None,
-            reporter=fields.get("reporter", {}).get("displayName") if fields.get("reporter") else None,
+            status=(fields.get("status") or _EMPTY).get("name", "Unknown"),
+            priority=(fields.get("priority") or _EMPTY).get("name", "Medium"),
+            issue_type=(fields.get("issuetype") or _EMPTY).get("name", "Task"),
+            project=(fields.get("project") or _EMPTY).get("key", ""),
+            assignee=assignee.get("displayName"),
+            reporter=reporter.get("displayName"),
             created=fields.get("created"),
             updated=fields.get("updated"),
             description=self._extract_description(fields.get("description")),
-            labels=fields.get("labels", []),
-            components=[c.get("name", "") for c in fields.get("components", [])]
+            labels=fields.get("labels") or [],
+            components=[c["name"] for c in fields.get("components") or () if "name" in c]
         )
     
+    def _parse_search_results(self, data: dict) -> list[JiraIssue]:
+        """Parse a search/jql response body into JiraIssue objects."""
+        return [self._parse_jira_issue(issue) for issue in data.get("issues", [])]
+    
     def _extract_description(self, desc: any) -> str:
         """Extract plain text from Atlassian Document Format."""
         if not desc:
@@ -627,28 +1588,24 @@ class AtlassianClient:
             return desc
         if isinstance(desc, dict):
             # ADF format
-            content = desc.get("content", [])
-            texts = []
-            for block in content:
-                if block.get("type") == "paragraph":
-                    for item in block.get("content", []):
-                        if item.get("type") == "text":
-                            texts.append(item.get("text", ""))
-            return " ".join(texts)
+            return " ".join(_adf_paragraph_text(desc.get("content", ())))
         return str(desc)
     
     def _parse_confluence_page(self, data: dict) -> ConfluencePage:
         """Parse Confluence API response into ConfluencePage."""
+        history = data.get("history") or _EMPTY
+        storage = (data.get("body") or _EMPTY).get("storage") or _EMPTY
+        
         return ConfluencePage(
             id=data.get("id", ""),
             title=data.get("title", ""),
-            space_key=data.get("space", {}).get("key", ""),
+            space_key=(data.get("space") or _EMPTY).get("key", ""),
             status=data.get("status", ""),
-            created=data.get("history", {}).get("createdDate"),
-            updated=data.get("version", {}).get("when"),
-            author=data.get("history", {}).get("createdBy", {}).get("displayName"),
-            body=data.get("body", {}).get("storage", {}).get("value", ""),
-            url=data.get("_links", {}).get("webui", "")
+            created=history.get("createdDate"),
+            updated=(data.get("version") or _EMPTY).get("when"),
+            author=(history.get("createdBy") or _EMPTY).get("displayName"),
+            body=storage.get("value", ""),
+            url=(data.get("_links") or _EMPTY).get("webui", "")
         )
     
     # ==================== Mock Data ====================
@@ -659,186 +1616,90 @@ class AtlassianClient:
         status: Optional[str] = None,
         max_results: int = 50
     ) -> list[JiraIssue]:
-        """Generate realistic mock JIRA issues for Paramount Media Ops."""
-        mock_issues = [
-            JiraIssue(
-                key="PROD-101",
-                summary="Yellowstone S5 - Audio sync issue in final cut",
-                status="In Progress",
-                priority="Critical",
-                issue_type="Bug",
-                project="PROD",
-                assignee="John Editor",
-                reporter="Sarah Producer",
-                created="2024-12-10T10:30:00Z",
-                labels=["audio", "post-production", "urgent"],
-                show_name="Yellowstone",
-                cost_impact=450000,
-                delay_days=3,
-                severity="critical"
-            ),
-            JiraIssue(
-                key="PROD-102",
-                summary="1923 - VFX render farm capacity exceeded",
-                status="Open",
-                priority="High",
-                issue_type="Bug",
-                project="PROD",
-                assignee="Mike VFX",
-                created="2024-12-12T14:00:00Z",
-                labels=["vfx", "infrastructure", "scaling"],
-                show_name="1923",
-                cost_impact=325000,
-                delay_days=5,
-                severity="high"
-            ),
-            JiraIssue(
-                key="PROD-103",
-                summary="Star Trek SNW - Color grading revision needed",
-                status="In Review",
-                priority="Medium",
-                issue_type="Task",
-                project="PROD",
-                assignee="Lisa Colorist",
-                created="2024-12-14T09:00:00Z",
-                labels=["color", "post-production"],
-                show_name="Star Trek: Strange New Worlds",
-                cost_impact=85000,
-                delay_days=1,
-                severity="medium"
-            ),
-            JiraIssue(
-                key="PROD-104",
-                summary="Tulsa King - Location permit issue for S2 finale",
-                status="Blocked",
-                priority="Critical",
-                issue_type="Bug",
-                project="PROD",
-                created="2024-12-15T11:00:00Z",
-                labels=["legal", "locations", "blocking"],
-                show_name="Tulsa King",
-                cost_impact=750000,
-                delay_days=7,
-                severity="critical"
-            ),
-            JiraIssue(
-                key="PROD-105",
-                summary="Lioness - Stunt coordinator scheduling conflict",
-                status="Open",
-                priority="High",
-                issue_type="Task",
-                project="PROD",
-                created="2024-12-16T08:00:00Z",
-                labels=["scheduling", "stunts", "talent"],
-                show_name="Lioness",
-                cost_impact=180000,
-                delay_days=2,
-                severity="high"
-            ),
-            JiraIssue(
-                key="STREAM-201",
-                summary="CDN latency spike in Northeast region",
-                status="In Progress",
-                priority="Critical",
-                issue_type="Incident",
-                project="STREAM",
-                assignee="DevOps Team",
-                created="2024-12-17T06:00:00Z",
-                labels=["cdn", "performance", "p1"],
-                cost_impact=50000,
-                delay_days=0,
-                severity="critical"
-            ),
-            JiraIssue(
-                key="CONTENT-301",
-                summary="Q1 2025 Content Calendar - Final approval needed",
-                status="In Review",
-                priority="High",
-                issue_type="Task",
-                project="CONTENT",
-                created="2024-12-15T10:00:00Z",
-                labels=["planning", "q1-2025", "approval"],
-                cost_impact=0,
-                delay_days=0,
-                severity="medium"
-            ),
-        ]
-        
-        # Apply filters
-        filtered = mock_issues
-        if project:
-            filtered = [i for i in filtered if i.project == project]
-        if status:
-            filtered = [i for i in filtered if i.status.lower() == status.lower()]
-        
-        return filtered[:max_results]
+        """Filter the realistic mock JIRA issues for Paramount Media Ops."""
+        candidates = _MOCK_ISSUES_BY_PROJECT.get(project, []) if project else _MOCK_ISSUES
+        if not status:
+            return candidates[:max_results]
+        
+        # One pass that stops once max_results matches are found
+        status_lc = status.lower()
+        return list(islice((i for i in candidates if i.status.lower() == status_lc), max_results))
     
     def _get_mock_pages(
         self,
         query: str = "",
         space_key: Optional[str] = None
     ) -> list[ConfluencePage]:
-        """Generate mock Confluence pages."""
-        mock_pages = [
-            ConfluencePage(
-                id="page-001",
-                title="Production Runbook - Post-Production Workflow",
-                space_key="PROD",
-                status="current",
-                author="Operations Team",
-                created="2024-11-01T10:00:00Z"
-            ),
-            ConfluencePage(
-                id="page-002",
-                title="Streaming QoE Standards and Thresholds",
-                space_key="STREAM",
-                status="current",
-                author="Engineering Team",
-                created="2024-10-15T14:00:00Z"
-            ),
-            ConfluencePage(
-                id="page-003",
-                title="Content ROI Analysis Framework",
-                space_key="CONTENT",
-                status="current",
-                author="Analytics Team",
-                created="2024-09-20T09:00:00Z"
-            ),
-            ConfluencePage(
-                id="page-004",
-                title="Incident Response Playbook",
-                space_key="OPS",
-                status="current",
-                author="DevOps Team",
-                created="2024-08-10T11:00:00Z"
-            ),
-        ]
-        
-        filtered = mock_pages
-        if space_key:
-            filtered = [p for p in filtered if p.space_key == space_key]
+        """Filter the mock Confluence pages."""
+        filtered = _MOCK_PAGES_BY_SPACE.get(space_key, []) if space_key else _MOCK_PAGES
         if query:
             query_lower = query.lower()
             filtered = [p for p in filtered if query_lower in p.title.lower()]
         
-        return filtered
+        return list(filtered)
     
     # ==================== Pareto Analysis Integration ====================
     
     def get_issues_for_pareto_analysis(
         self,
         project: Optional[str] = None,
-        days_back: int = 30
+        days_back: int = 30,
+        projects: Optional[list[str]] = None
     ) -> list[dict]:
         """
         Get issues formatted for Pareto analysis.
         
+        Args:
+            project: Single project key to analyze
+            days_back: Lookback window in days
+            projects: Several project keys; searched concurrently in one batch
+        
         Returns data suitable for the ParetoCalculator:
         - Items sorted by impact
         - Includes cost and delay metrics
         """
-        issues = self.search_issues(project=project, max_results=100)
+        if projects and not self.mock_mode:
+            return self._run_batch(self.get_issues_for_pareto_analysis_async(
+                project, days_back, projects
+            ))
+        if projects:
+            issues = [
+                issue
+                for key in projects
+                for issue in self._get_mock_issues(key, None, 100)
+            ]
+        else:
+            issues = self.search_issues(
+                project=project, max_results=100, fields=_PARETO_JIRA_FIELDS
+            )
+        
+        return self._pareto_rows(issues)
+    
+    async def get_issues_for_pareto_analysis_async(
+        self,
+        project: Optional[str] = None,
+        days_back: int = 30,
+        projects: Optional[list[str]] = None
+    ) -> list[dict]:
+        """Async variant of ``get_issues_for_pareto_analysis``."""
+        if projects:
+            results = await self._search_issues_many_async(
+                [
+                    {"project": key, "max_results": 100, "fields": _PARETO_JIRA_FIELDS}
+                    for key in projects
+                ]
+            )
+            issues = [issue for batch in results for issue in batch]
+        else:
+            issues = await self.search_issues_async(
+                project=project, max_results=100, fields=_PARETO_JIRA_FIELDS
+            )
         
+        return self._pareto_rows(issues)
+    
+    @staticmethod
+    def _pareto_rows(issues: list[JiraIssue]) -> list[dict]:
+        """Format issues as ParetoCalculator rows, highest cost impact first."""
         pareto_data = []
         for issue in issues:
             pareto_data.append({
@@ -861,32 +1722,64 @@ class AtlassianClient:
         """Get summary of issue costs for executive reporting."""
         issues = self.search_issues(max_results=100)
         
-        total_cost = sum(i.cost_impact for i in issues)
-        critical_cost = sum(i.cost_impact for i in issues if i.severity == "critical")
-        by_show = {}
+        total_cost = 0
+        critical_cost = 0
+        by_show = defaultdict(lambda: {"count": 0, "cost": 0, "delay_days": 0})
         
         for issue in issues:
-            show = issue.show_name or "Other"
-            if show not in by_show:
-                by_show[show] = {"count": 0, "cost": 0, "delay_days": 0}
-            by_show[show]["count"] += 1
-            by_show[show]["cost"] += issue.cost_impact
-            by_show[show]["delay_days"] += issue.delay_days
+            cost = issue.cost_impact
+            total_cost += cost
+            if issue.severity == "critical":
+                critical_cost += cost
+            show = by_show[issue.show_name or "Other"]
+            show["count"] += 1
+            show["cost"] += cost
+            show["delay_days"] += issue.delay_days
         
         return {
             "total_issues": len(issues),
             "total_cost_impact": total_cost,
             "critical_cost_impact": critical_cost,
-            "by_show": by_show,
+            "by_show": dict(by_show),
             "top_issues": [
                 {"key": i.key, "summary": i.summary, "cost": i.cost_impact}
-                for i in sorted(issues, key=lambda x: x.cost_impact, reverse=True)[:5]
+                for i in heapq.nlargest(5, issues, key=lambda x: x.cost_impact)
             ]
         }
     
+    def _run_batch(self, coro):
+        """
+        Run a batched coroutine from sync code.
+        
+        The batch gets its own loop, so the async client it opens is closed
+        before that loop ends. AIMD limits learned during the batch carry
+        over to the next one.
+        
+        Raises:
+            RuntimeError: When called from a running event loop; async callers
+                must await the ``*_async`` variant instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._scoped_batch(coro))
+        coro.close()
+        raise RuntimeError(
+            "AtlassianClient sync batch methods cannot run inside an event loop; "
+            "await the *_async variant instead"
+        )
+    
+    async def _scoped_batch(self, coro):
+        """Await ``coro``, then close the loop-bound async client."""
+        try:
+            return await coro
+        finally:
+            await self._close_async_client()
+    
     async def close(self):
-        """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Close the HTTP clients."""
+        await self._close_async_client()
+        if self._sync_client:
+            self._sync_client.close()
+            self._sync_client = None
 
@@ -4,10 +4,49 @@ Content API client for catalog and performance data.
 Provides interface to content API with mock mode support.
 """
 
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
 from config import settings
 from mcp.mocks.generate_content_catalog import ContentCatalogGenerator
 
+TOP_N = 10
+
+# Struct-of-arrays layout for catalog aggregation: array name -> (show field getter, dtype).
+# Counts, hours and revenue are float64 so fractional values from the live API survive.
+CATALOG_ARRAY_FIELDS = {
+    "viewing_hours": (itemgetter("viewing_hours_30d"), np.float64),
+    "viewers": (itemgetter("unique_viewers_30d"), np.float64),
+    "completion": (itemgetter("completion_rate"), np.float64),
+    "rating": (itemgetter("avg_rating"), np.float64),
+    "retention": (itemgetter("retention_contribution"), np.float64),
+    "flagship": (lambda s: s["tier"] == "flagship", np.bool_),
+    "original": (itemgetter("is_original"), np.bool_),
+    "ad_revenue": (lambda s: s["monetization"]["ad_revenue_30d"], np.float64),
+    "subscription_attribution": (lambda s: s["monetization"]["subscription_attribution"], np.float64),
+    "licensing_revenue": (lambda s: s["monetization"]["licensing_revenue_annual"], np.float64),
+}
+
+
+def _total(value: Any) -> Any:
+    """A float64 aggregate as a Python number, an int when it is whole (as summing ints gave)."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _top_indices(values: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n largest values, highest first; ties keep catalog order."""
+    if values.size > n:
+        threshold = np.partition(values, values.size - n)[values.size - n]
+        candidates = np.flatnonzero(values >= threshold)
+    else:
+        candidates = np.arange(values.size)
+    order = np.argsort(-values[candidates], kind="stable")
+    return candidates[order[:n]]
+
 
 class ContentAPIClient:
     """
@@ -26,10 +65,47 @@ class ContentAPIClient:
         self.mock_mode = mock_mode if mock_mode is not None else settings.mock_mode
         self.api_url = settings.content_api_url
         self.api_key = settings.content_api_key
+        self._catalog_cache = None
+        self._by_id = None
+        self._by_name_lower = None
+        self._arrays = None
+        self._arrays_source = None
+        self._frame = None
+        self._frame_source = None
         
         if self.mock_mode:
             self.generator = ContentCatalogGenerator()
     
+    def _summary_catalog(self) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray]]:
+        """
+        Full catalog plus column arrays for its numeric fields.
+        
+        Mock arrays are built once per memoized catalog; live catalogs are
+        projected on every fetch.
+        """
+        shows = self.get_content_catalog(limit=1000)
+        source = self._catalog_cache if self.mock_mode else shows
+        if source is not self._arrays_source:
+            self._arrays = {
+                name: np.fromiter((getter(s) for s in shows), dtype=dtype, count=len(shows))
+                for name, (getter, dtype) in CATALOG_ARRAY_FIELDS.items()
+            }
+            self._arrays_source = source
+        return shows, self._arrays
+    
+    def _genre_frame(self) -> pd.DataFrame:
+        """Genre, name and viewing columns as a DataFrame, rebuilt with the column arrays."""
+        shows, arrays = self._summary_catalog()
+        if arrays is not self._frame_source:
+            self._frame = pd.DataFrame({
+                "genre": [s["genre"] for s in shows],
+                "name": [s["name"] for s in shows],
+                "viewing_hours": arrays["viewing_hours"],
+                "viewers": arrays["viewers"],
+            })
+            self._frame_source = arrays
+        return self._frame
+    
     def get_content_catalog(
         self,
         genre: Optional[str] = None,
@@ -58,8 +134,15 @@ class ContentAPIClient:
         tier: Optional[str],
         limit: int
     ) -> List[Dict[str, Any]]:
-        """Get mock content catalog."""
-        shows = self.generator.generate(num_shows=50)
+        """
+        Get mock content catalog.
+        
+        The generated catalog is memoized for the life of the client so every
+        summary method works from the same shows.
+        """
+        if self._catalog_cache is None:
+            self._catalog_cache = self.generator.generate(num_shows=50)
+        shows = self._catalog_cache
         
         # Apply filters
         if genre:
@@ -70,6 +153,38 @@ class ContentAPIClient:
         
         return shows[:limit]
     
+    def invalidate_cache(self) -> None:
+        """Drop the memoized catalog so the next call regenerates it."""
+        self._catalog_cache = None
+        self._by_id = None
+        self._by_name_lower = None
+        self._arrays = None
+        self._arrays_source = None
+        self._frame = None
+        self._frame_source = None
+    
+    @staticmethod
+    def _index_shows(
+        shows: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Build show lookups by ID and lowercased name; the first match wins."""
+        by_id = {}
+        by_name_lower = {}
+        for show in shows:
+            by_id.setdefault(show["show_id"], show)
+            by_name_lower.setdefault(show["name"].lower(), show)
+        return by_id, by_name_lower
+    
+    def _show_indexes(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Show lookups, built once alongside the memoized mock catalog."""
+        if not self.mock_mode:
+            return self._index_shows(self.get_content_catalog(limit=1000))
+        if self._by_id is None:
+            self._by_id, self._by_name_lower = self._index_shows(
+                self.get_content_catalog(limit=1000)
+            )
+        return self._by_id, self._by_name_lower
+    
     def _fetch_from_api(
         self,
         genre: Optional[str],
@@ -108,11 +223,8 @@ class ContentAPIClient:
         Returns:
             Show dictionary or None if not found
         """
-        shows = self.get_content_catalog(limit=1000)
-        for show in shows:
-            if show["show_id"] == show_id:
-                return show
-        return None
+        by_id, _ = self._show_indexes()
+        return by_id.get(show_id)
     
     def get_show_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -124,11 +236,8 @@ class ContentAPIClient:
         Returns:
             Show dictionary or None if not found
         """
-        shows = self.get_content_catalog(limit=1000)
-        for show in shows:
-            if show["name"].lower() == name.lower():
-                return show
-        return None
+        _, by_name_lower = self._show_indexes()
+        return by_name_lower.get(name.lower())
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """
@@ -137,27 +246,21 @@ class ContentAPIClient:
         Returns:
             Performance summary dictionary
         """
-        shows = self.get_content_catalog(limit=1000)
+        shows, arrays = self._summary_catalog()
         
-        total_viewing_hours = sum(s["viewing_hours_30d"] for s in shows)
-        total_viewers = sum(s["unique_viewers_30d"] for s in shows)
-        
-        # Calculate averages
-        avg_completion = sum(s["completion_rate"] for s in shows) / len(shows) if shows else 0
-        avg_rating = sum(s["avg_rating"] for s in shows) / len(shows) if shows else 0
-        
-        # Top performers
-        top_by_viewing = sorted(shows, key=lambda x: x["viewing_hours_30d"], reverse=True)[:10]
-        top_by_retention = sorted(shows, key=lambda x: x["retention_contribution"], reverse=True)[:10]
+        avg_completion = float(arrays["completion"].mean()) if shows else 0
+        avg_rating = float(arrays["rating"].mean()) if shows else 0
+        top_by_viewing = [shows[i] for i in _top_indices(arrays["viewing_hours"], TOP_N)]
+        top_by_retention = [shows[i] for i in _top_indices(arrays["retention"], TOP_N)]
         
         return {
             "total_shows": len(shows),
-            "total_viewing_hours_30d": total_viewing_hours,
-            "total_unique_viewers_30d": total_viewers,
+            "total_viewing_hours_30d": _total(arrays["viewing_hours"].sum()),
+            "total_unique_viewers_30d": _total(arrays["viewers"].sum()),
             "avg_completion_rate": round(avg_completion, 2),
             "avg_rating": round(avg_rating, 2),
-            "flagship_shows": len([s for s in shows if s["tier"] == "flagship"]),
-            "original_shows": len([s for s in shows if s["is_original"]]),
+            "flagship_shows": int(arrays["flagship"].sum()),
+            "original_shows": int(arrays["original"].sum()),
             "top_by_viewing_hours": [
                 {
                     "show_id": s["show_id"],
@@ -183,35 +286,31 @@ class ContentAPIClient:
         Returns:
             Genre analysis dictionary
         """
-        shows = self.get_content_catalog(limit=1000)
+        frame = self._genre_frame()
+        grouped = frame.groupby("genre", sort=False)
+        agg = grouped.agg(
+            count=("name", "size"),
+            total_viewing_hours=("viewing_hours", "sum"),
+            total_viewers=("viewers", "sum"),
+        )
+        names = grouped["name"].agg(list)
         
-        # Group by genre
-        by_genre = {}
-        for show in shows:
-            genre = show["genre"]
-            if genre not in by_genre:
-                by_genre[genre] = {
-                    "count": 0,
-                    "total_viewing_hours": 0,
-                    "total_viewers": 0,
-                    "shows": []
-                }
-            by_genre[genre]["count"] += 1
-            by_genre[genre]["total_viewing_hours"] += show["viewing_hours_30d"]
-            by_genre[genre]["total_viewers"] += show["unique_viewers_30d"]
-            by_genre[genre]["shows"].append(show["name"])
-        
-        # Calculate averages and sort
-        for genre_data in by_genre.values():
-            genre_data["avg_viewing_hours"] = genre_data["total_viewing_hours"] / genre_data["count"]
+        # Genres stay in first-appearance order, as the dict accumulation had them
+        by_genre = {
+            genre: {
+                "count": int(count),
+                "total_viewing_hours": _total(viewing_hours),
+                "total_viewers": _total(viewers),
+                "shows": names[genre],
+                "avg_viewing_hours": float(viewing_hours / count),
+            }
+            for genre, count, viewing_hours, viewers in agg.itertuples()
+        }
         
         return {
             "genres_analyzed": len(by_genre),
             "by_genre": by_genre,
-            "top_genre_by_viewing": max(
-                by_genre.items(),
-                key=lambda x: x[1]["total_viewing_hours"]
-            )[0] if by_genre else None
+            "top_genre_by_viewing": agg["total_viewing_hours"].idxmax() if by_genre else None
         }
     
     def get_monetization_summary(self) -> Dict[str, Any]:
@@ -221,11 +320,11 @@ class ContentAPIClient:
         Returns:
             Monetization summary dictionary
         """
-        shows = self.get_content_catalog(limit=1000)
+        _, arrays = self._summary_catalog()
         
-        total_ad_revenue = sum(s["monetization"]["ad_revenue_30d"] for s in shows)
-        total_subscription_attribution = sum(s["monetization"]["subscription_attribution"] for s in shows)
-        total_licensing = sum(s["monetization"]["licensing_revenue_annual"] for s in shows)
+        total_ad_revenue = _total(arrays["ad_revenue"].sum())
+        total_subscription_attribution = _total(arrays["subscription_attribution"].sum())
+        total_licensing = _total(arrays["licensing_revenue"].sum())
         
         return {
             "total_ad_revenue_30d": total_ad_revenue,
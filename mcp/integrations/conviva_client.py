@@ -8,14 +8,24 @@ buffering metrics, and viewer experience data.
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+import asyncio
 import structlog
 import httpx
+import orjson
 
 from config import settings
 from mcp.pareto import ParetoCalculator
+from mcp.utils.cache import get_cached, set_cached, invalidate
 
 logger = structlog.get_logger()
 
+# Connection pool limits for the shared Conviva HTTP/2 client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=100)
+
+# QoE aggregates move slowly next to dashboard refresh rates
+QOE_CACHE_PREFIX = "conviva_qoe"
+QOE_CACHE_TTL = 30.0
+
 
 @dataclass
 class ConvivaMetrics:
@@ -90,6 +100,10 @@ class ConvivaClient:
         # Initialize Pareto calculator
         self.pareto = ParetoCalculator()
         
+        # Shared HTTP client (created lazily, bound to the loop that opened it)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         if self.mock_mode:
             logger.info("conviva_client_initialized", mode="mock")
         else:
@@ -112,6 +126,39 @@ class ConvivaClient:
             "Accept": "application/json"
         }
     
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure the shared HTTP/2 client is initialized for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # Pooled connections cannot cross event loops; the sync wrappers
+            # drive requests on their own loop, so rebuild when it changes
+            # after closing the pool left behind on the previous loop.
+            await self._close_client()
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=HTTP_LIMITS,
+                headers=self._get_auth_header()
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def _close_client(self) -> None:
+        """Close and forget the HTTP client, tolerating a pool from another loop."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Connections opened on a closed (or foreign) loop cannot be shut
+            # down gracefully; dropping them releases the sockets.
+            logger.debug("conviva_stale_client_discarded", error=str(e))
+    
+    async def close(self):
+        """Close the HTTP client."""
+        await self._close_client()
+    
     async def _make_request(
         self,
         method: str,
@@ -132,34 +179,33 @@ class ConvivaClient:
             JSON response as dictionary
         """
         url = f"{self.api_url}{endpoint}"
+        client = await self._ensure_client()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self._get_auth_header(),
-                    params=params,
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json()
-            
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "conviva_api_error",
-                    status_code=e.response.status_code,
-                    url=url,
-                    error=str(e)
-                )
-                raise
-            except httpx.RequestError as e:
-                logger.error(
-                    "conviva_request_error",
-                    url=url,
-                    error=str(e)
-                )
-                raise
+        try:
+            response = await client.request(
+                method=method,
+                url=url,
+                params=params,
+                json=data
+            )
+            response.raise_for_status()
+            return response.json()
+        
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "conviva_api_error",
+                status_code=e.response.status_code,
+                url=url,
+                error=str(e)
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(
+                "conviva_request_error",
+                url=url,
+                error=str(e)
+            )
+            raise
     
     def _generate_mock_metrics(
         self,
@@ -233,6 +279,28 @@ class ConvivaClient:
         
         return self._fetch_qoe_metrics_sync(time_range, dimension, content_filter)
     
+    async def get_qoe_metrics_async(
+        self,
+        time_range: str = "last_24_hours",
+        dimension: Optional[str] = None,
+        content_filter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get Quality of Experience metrics without blocking the event loop.
+        
+        Args:
+            time_range: Time range (last_1_hour, last_24_hours, last_7_days, last_30_days)
+            dimension: Optional dimension to group by (device_type, country, isp, cdn)
+            content_filter: Optional content name/ID filter
+        
+        Returns:
+            QoE metrics dictionary
+        """
+        if self.mock_mode:
+            return self._get_mock_qoe_metrics(time_range, dimension, content_filter)
+        
+        return await self._fetch_qoe_metrics_async(time_range, dimension, content_filter)
+    
     def _get_mock_qoe_metrics(
         self,
         time_range: str,
@@ -364,25 +432,54 @@ class ConvivaClient:
         content_filter: Optional[str]
     ) -> Dict[str, Any]:
         """Fetch from real Conviva API (synchronous wrapper)."""
-        import asyncio
-        
+        return self._run_sync(
+            self._fetch_qoe_metrics_async(time_range, dimension, content_filter)
+        )
+    
+    @staticmethod
+    def _run_sync(coro):
+        """Drive a coroutine to completion from synchronous code."""
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
         
-        return loop.run_until_complete(
-            self._fetch_qoe_metrics_async(time_range, dimension, content_filter)
-        )
+        return loop.run_until_complete(coro)
     
-    async def _fetch_qoe_metrics_async(
+    def invalidate_cache(self) -> None:
+        """Drop this client's cached live QoE responses so the next call refetches them."""
+        invalidate(self._qoe_cache_prefix())
+    
+    def _qoe_cache_prefix(self) -> str:
+        """Cache namespace for this client's account, endpoint and filter."""
+        return f"{QOE_CACHE_PREFIX}:{self.api_url}:{self.customer_key}:{self.filter_client}:"
+    
+    def _qoe_cache_key(
         self,
         time_range: str,
         dimension: Optional[str],
         content_filter: Optional[str]
-    ) -> Dict[str, Any]:
-        """Fetch from real Conviva API."""
+    ) -> str:
+        """Shared TTL cache key for one live QoE query."""
+        return f"{self._qoe_cache_prefix()}{time_range}:{dimension}:{content_filter}"
+    
+    def _get_cached_qoe(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached QoE result as a fresh copy, so callers may mutate it."""
+        encoded = get_cached(key, ttl_seconds=QOE_CACHE_TTL)
+        return orjson.loads(encoded) if encoded is not None else None
+    
+    def _set_cached_qoe(self, key: str, result: Dict[str, Any]) -> None:
+        """Cache a QoE result encoded, detached from the caller's dict."""
+        set_cached(key, orjson.dumps(result))
+    
+    def _qoe_params(
+        self,
+        time_range: str,
+        dimensions: List[str],
+        content_filter: Optional[str]
+    ) -> Dict[str, str]:
+        """Build /metrics query parameters; several dimensions share one request."""
         # Build time range parameters
         time_ranges = {
             "last_1_hour": 1,
@@ -403,12 +500,35 @@ class ConvivaClient:
             "filter": f"client_id={self.filter_client}"
         }
         
-        if dimension:
-            params["dimensions"] = dimension
+        if dimensions:
+            params["dimensions"] = ",".join(dimensions)
         
         if content_filter:
             params["filter"] += f" AND asset_name={content_filter}"
         
+        return params
+    
+    async def _fetch_qoe_metrics_async(
+        self,
+        time_range: str,
+        dimension: Optional[str],
+        content_filter: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Fetch from real Conviva API.
+        
+        Parsed responses go through the shared TTL cache keyed by this
+        client's endpoint, customer and filter plus (time_range, dimension,
+        content_filter); hits are returned as copies. Development mock
+        fallbacks are never cached.
+        """
+        cache_key = self._qoe_cache_key(time_range, dimension, content_filter)
+        cached = self._get_cached_qoe(cache_key)
+        if cached is not None:
+            return cached
+        
+        params = self._qoe_params(time_range, [dimension] if dimension else [], content_filter)
+        
         try:
             response = await self._make_request(
                 method="GET",
@@ -416,7 +536,7 @@ class ConvivaClient:
                 params=params
             )
             
-            return self._parse_conviva_response(response, dimension)
+            result = self._parse_conviva_response(response, dimension)
             
         except Exception as e:
             logger.error("conviva_fetch_failed", error=str(e))
@@ -424,13 +544,91 @@ class ConvivaClient:
                 logger.warning("falling_back_to_mock_data")
                 return self._get_mock_qoe_metrics(time_range, dimension, content_filter)
             raise
+        
+        self._set_cached_qoe(cache_key, result)
+        return result
+    
+    async def _fetch_qoe_dimensions_async(
+        self,
+        time_range: str,
+        dimensions: List[str],
+        content_filter: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch QoE breakdowns for several dimensions with one batched request.
+        
+        The batched response is split locally by each row's dimension. Any
+        dimension the batch could not serve (request failure or no rows) is
+        fetched on its own, concurrently, so one gap never fails the rest.
+        
+        Returns:
+            QoE metrics dictionary per dimension, in the requested order
+        """
+        results = {}
+        pending = []
+        for dimension in dimensions:
+            cached = self._get_cached_qoe(
+                self._qoe_cache_key(time_range, dimension, content_filter)
+            )
+            if cached is not None:
+                results[dimension] = cached
+            else:
+                pending.append(dimension)
+        
+        if len(pending) > 1:
+            try:
+                response = await self._make_request(
+                    method="GET",
+                    endpoint="/metrics",
+                    params=self._qoe_params(time_range, pending, content_filter)
+                )
+                rows_by_dimension = self._split_breakdown(response.get("data", {}), pending)
+                for dimension, rows in rows_by_dimension.items():
+                    if not rows:
+                        continue
+                    result = self._parse_conviva_response(response, dimension, rows)
+                    self._set_cached_qoe(
+                        self._qoe_cache_key(time_range, dimension, content_filter), result
+                    )
+                    results[dimension] = result
+            except Exception as e:
+                logger.warning("conviva_batch_fetch_failed", dimensions=pending, error=str(e))
+        
+        missing = [d for d in pending if d not in results]
+        if missing:
+            fetched = await asyncio.gather(*(
+                self._fetch_qoe_metrics_async(time_range, dimension, content_filter)
+                for dimension in missing
+            ))
+            results.update(zip(missing, fetched))
+        
+        return {dimension: results[dimension] for dimension in dimensions}
+    
+    @staticmethod
+    def _split_breakdown(
+        data: Dict[str, Any],
+        dimensions: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Route rows of a multi-dimension breakdown to their dimension."""
+        rows_by_dimension = {dimension: [] for dimension in dimensions}
+        for row in data.get("breakdown", []):
+            rows = rows_by_dimension.get(row.get("dimension"))
+            if rows is not None:
+                rows.append(row)
+        return rows_by_dimension
     
     def _parse_conviva_response(
         self,
         response: Dict[str, Any],
-        dimension: Optional[str]
+        dimension: Optional[str],
+        breakdown: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        """Parse Conviva API response into standardized format."""
+        """
+        Parse Conviva API response into standardized format.
+        
+        ``breakdown`` overrides ``data["breakdown"]`` with the rows already
+        split out of a batched multi-dimension response.
+        """
         # This would parse the actual Conviva response format
         # For now, structure based on Conviva Insights API documentation
         
@@ -457,10 +655,12 @@ class ConvivaClient:
         result["health_status"] = metrics.get_health_status()
         
         # Add dimension breakdown if present
-        if dimension and "breakdown" in data:
-            result["by_dimension"] = data["breakdown"]
+        if breakdown is None:
+            breakdown = data.get("breakdown")
+        if dimension and breakdown is not None:
+            result["by_dimension"] = breakdown
             result["pareto_analysis"] = self._analyze_dimension_pareto(
-                data["breakdown"], 
+                breakdown, 
                 dimension
             )
         
@@ -476,6 +676,10 @@ class ConvivaClient:
         Returns:
             Hotspot analysis with Pareto insights
         """
+        if not self.mock_mode:
+            # Live mode batches both dimensions into one request
+            return self._run_sync(self.get_buffering_hotspots_async(time_range))
+        
         # Get metrics by country
         country_metrics = self.get_qoe_metrics(
             time_range=time_range,
@@ -488,6 +692,40 @@ class ConvivaClient:
             dimension="device_type"
         )
         
+        return self._build_buffering_hotspots(country_metrics, device_metrics)
+    
+    async def get_buffering_hotspots_async(
+        self,
+        time_range: str = "last_24_hours"
+    ) -> Dict[str, Any]:
+        """
+        Identify buffering hotspots without blocking the event loop.
+        
+        Args:
+            time_range: Time range for analysis
+            
+        Returns:
+            Hotspot analysis with Pareto insights
+        """
+        if self.mock_mode:
+            country_metrics = self._get_mock_qoe_metrics(time_range, "country", None)
+            device_metrics = self._get_mock_qoe_metrics(time_range, "device_type", None)
+        else:
+            # One batched request covers both dimensions
+            by_dimension = await self._fetch_qoe_dimensions_async(
+                time_range, ["country", "device_type"]
+            )
+            country_metrics = by_dimension["country"]
+            device_metrics = by_dimension["device_type"]
+        
+        return self._build_buffering_hotspots(country_metrics, device_metrics)
+    
+    def _build_buffering_hotspots(
+        self,
+        country_metrics: Dict[str, Any],
+        device_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Assemble the hotspot report from per-dimension QoE metrics."""
         return {
             "timestamp": datetime.now().isoformat(),
             "geographic_hotspots": country_metrics.get("by_dimension", [])[:5],
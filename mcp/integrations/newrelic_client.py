@@ -10,6 +10,7 @@ Provides interface to NewRelic GraphQL API and Insights API for:
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
+import asyncio
 import structlog
 import httpx
 
@@ -18,6 +19,9 @@ from mcp.pareto import ParetoCalculator
 
 logger = structlog.get_logger()
 
+# Connection pool limits for the shared NewRelic HTTP/2 client
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=100)
+
 
 @dataclass
 class APMMetrics:
@@ -114,6 +118,10 @@ class NewRelicClient:
         # Initialize Pareto calculator
         self.pareto = ParetoCalculator()
         
+        # Shared HTTP client (created lazily, bound to the loop that opened it)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         if self.mock_mode:
             logger.info("newrelic_client_initialized", mode="mock")
         else:
@@ -136,6 +144,39 @@ class NewRelicClient:
             "Accept": "application/json"
         }
     
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Ensure the shared HTTP/2 client is initialized for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            # Pooled connections cannot cross event loops; the sync wrappers
+            # drive requests on their own loop, so rebuild when it changes
+            # after closing the pool left behind on the previous loop.
+            await self._close_client()
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=HTTP_LIMITS,
+                headers=self._get_headers()
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def _close_client(self) -> None:
+        """Close and forget the HTTP client, tolerating a pool from another loop."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            # Connections opened on a closed (or foreign) loop cannot be shut
+            # down gracefully; dropping them releases the sockets.
+            logger.debug("newrelic_stale_client_discarded", error=str(e))
+    
+    async def close(self):
+        """Close the HTTP client."""
+        await self._close_client()
+    
     async def _graphql_request(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Make GraphQL request to NewRelic API.
@@ -147,38 +188,38 @@ class NewRelicClient:
         Returns:
             GraphQL response data
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    self.graphql_url,
-                    headers=self._get_headers(),
-                    json={
-                        "query": query,
-                        "variables": variables or {}
-                    }
-                )
-                response.raise_for_status()
-                result = response.json()
-                
-                if "errors" in result:
-                    logger.error("newrelic_graphql_error", errors=result["errors"])
-                    raise ValueError(f"GraphQL errors: {result['errors']}")
-                
-                return result.get("data", {})
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "newrelic_api_error",
-                    status_code=e.response.status_code,
-                    error=str(e)
-                )
-                raise
-            except httpx.RequestError as e:
-                logger.error(
-                    "newrelic_request_error",
-                    error=str(e)
-                )
-                raise
+        client = await self._ensure_client()
+        
+        try:
+            response = await client.post(
+                self.graphql_url,
+                json={
+                    "query": query,
+                    "variables": variables or {}
+                }
+            )
+            response.raise_for_status()
+            result = response.json()
+            
+            if "errors" in result:
+                logger.error("newrelic_graphql_error", errors=result["errors"])
+                raise ValueError(f"GraphQL errors: {result['errors']}")
+            
+            return result.get("data", {})
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "newrelic_api_error",
+                status_code=e.response.status_code,
+                error=str(e)
+            )
+            raise
+        except httpx.RequestError as e:
+            logger.error(
+                "newrelic_request_error",
+                error=str(e)
+            )
+            raise
     
     async def _nrql_request(self, query: str) -> Dict[str, Any]:
         """
@@ -192,24 +233,24 @@ class NewRelicClient:
         """
         url = f"{self.insights_url}/accounts/{self.account_id}/query"
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(
-                    url,
-                    headers=self._get_headers(),
-                    params={"nrql": query}
-                )
-                response.raise_for_status()
-                return response.json()
-                
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    "newrelic_nrql_error",
-                    status_code=e.response.status_code,
-                    query=query,
-                    error=str(e)
-                )
-                raise
+        client = await self._ensure_client()
+        
+        try:
+            response = await client.get(
+                url,
+                params={"nrql": query}
+            )
+            response.raise_for_status()
+            return response.json()
+            
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "newrelic_nrql_error",
+                status_code=e.response.status_code,
+                query=query,
+                error=str(e)
+            )
+            raise
     
     def _generate_mock_apm_metrics(
         self,
@@ -296,6 +337,26 @@ class NewRelicClient:
         
         return self._fetch_apm_metrics_sync(time_range, service_filter)
     
+    async def get_apm_metrics_async(
+        self,
+        time_range: str = "last_1_hour",
+        service_filter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get APM metrics without blocking the event loop.
+        
+        Args:
+            time_range: Time range (last_1_hour, last_24_hours, last_7_days)
+            service_filter: Optional service name filter
+        
+        Returns:
+            APM metrics dictionary
+        """
+        if self.mock_mode:
+            return self._get_mock_apm_metrics(time_range, service_filter)
+        
+        return await self._fetch_apm_metrics_async(time_range, service_filter)
+    
     def _get_mock_apm_metrics(
         self,
         time_range: str,
@@ -352,6 +413,22 @@ class NewRelicClient:
         # In live mode, fetch from NewRelic API
         return self._fetch_service_breakdown_sync(time_range)
     
+    async def get_service_breakdown_async(
+        self,
+        time_range: str = "last_1_hour"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get service-level breakdown without blocking the event loop.
+        
+        Args:
+            time_range: Time range for metrics
+            
+        Returns:
+            List of service metrics
+        """
+        # Live breakdown is not wired to the API yet; both modes are CPU-only
+        return self.get_service_breakdown(time_range)
+    
     def _get_mock_service_breakdown(self) -> List[Dict[str, Any]]:
         """Generate mock service breakdown."""
         services = [
@@ -479,8 +556,6 @@ class NewRelicClient:
         service_filter: Optional[str]
     ) -> Dict[str, Any]:
         """Fetch APM metrics synchronously."""
-        import asyncio
-        
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -583,6 +658,26 @@ class NewRelicClient:
         
         return self._fetch_infra_metrics_sync(time_range, host_filter)
     
+    async def get_infrastructure_metrics_async(
+        self,
+        time_range: str = "last_1_hour",
+        host_filter: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get infrastructure metrics without blocking the event loop.
+        
+        Args:
+            time_range: Time range (last_1_hour, last_24_hours, last_7_days)
+            host_filter: Optional host name filter
+        
+        Returns:
+            Infrastructure metrics dictionary
+        """
+        if self.mock_mode:
+            return self._get_mock_infra_metrics(time_range, host_filter)
+        
+        return await self._fetch_infra_metrics_async(time_range, host_filter)
+    
     def _get_mock_infra_metrics(
         self,
         time_range: str,
@@ -645,8 +740,6 @@ class NewRelicClient:
         host_filter: Optional[str]
     ) -> Dict[str, Any]:
         """Fetch infrastructure metrics synchronously."""
-        import asyncio
-        
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -736,18 +829,74 @@ class NewRelicClient:
 
         return self._fetch_live_incidents(status, priority)
 
+    async def get_incidents_async(
+        self,
+        status: str = "open",
+        priority: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get active incidents without blocking the event loop.
+        
+        Args:
+            status: Incident status (open, closed, all)
+            priority: Priority filter (critical, high, medium, low)
+        
+        Returns:
+            Incident summary
+        """
+        if self.mock_mode:
+            return self._get_mock_incidents(status, priority)
+
+        query = self._build_ai_issues_query(status)
+        try:
+            result = await self._graphql_request(query)
+        except Exception as e:
+            logger.warning("newrelic_incidents_nerdgraph_failed", error=str(e))
+            result = {}
+
+        issues_data = self._extract_ai_issues(result)
+        if not issues_data:
+            try:
+                rows = self._extract_nrql_rows(
+                    await self._graphql_request(self._build_nrql_incidents_query())
+                )
+            except Exception as e:
+                logger.warning("newrelic_nrql_incidents_failed", error=str(e))
+                rows = []
+            return self._summarize_incidents(self._parse_nrql_incidents(rows, status, priority))
+
+        return self._summarize_incidents(self._parse_ai_issues(issues_data, priority))
+
     def _fetch_live_incidents(
         self,
         status: str,
         priority: Optional[str]
     ) -> Dict[str, Any]:
         """Fetch real incidents from NerdGraph."""
-        import asyncio
+        query = self._build_ai_issues_query(status)
 
+        try:
+            result = asyncio.get_event_loop().run_until_complete(
+                self._graphql_request(query)
+            ) if asyncio.get_event_loop().is_running() is False else self._sync_graphql_request(query)
+        except RuntimeError:
+            result = self._sync_graphql_request(query)
+        except Exception as e:
+            logger.warning("newrelic_incidents_nerdgraph_failed", error=str(e))
+            return self._fetch_incidents_via_nrql(status, priority)
+
+        issues_data = self._extract_ai_issues(result)
+        if not issues_data:
+            return self._fetch_incidents_via_nrql(status, priority)
+
+        return self._summarize_incidents(self._parse_ai_issues(issues_data, priority))
+
+    def _build_ai_issues_query(self, status: str) -> str:
+        """Build the NerdGraph aiIssues query for an incident status."""
         nr_filter = "ACTIVATED" if status == "open" else "DEACTIVATED" if status == "closed" else ""
         filter_clause = f', filter: {{ state: {nr_filter} }}' if nr_filter else ""
 
-        query = """
+        return """
         {
           actor {
             account(id: %s) {
@@ -770,25 +919,20 @@ class NewRelicClient:
         }
         """ % (self.account_id, filter_clause)
 
+    def _extract_ai_issues(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pull the aiIssues list out of a NerdGraph response."""
         try:
-            result = asyncio.get_event_loop().run_until_complete(
-                self._graphql_request(query)
-            ) if asyncio.get_event_loop().is_running() is False else self._sync_graphql_request(query)
-        except RuntimeError:
-            result = self._sync_graphql_request(query)
-        except Exception as e:
-            logger.warning("newrelic_incidents_nerdgraph_failed", error=str(e))
-            return self._fetch_incidents_via_nrql(status, priority)
-
-        try:
-            issues_data = result.get("actor", {}).get("account", {}).get("aiIssues", {}).get("issues", {}).get("issues", [])
+            return result.get("actor", {}).get("account", {}).get("aiIssues", {}).get("issues", {}).get("issues", [])
         except (AttributeError, TypeError):
             logger.warning("newrelic_incidents_parse_failed, falling back to NRQL")
-            return self._fetch_incidents_via_nrql(status, priority)
-
-        if not issues_data:
-            return self._fetch_incidents_via_nrql(status, priority)
+            return []
 
+    def _parse_ai_issues(
+        self,
+        issues_data: List[Dict[str, Any]],
+        priority: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Convert NerdGraph aiIssues into incident records."""
         priority_map = {"CRITICAL": "critical", "HIGH": "high", "MEDIUM": "medium", "LOW": "low"}
         incidents = []
         for issue in issues_data:
@@ -804,7 +948,10 @@ class NewRelicClient:
                 "opened_at": issue.get("activatedAt", ""),
                 "duration_minutes": 0
             })
+        return incidents
 
+    def _summarize_incidents(self, incidents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Wrap incident records with totals and per-priority counts."""
         return {
             "timestamp": datetime.now().isoformat(),
             "total_incidents": len(incidents),
@@ -817,12 +964,11 @@ class NewRelicClient:
             "incidents": incidents
         }
 
-    def _fetch_incidents_via_nrql(self, status: str, priority: Optional[str]) -> Dict[str, Any]:
-        """Fallback: query alert violations via NRQL when aiIssues is unavailable."""
+    def _build_nrql_incidents_query(self) -> str:
+        """Build the NerdGraph NRQL query for alert violations."""
         nrql = "SELECT count(*) FROM NrAiIncident FACET conditionName, priority SINCE 7 days ago LIMIT 50"
 
-        try:
-            result = self._sync_graphql_request("""
+        return """
             {
               actor {
                 account(id: %s) {
@@ -832,13 +978,31 @@ class NewRelicClient:
                 }
               }
             }
-            """ % (self.account_id, nrql))
+            """ % (self.account_id, nrql)
 
-            rows = result.get("actor", {}).get("account", {}).get("nrql", {}).get("results", [])
+    def _extract_nrql_rows(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pull NRQL result rows out of a NerdGraph response."""
+        return result.get("actor", {}).get("account", {}).get("nrql", {}).get("results", [])
+
+    def _fetch_incidents_via_nrql(self, status: str, priority: Optional[str]) -> Dict[str, Any]:
+        """Fallback: query alert violations via NRQL when aiIssues is unavailable."""
+        try:
+            rows = self._extract_nrql_rows(
+                self._sync_graphql_request(self._build_nrql_incidents_query())
+            )
         except Exception as e:
             logger.warning("newrelic_nrql_incidents_failed", error=str(e))
             rows = []
 
+        return self._summarize_incidents(self._parse_nrql_incidents(rows, status, priority))
+
+    def _parse_nrql_incidents(
+        self,
+        rows: List[Dict[str, Any]],
+        status: str,
+        priority: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Convert NRQL alert violation rows into incident records."""
         incidents = []
         for row in rows:
             nr_priority = str(row.get("priority", "medium")).lower()
@@ -855,18 +1019,7 @@ class NewRelicClient:
                 "opened_at": datetime.now().isoformat(),
                 "duration_minutes": 0
             })
-
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "total_incidents": len(incidents),
-            "by_priority": {
-                "critical": len([i for i in incidents if i["priority"] == "critical"]),
-                "high": len([i for i in incidents if i["priority"] == "high"]),
-                "medium": len([i for i in incidents if i["priority"] == "medium"]),
-                "low": len([i for i in incidents if i["priority"] == "low"])
-            },
-            "incidents": incidents
-        }
+        return incidents
 
     def _sync_graphql_request(self, query: str) -> Dict[str, Any]:
         """Synchronous NerdGraph request for use outside async contexts."""
@@ -924,17 +1077,7 @@ class NewRelicClient:
                 "duration_minutes": random.randint(5, 240)
             })
         
-        return {
-            "timestamp": datetime.now().isoformat(),
-            "total_incidents": len(incidents),
-            "by_priority": {
-                "critical": len([i for i in incidents if i["priority"] == "critical"]),
-                "high": len([i for i in incidents if i["priority"] == "high"]),
-                "medium": len([i for i in incidents if i["priority"] == "medium"]),
-                "low": len([i for i in incidents if i["priority"] == "low"])
-            },
-            "incidents": incidents
-        }
+        return self._summarize_incidents(incidents)
     
     def run_nrql_query(self, query: str) -> Dict[str, Any]:
         """
@@ -953,8 +1096,6 @@ class NewRelicClient:
     
     def _run_nrql_query_sync(self, query: str) -> Dict[str, Any]:
         """Synchronous wrapper for NRQL query."""
-        import asyncio
-        
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -974,6 +1115,32 @@ class NewRelicClient:
         infra = self.get_infrastructure_metrics(time_range="last_1_hour")
         incidents = self.get_incidents(status="open")
         
+        return self._build_operational_health_summary(apm, infra, incidents)
+    
+    async def get_operational_health_summary_async(self) -> Dict[str, Any]:
+        """
+        Get operational health summary without blocking the event loop.
+        
+        APM, infrastructure, and incident data are fetched concurrently.
+        
+        Returns:
+            Combined APM, infrastructure, and incident summary
+        """
+        apm, infra, incidents = await asyncio.gather(
+            self.get_apm_metrics_async(time_range="last_1_hour"),
+            self.get_infrastructure_metrics_async(time_range="last_1_hour"),
+            self.get_incidents_async(status="open")
+        )
+        
+        return self._build_operational_health_summary(apm, infra, incidents)
+    
+    def _build_operational_health_summary(
+        self,
+        apm: Dict[str, Any],
+        infra: Dict[str, Any],
+        incidents: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine APM, infrastructure, and incident data into a health summary."""
         # Determine overall health
         health_scores = {
             "healthy": 3,
@@ -126,6 +126,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("scheduler_start_failed", error=str(e))
     
+    # Keep the default QoE dashboard query warm in memory
+    from mcp.api.streaming import start_background_refresh, stop_background_refresh
+    start_background_refresh()
+    
     logger.info(
         "server_ready",
         resources_count=len(RESOURCES),
@@ -141,6 +145,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("scheduler_stop_failed", error=str(e))
     
+    # Stop the QoE refresher and release pooled upstream connections
+    try:
+        from mcp.api.streaming import close_clients
+        await stop_background_refresh()
+        await close_clients()
+    except Exception as e:
+        logger.warning("streaming_clients_close_failed", error=str(e))
+    
     logger.info("server_shutting_down")
 
 
@@ -431,6 +443,17 @@ app.include_router(governance_router)  # Governance action review & audit
 app.include_router(phase2_router)  # Phase 2 QA Intelligence
 app.include_router(events_router)  # SSE real-time events
 
+
+def _openapi() -> Dict[str, Any]:
+    """Generate the OpenAPI schema once, filling in deferred route descriptions."""
+    if app.openapi_schema is None:
+        from mcp.api.streaming import apply_openapi_descriptions
+        apply_openapi_descriptions(FastAPI.openapi(app))
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
 # Custom Swagger UI with styling
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
@@ -799,6 +822,11 @@ if __name__ == "__main__":
         "mcp.server:app",
         host=settings.mcp_server_host,
         port=settings.mcp_server_port,
+        loop=settings.mcp_server_loop,
+        http=settings.mcp_server_http,
+        workers=settings.mcp_server_workers,
+        backlog=settings.mcp_server_backlog,
+        limit_concurrency=settings.mcp_server_limit_concurrency,
         reload=settings.environment == "development",
         log_level=settings.log_level.lower()
     )
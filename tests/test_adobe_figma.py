@@ -36,6 +36,400 @@ class TestAdobePDFClient:
         # Should not raise errors
         assert pdf_client is not None
 
+    @pytest.mark.parametrize("use_selectolax", [True, False])
+    def test_html_to_text_skips_styles(self, monkeypatch, use_selectolax):
+        """Test text extraction drops CSS with and without selectolax."""
+        from mcp.integrations import adobe_pdf_client
+        if not use_selectolax:
+            monkeypatch.setattr(adobe_pdf_client, "_SelectolaxParser", None)
+        elif adobe_pdf_client._SelectolaxParser is None:
+            pytest.skip("selectolax not installed")
+        text = adobe_pdf_client._html_to_text(
+            "<html><head><style>h1 { color: red; }</style></head>"
+            "<body><h1>Churn Report</h1><p>At risk: 42</p></body></html>"
+        )
+        assert "Churn Report" in text
+        assert "At risk: 42" in text
+        assert "color" not in text
+
+    def test_generate_html_report_accepts_streamed_chunks(self, tmp_path):
+        """Test mock mode accepts HTML as an iterable of chunks."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        output = tmp_path / "report.pdf"
+        pdf_client.generate_html_report(iter(["<h1>Stream", "ed</h1>"]), str(output))
+        assert b"(Streamed) Tj" in output.read_bytes()
+
+    def test_html_to_text_passes_plaintext_through(self):
+        """Test text without markup skips HTML parsing."""
+        from mcp.integrations import adobe_pdf_client
+        text = "Line one\nLine two (plain)"
+        assert adobe_pdf_client._html_to_text(text) is text
+
+    def test_generate_html_report_mock_mode(self, tmp_path):
+        """Test mock mode writes a text PDF from HTML content."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        output = tmp_path / "report.pdf"
+        path = pdf_client.generate_html_report("<h1>Incident (P1)</h1>", str(output))
+        data = output.read_bytes()
+        assert path == str(output)
+        assert data.startswith(b"%PDF-1.4")
+        assert b"(Incident \\(P1\\)) Tj" in data
+        assert data.rstrip().endswith(b"%%EOF")
+
+    def test_generate_html_report_wraps_long_lines(self, tmp_path):
+        """Test long paragraphs are wrapped rather than truncated."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        words = [f"word{i}" for i in range(40)]
+        output = tmp_path / "report.pdf"
+        pdf_client.generate_html_report(f"<p>{' '.join(words)}</p>", str(output))
+        data = output.read_bytes()
+        assert all(word.encode() in data for word in words)
+        assert data.count(b") Tj") > 1
+
+    @pytest.mark.asyncio
+    async def test_generate_reports_async_run_concurrently(self, tmp_path):
+        """Test async report variants write PDFs from worker threads."""
+        import asyncio
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        outputs = [str(tmp_path / f"report_{i}.pdf") for i in range(3)]
+        paths = await asyncio.gather(*(
+            pdf_client.generate_html_report_async(f"<h1>Report {i}</h1>", path)
+            for i, path in enumerate(outputs)
+        ))
+        assert paths == outputs
+        assert all((tmp_path / f"report_{i}.pdf").exists() for i in range(3))
+
+    def test_executive_summary_reuses_weasyprint_font_config(self, monkeypatch, tmp_path):
+        """Test WeasyPrint renders share one cached FontConfiguration."""
+        from mcp.integrations import adobe_pdf_client
+        font_configs = []
+
+        class FakeHTML:
+            def __init__(self, string):
+                self.string = string
+
+            def write_pdf(self, path, font_config=None):
+                font_configs.append(font_config)
+                with open(path, "wb") as f:
+                    f.write(b"%PDF-weasy")
+
+        shared = object()
+        monkeypatch.setattr(adobe_pdf_client, "_load_weasyprint", lambda: (FakeHTML, shared))
+        monkeypatch.chdir(tmp_path)
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        for _ in range(2):
+            pdf_client.generate_executive_summary({"timestamp": "2026-01-01T00:00:00Z"})
+        assert font_configs == [shared, shared]
+
+    @pytest.mark.parametrize("use_reportlab", [True, False])
+    def test_create_text_pdf(self, monkeypatch, tmp_path, use_reportlab):
+        """Test text PDFs are written with and without ReportLab."""
+        from mcp.integrations import adobe_pdf_client
+        if not use_reportlab:
+            monkeypatch.setattr(adobe_pdf_client, "_Canvas", None)
+        elif adobe_pdf_client._Canvas is None:
+            pytest.skip("reportlab not installed")
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        output = tmp_path / "summary.pdf"
+        lines = ["=== HEADER ===", "* item (1)"] + [f"line {i}" for i in range(60)]
+        pdf_client._create_text_pdf(lines, str(output))
+        data = output.read_bytes()
+        assert data.startswith(b"%PDF-")
+        assert data.rstrip().endswith(b"%%EOF")
+
+    def test_executive_summary_lines_wrap_numbered_items(self):
+        """Test long insights wrap under their number with indented continuations."""
+        lines = AdobePDFClient._executive_summary_lines(
+            {"Churn": "2.1%"}, ["short", "word " * 30], ["act"], False, "now"
+        )
+        assert "  Churn: 2.1%" in lines
+        assert "  1. short" in lines
+        wrapped = [line for line in lines if "word" in line]
+        assert wrapped[0].startswith("  2. word")
+        assert all(line.startswith("     word") for line in wrapped[1:])
+        assert all(len(line) <= 70 for line in wrapped)
+        assert "  1. act" in lines
+
+    def test_executive_summary_accepts_datetime_timestamp(self, monkeypatch):
+        """Test a datetime timestamp is formatted without ISO parsing."""
+        from datetime import datetime
+        from mcp.integrations import adobe_pdf_client
+
+        def fail_parse(value):
+            raise AssertionError("datetime timestamps should not be parsed")
+
+        monkeypatch.setattr(adobe_pdf_client, "_parse_iso_datetime", fail_parse)
+        lines = []
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        monkeypatch.setattr(adobe_pdf_client, "_load_weasyprint", lambda: None)
+        monkeypatch.setattr(
+            pdf_client, "_create_text_pdf",
+            lambda text_lines, output_path: lines.extend(text_lines) or output_path
+        )
+        pdf_client.generate_executive_summary({"timestamp": datetime(2026, 3, 1, 9, 30)})
+        assert "Generated: March 01, 2026 at 09:30 AM" in lines
+
+    def test_churn_report_template_escapes_values(self, monkeypatch):
+        """Test churn report renders data through the escaped template."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        captured = {}
+
+        def fake_generate(html_content, output_path):
+            captured["html"] = "".join(html_content)
+            return output_path
+
+        monkeypatch.setattr(pdf_client, "generate_html_report", fake_generate)
+        pdf_client.generate_churn_report({
+            "at_risk_count": 12500,
+            "revenue_at_risk": 4.2,
+            "top_cohorts": ["<script>x</script>", "Sports Fans"],
+        })
+        html = captured["html"]
+        assert "12,500" in html
+        assert "<li><strong>Sports Fans</strong></li>" in html
+        assert "&lt;script&gt;x&lt;/script&gt;" in html
+
+    @pytest.mark.parametrize("image_url, embedded", [
+        ("https://figma.example/frame.png", True),
+        ("data:image/png;base64,AAAA", False),
+        ("javascript:alert(1)", False),
+    ])
+    def test_executive_summary_escapes_user_fields(self, image_url, embedded):
+        """Test executive summary escapes insights and only embeds http(s) images."""
+        from mcp.integrations import adobe_pdf_client
+        html = adobe_pdf_client._EXECUTIVE_SUMMARY_TMPL.render(
+            metrics={"<b>MRR</b>": "$1 & up"},
+            insights=["<img src=x onerror=alert(1)>"],
+            recommendations=["Fix \"quotes\""],
+            figma_image_url=image_url,
+            governance={},
+        )
+        assert "&lt;b&gt;MRR&lt;/b&gt;" in html
+        assert "$1 &amp; up" in html
+        assert "&lt;img src=x onerror=alert(1)&gt;" in html
+        assert "Fix &#34;quotes&#34;" in html
+        assert ('alt="Figma Dashboard Design"' in html) is embedded
+
+    def test_churn_report_without_counts(self, monkeypatch):
+        """Test churn report renders when the at-risk count is missing."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        captured = {}
+        monkeypatch.setattr(
+            pdf_client, "generate_html_report",
+            lambda html_content, output_path: captured.setdefault("html", "".join(html_content))
+        )
+        pdf_client.generate_churn_report({"revenue_at_risk": 1250.4})
+        assert "N/A</p>" in captured["html"]
+        assert "$1,250M" in captured["html"]
+
+    def test_incident_report_rows_escaped(self, monkeypatch):
+        """Test incident rows escape fields and map status to a CSS class."""
+        pdf_client = AdobePDFClient(
+            client_id="", client_secret="", organization_id="", enabled=False
+        )
+        captured = {}
+        monkeypatch.setattr(
+            pdf_client, "generate_html_report",
+            lambda html_content, output_path: captured.setdefault("html", "".join(html_content))
+        )
+        pdf_client.generate_incident_report({
+            "critical_issues": [
+                {"title": "CDN <edge> down", "impact": "High", "status": "In Progress"},
+                {"title": "Retry", "impact": "Low", "status": None},
+            ]
+        })
+        html = captured["html"]
+        assert "CDN &lt;edge&gt; down" in html
+        assert '<span class="status-in-progress">In Progress</span>' in html
+        assert '<span class="status-none">None</span>' in html
+
+
+class _FakeResponse:
+    def __init__(self, payload=None, headers=None, content=b"", status_code=200):
+        self._payload = payload or {}
+        self.headers = headers or {}
+        self.content = content
+        self.status_code = status_code
+        self.text = content.decode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _FakePDFServices:
+    """Records PDF Services REST calls and answers them with canned data."""
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url))
+        if url.endswith("/token"):
+            return _FakeResponse({"access_token": "tok", "expires_in": 86400})
+        if url.endswith("/assets"):
+            return _FakeResponse({"uploadUri": "https://upload", "assetID": "a1"})
+        return _FakeResponse(headers={"location": "https://job"})
+
+    def put(self, url, **kwargs):
+        self.calls.append(("PUT", url))
+        return _FakeResponse()
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        if url == "https://job":
+            return _FakeResponse({"status": "done", "asset": {"downloadUri": "https://pdf"}})
+        return _FakeResponse(content=b"%PDF-1.7 adobe")
+
+
+class TestCreateAdobePDFClient:
+    """Test suite for the Adobe PDF client factory."""
+
+    def test_factory_returns_cached_client(self, monkeypatch):
+        """Test the factory builds one client per process."""
+        from mcp.integrations.adobe_pdf_client import create_adobe_pdf_client
+        monkeypatch.delenv("ADOBE_PDF_ENABLED", raising=False)
+        create_adobe_pdf_client.cache_clear()
+        try:
+            first = create_adobe_pdf_client()
+            assert first is create_adobe_pdf_client()
+            assert first.enabled is False
+        finally:
+            create_adobe_pdf_client.cache_clear()
+
+    def test_factory_reuses_mock_client_across_cache_clears(self, monkeypatch):
+        """Test unconfigured factories share one disabled client."""
+        from mcp.integrations.adobe_pdf_client import create_adobe_pdf_client
+        monkeypatch.setenv("ADOBE_PDF_ENABLED", "true")
+        monkeypatch.delenv("ADOBE_CLIENT_ID", raising=False)
+        create_adobe_pdf_client.cache_clear()
+        try:
+            first = create_adobe_pdf_client()
+            create_adobe_pdf_client.cache_clear()
+            monkeypatch.setenv("ADOBE_PDF_ENABLED", "false")
+            assert create_adobe_pdf_client() is first
+            assert first.client_id == "mock"
+        finally:
+            create_adobe_pdf_client.cache_clear()
+
+
+class TestAdobePDFClientREST:
+    """Test suite for the PDF Services REST path."""
+
+    def test_access_token_cached_across_reports(self, monkeypatch, tmp_path):
+        """Test the access token is fetched once and reused."""
+        fake = _FakePDFServices()
+        pdf_client = AdobePDFClient(
+            client_id="id", client_secret="secret", organization_id="org"
+        )
+        monkeypatch.setattr(pdf_client, "_http", fake)
+        pdf_client._use_sdk = False
+
+        for i in range(2):
+            output = tmp_path / f"report_{i}.pdf"
+            pdf_client.generate_html_report("<h1>Report</h1>", str(output))
+            assert output.read_bytes() == b"%PDF-1.7 adobe"
+
+        token_calls = [c for c in fake.calls if c[1].endswith("/token")]
+        assert len(token_calls) == 1
+
+    def test_access_token_refreshed_near_expiry(self, monkeypatch):
+        """Test a token inside the refresh margin is replaced."""
+        fake = _FakePDFServices()
+        pdf_client = AdobePDFClient(
+            client_id="id", client_secret="secret", organization_id="org"
+        )
+        monkeypatch.setattr(pdf_client, "_http", fake)
+        pdf_client._access_token = "stale"
+        pdf_client._token_expires_at = 0
+
+        assert pdf_client._get_access_token() == "tok"
+        assert len(fake.calls) == 1
+
+    def test_session_retries_rate_limits(self):
+        """Test the pooled session retries throttled and 5xx idempotent requests."""
+        pdf_client = AdobePDFClient(
+            client_id="id", client_secret="secret", organization_id="org"
+        )
+        retry = pdf_client._http.get_adapter("https://pdf-services.adobe.io").max_retries
+        assert retry.total == 3
+        assert 429 in retry.status_forcelist
+        assert retry.is_retry("GET", 503)
+        assert not retry.is_retry("POST", 503)
+
+
+class TestAdobePDFClientSDK:
+    """Test suite for the Adobe SDK path."""
+
+    def test_sdk_path_streams_html_without_temp_file(self, monkeypatch, tmp_path):
+        """Test HTML is handed to the SDK from memory."""
+        captured = {}
+
+        class FakeFileRef:
+            @staticmethod
+            def create_from_stream(stream, media_type):
+                captured["input"] = (stream.read(), media_type)
+                return FakeFileRef()
+
+            def save_as(self, path):
+                with open(path, "wb") as f:
+                    f.write(b"%PDF-sdk")
+
+        class FakeOperation:
+            @staticmethod
+            def create_new():
+                return FakeOperation()
+
+            def set_input(self, source):
+                pass
+
+            def execute(self, context):
+                return FakeFileRef()
+
+        monkeypatch.chdir(tmp_path)
+
+        pdf_client = AdobePDFClient(
+            client_id="id", client_secret="secret", organization_id="org"
+        )
+        pdf_client._use_sdk = True
+        pdf_client._FileRef = FakeFileRef
+        pdf_client._CreatePDFOperation = FakeOperation
+        pdf_client.execution_context = object()
+        pdf_client.generate_html_report("<h1>Report</h1>", "out.pdf")
+
+        assert captured["input"] == (b"<h1>Report</h1>", "text/html")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["out.pdf"]
+
 
 class TestAdobeStorageClient:
     """Test suite for Adobe Storage client."""
@@ -56,6 +450,21 @@ class TestAdobeStorageClient:
         )
         assert storage_client.enabled is False
     
+    def test_factory_returns_cached_client(self, monkeypatch):
+        """Test the factory builds one client and reads the environment once."""
+        from mcp.integrations.adobe_storage_client import create_adobe_storage_client
+        monkeypatch.delenv("ADOBE_STORAGE_ENABLED", raising=False)
+        monkeypatch.setenv("ENVIRONMENT", "staging")
+        create_adobe_storage_client.cache_clear()
+        try:
+            first = create_adobe_storage_client()
+            monkeypatch.setenv("ENVIRONMENT", "production")
+            assert create_adobe_storage_client() is first
+            assert first.enabled is False
+            assert first._environment == "staging"
+        finally:
+            create_adobe_storage_client.cache_clear()
+
     def test_get_storage_usage(self):
         """Test getting storage usage."""
         storage_client = AdobeStorageClient(
@@ -65,6 +474,282 @@ class TestAdobeStorageClient:
         result = storage_client.get_storage_usage()
         assert isinstance(result, dict)
 
+    @pytest.mark.parametrize("use_toolbelt", [True, False])
+    def test_upload_file_streams_from_disk(self, monkeypatch, tmp_path, use_toolbelt):
+        """Test uploads pass the open file handle instead of its contents."""
+        from mcp.integrations import adobe_storage_client
+        if not use_toolbelt:
+            monkeypatch.setattr(adobe_storage_client, "MultipartEncoder", None)
+        elif adobe_storage_client.MultipartEncoder is None:
+            pytest.skip("requests-toolbelt not installed")
+        path = tmp_path / "app.log"
+        path.write_bytes(b"x" * 1000)
+        captured = {}
+
+        def fake_post(url, headers=None, **kwargs):
+            captured.update(headers=headers or {}, **kwargs)
+            body = kwargs["data"].read() if use_toolbelt else kwargs["files"]["file"][1].read()
+            captured["body"] = body
+            return _FakeResponse(status_code=201, content=b'{"id": "f1"}')
+
+        storage_client = AdobeStorageClient(access_token="test-token", enabled=True)
+        monkeypatch.setattr(storage_client._http, "post", fake_post)
+        assert storage_client.upload_file(str(path)) == {"id": "f1"}
+        assert b"x" * 1000 in captured["body"]
+        content_type = captured["headers"].get("Content-Type", "")
+        assert content_type.startswith("multipart/form-data") if use_toolbelt else not content_type
+
+
+    def test_upload_file_requires_a_name_for_file_objects(self):
+        """Test missing upload sources or names raise ValueError."""
+        import io
+        storage_client = AdobeStorageClient(access_token="test-token", enabled=False)
+        with pytest.raises(ValueError):
+            storage_client.upload_file()
+        with pytest.raises(ValueError):
+            storage_client.upload_file(file_obj=io.BytesIO(b"data"))
+        assert storage_client.upload_file(
+            file_obj=io.BytesIO(b"data"), filename="a.txt"
+        )["size"] == 4
+
+    def test_upload_file_chunked_retries_single_range(self, monkeypatch, tmp_path):
+        """Test chunked uploads send every range and retry only the failed one."""
+        import threading
+        from mcp.integrations import adobe_storage_client
+        monkeypatch.setattr(adobe_storage_client.time, "sleep", lambda seconds: None)
+        path = tmp_path / "archive.log"
+        payload = bytes(range(256)) * 40  # 10240 bytes -> 3 chunks of 4096
+        path.write_bytes(payload)
+        received, attempts, lock = {}, [], threading.Lock()
+
+        def fake_post(url, headers=None, data=None):
+            if url.endswith("/files/uploads"):
+                return _FakeResponse(status_code=201, content=b'{"upload_id": "u1"}')
+            if url.endswith("/files/u1/commit"):
+                return _FakeResponse(status_code=201, content=b'{"id": "f1"}')
+            start = int(headers["Content-Range"].split()[1].split("-")[0])
+            with lock:
+                attempts.append(start)
+                if start == 4096 and attempts.count(start) == 1:
+                    return _FakeResponse(status_code=503)
+                received[start] = data
+            return _FakeResponse(status_code=204)
+
+        storage_client = AdobeStorageClient(access_token="test-token", enabled=True)
+        monkeypatch.setattr(storage_client._http, "post", fake_post)
+        result = storage_client.upload_file_chunked(str(path), chunk_size=4096, concurrency=3)
+        assert result == {"id": "f1"}
+        assert b"".join(received[start] for start in sorted(received)) == payload
+        assert sorted(attempts) == [0, 4096, 4096, 8192]
+
+    def test_upload_file_chunked_small_file_uses_single_upload(self, tmp_path):
+        """Test files within one chunk fall back to upload_file."""
+        path = tmp_path / "small.pdf"
+        path.write_bytes(b"%PDF")
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        result = storage_client.upload_file_chunked(str(path))
+        assert result["status"] == "mock_upload"
+        assert storage_client.upload_file_chunked(str(tmp_path / "missing.pdf"))["error"]
+
+    def test_calls_share_pooled_session(self, monkeypatch):
+        """Test API calls reuse one authenticated session until closed."""
+        calls = []
+        storage_client = AdobeStorageClient(access_token="test-token", enabled=True)
+        monkeypatch.setattr(
+            storage_client._http, "request",
+            lambda method, url, **kwargs: calls.append((method, url))
+            or _FakeResponse(status_code=204 if method == "DELETE" else 200, content=b'{"files": []}')
+        )
+        with storage_client:
+            assert storage_client.list_files() == []
+            assert storage_client.delete_file("f1") is True
+        assert [method for method, _ in calls] == ["GET", "DELETE"]
+        assert storage_client._http.headers["Authorization"] == "Bearer test-token"
+
+
+    def test_download_file_copies_raw_stream(self, monkeypatch, tmp_path):
+        """Test downloads copy the decoded raw stream to disk."""
+        import io
+        storage_client = AdobeStorageClient(access_token="test-token", enabled=True)
+        response = _FakeResponse()
+        response.raw = io.BytesIO(b"%PDF-1.4 report")
+        monkeypatch.setattr(storage_client._http, "get", lambda url, **kwargs: response)
+        destination = tmp_path / "report.pdf"
+        assert storage_client.download_file("f1", str(destination)) is True
+        assert destination.read_bytes() == b"%PDF-1.4 report"
+        assert response.raw.decode_content is True
+
+        monkeypatch.setattr(
+            storage_client._http, "get", lambda url, **kwargs: _FakeResponse(status_code=404)
+        )
+        assert storage_client.download_file("missing", str(tmp_path / "missing.pdf")) is False
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("report.PDF", "application/pdf"),
+        ("archive.2024.log", "text/plain"),
+        ("README", "application/octet-stream"),
+        ("pdf", "application/octet-stream"),
+        ("data.parquet", "application/octet-stream"),
+    ])
+    def test_get_content_type(self, filename, expected):
+        """Test content types resolve from the last extension."""
+        assert AdobeStorageClient._get_content_type(filename) == expected
+
+    @staticmethod
+    def _capture_uploads(monkeypatch, storage_client):
+        """Replace upload_file with a stub recording the uploaded name, bytes and metadata."""
+        captured = {}
+
+        def fake_upload(file_path=None, destination_folder=None, metadata=None,
+                        file_obj=None, filename=None):
+            if file_obj is None:
+                with open(file_path, "rb") as file_obj:
+                    captured["body"] = file_obj.read()
+            else:
+                captured["body"] = file_obj.read()
+            captured.update(path=file_path, name=filename, metadata=metadata)
+            return {"id": "uploaded"}
+
+        monkeypatch.setattr(storage_client, "upload_file", fake_upload)
+        return captured
+
+    def test_dashboard_export_json_uploaded_from_memory(self, monkeypatch):
+        """Test JSON exports are indented UTF-8 and never written to disk."""
+        import json
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        captured = self._capture_uploads(monkeypatch, storage_client)
+        data = {"churn_rate": 0.047, "region": "Améri", 2024: [1, 2]}
+        assert storage_client.upload_dashboard_export(data) == {"id": "uploaded"}
+        assert json.loads(captured["body"]) == {"churn_rate": 0.047, "region": "Améri", "2024": [1, 2]}
+        assert captured["body"].startswith(b'{\n  "churn_rate"')
+        assert captured["path"] is None
+        assert captured["name"].startswith("dashboard_export_") and captured["name"].endswith(".json")
+
+    @pytest.mark.parametrize("data", [
+        [{"show": "Halo", "genres": ["sci-fi"], "stats": {"views": 10, "note": "a\nb"}}, 7, "x", None],
+        [{"a": 1}],
+        [],
+        {"rows": [1, 2]},
+    ])
+    def test_json_export_rows_match_orjson(self, data):
+        """Test row-by-row JSON export is byte-identical to a single dump."""
+        import io
+        from mcp.integrations.adobe_storage_client import _write_json_export, JSON_EXPORT_OPTIONS
+        import orjson
+        buffer = io.BytesIO()
+        _write_json_export(buffer, data)
+        assert buffer.getvalue() == orjson.dumps(data, option=JSON_EXPORT_OPTIONS)
+
+    def test_dashboard_export_csv_uploaded_from_memory(self, monkeypatch):
+        """Test CSV exports are encoded from an in-memory buffer."""
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        captured = self._capture_uploads(monkeypatch, storage_client)
+        rows = [{"show": "Tulsa King", "views": 1200}, {"show": "Halo, S2", "views": 900}]
+        storage_client.upload_dashboard_export(rows, export_type="csv", name_prefix="shows")
+        assert captured["body"] == b'show,views\r\nTulsa King,1200\r\n"Halo, S2",900\r\n'
+        assert captured["name"].endswith(".csv")
+
+    def test_dashboard_export_csv_not_spooled(self, monkeypatch):
+        """Test CSV exports avoid SpooledTemporaryFile, which lacks readable() before 3.11."""
+        import tempfile
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        captured = self._capture_uploads(monkeypatch, storage_client)
+
+        def no_spool(*args, **kwargs):
+            raise AssertionError("CSV export must not use SpooledTemporaryFile")
+
+        monkeypatch.setattr(tempfile, "SpooledTemporaryFile", no_spool)
+        storage_client.upload_dashboard_export([{"a": 1}], export_type="csv")
+        assert captured["body"] == b"a\r\n1\r\n"
+
+    def test_dashboard_export_mock_upload_reports_buffer_size(self):
+        """Test mock uploads of in-memory exports report the buffer size."""
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        result = storage_client.upload_dashboard_export({"a": 1})
+        assert result["status"] == "mock_upload"
+        assert result["size"] == len(b'{\n  "a": 1\n}')
+
+    def test_upload_log_file_compressed(self, monkeypatch, tmp_path):
+        """Test compressed log uploads round-trip through zstd."""
+        zstd = pytest.importorskip("zstandard")
+        log = tmp_path / "app.log"
+        log.write_bytes(b"INFO request served\n" * 5000)
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        captured = self._capture_uploads(monkeypatch, storage_client)
+        assert storage_client.upload_log_file(str(log), compress=True) == {"id": "uploaded"}
+        assert captured["name"] == "app.log.zst"
+        assert captured["metadata"]["compression"] == "zstd"
+        assert len(captured["body"]) < log.stat().st_size // 10
+        assert zstd.ZstdDecompressor().stream_reader(captured["body"]).read() == log.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_batch_shares_one_timestamp(self, monkeypatch, tmp_path):
+        """Test uploads inside batch() reuse one timestamp, including async ones."""
+        from mcp.integrations import adobe_storage_client
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        captured = []
+        monkeypatch.setattr(
+            storage_client, "upload_file",
+            lambda file_path, destination_folder, metadata, **kwargs: captured.append(metadata) or {}
+        )
+        with storage_client.batch():
+            storage_client.upload_log_file(str(tmp_path / "a.log"))
+            await storage_client._run_async(storage_client.upload_pdf_report, "r.pdf", "churn")
+        assert captured[0]["archived_at"] == captured[1]["uploaded_at"]
+        assert adobe_storage_client._batch_timestamp.get() is None
+
+    def test_upload_log_file_without_zstd(self, monkeypatch, tmp_path):
+        """Test compression falls back to a plain upload without zstandard."""
+        from mcp.integrations import adobe_storage_client
+        monkeypatch.setattr(adobe_storage_client, "zstd", None)
+        log = tmp_path / "app.log"
+        log.write_text("INFO\n")
+        storage_client = AdobeStorageClient(access_token="test", enabled=False)
+        result = storage_client.upload_log_file(str(log), compress=True)
+        assert result["name"] == "app.log"
+        assert result["size"] == 5
+
+    @pytest.mark.parametrize("rows", [
+        [{"show": "Yellowstone", "views": 1200, "rating": 4.5}, {"show": "Tulsa, King", "views": None, "rating": 4.1}],
+        [{"show": "Yellowstone", "views": 1200}, {"show": "Halo"}],
+        [{"show": "Yellowstone"}, {"show": "Halo"}],
+    ])
+    def test_csv_rows_match_dictwriter(self, rows):
+        """Test the CSV fast path writes exactly what DictWriter would."""
+        import csv
+        import io
+        from mcp.integrations.adobe_storage_client import _write_csv_rows
+        expected = io.StringIO()
+        writer = csv.DictWriter(expected, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+        actual = io.StringIO()
+        _write_csv_rows(actual, rows)
+        assert actual.getvalue() == expected.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_upload_many_async_runs_concurrently(self, tmp_path):
+        """Test batch uploads overlap and keep input order."""
+        import asyncio
+        import threading
+        storage_client = AdobeStorageClient(access_token="test", enabled=False, max_concurrency=2)
+        barrier = threading.Barrier(2, timeout=5)
+        upload_file = storage_client.upload_file
+
+        def blocking_upload(path, folder, metadata, **kwargs):
+            barrier.wait()  # deadlocks unless two uploads run at once
+            return upload_file(path, folder, metadata, **kwargs)
+
+        storage_client.upload_file = blocking_upload
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"log_{i}.log"
+            path.write_text("x" * i)
+            paths.append(str(path))
+        results = await storage_client.upload_many_async(paths, "paramount-ops/logs")
+        assert [r["name"] for r in results] == [f"log_{i}.log" for i in range(4)]
+        assert [r["size"] for r in results] == [0, 1, 2, 3]
+
 
 class TestFigmaClient:
     """Test suite for Figma client."""
@@ -2,6 +2,8 @@
 Unit tests for Streaming QoE and Infrastructure REST API endpoints.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -57,6 +59,42 @@ class TestStreamingQoEEndpoints:
         data = response.json()
         assert isinstance(data, dict)
     
+    def test_buffering_hotspots_ndjson(self):
+        """Test buffering hotspots streamed as NDJSON when negotiated."""
+        response = client.get(
+            "/api/streaming/qoe/buffering-hotspots",
+            headers={"Accept": "application/x-ndjson"}
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["x-accel-buffering"] == "no"
+        
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records[0]["type"] == "summary"
+        assert all("type" in record for record in records)
+    
+    def test_buffering_hotspots_ndjson_honors_gzip_refusal(self):
+        """Test that q=0 on gzip (or an ndjson refusal) is respected."""
+        refused = client.get(
+            "/api/streaming/qoe/buffering-hotspots",
+            headers={"Accept": "application/x-ndjson", "Accept-Encoding": "gzip;q=0, identity"}
+        )
+        assert refused.status_code == 200
+        assert "content-encoding" not in refused.headers
+        
+        gzipped = client.get(
+            "/api/streaming/qoe/buffering-hotspots",
+            headers={"Accept": "application/x-ndjson", "Accept-Encoding": "br, gzip;q=0.5"}
+        )
+        assert gzipped.headers["content-encoding"] == "gzip"
+        
+        plain = client.get(
+            "/api/streaming/qoe/buffering-hotspots",
+            headers={"Accept": "application/json, application/x-ndjson;q=0"}
+        )
+        assert plain.headers["content-type"].startswith("application/json")
+    
     def test_buffering_hotspots_with_time_range(self):
         """Test buffering hotspots with custom time range."""
         response = client.get("/api/streaming/qoe/buffering-hotspots?time_range=12")
@@ -114,6 +152,13 @@ class TestInfrastructureEndpoints:
         data = response.json()
         assert isinstance(data, dict)
     
+    def test_openapi_descriptions_loaded(self):
+        """Test that deferred endpoint descriptions appear in the OpenAPI schema."""
+        schema = client.get("/openapi.json").json()
+        
+        operation = schema["paths"]["/api/streaming/qoe/metrics"]["get"]
+        assert "Quality of Experience" in operation["description"]
+    
     def test_streaming_health_check(self):
         """Test streaming APIs health check."""
         response = client.get("/api/streaming/health")
@@ -126,6 +171,95 @@ class TestInfrastructureEndpoints:
         assert "timestamp" in health
 
 
+class TestStreamingOverviewEndpoint:
+    """Test suite for the aggregated overview endpoint."""
+    
+    def test_get_overview_success(self):
+        """Test that the overview combines all sections."""
+        response = client.get("/api/streaming/overview")
+        
+        assert response.status_code == 200
+        data = response.json()
+        for section in ["qoe_metrics", "services", "incidents", "operational_health"]:
+            assert section in data
+        assert data["errors"] == {}
+        assert isinstance(data["qoe_metrics"], list)
+        assert isinstance(data["services"], list)
+    
+    def test_overview_partial_failure(self, monkeypatch):
+        """Test that one failing upstream does not fail the whole overview."""
+        from mcp.api import streaming
+        
+        async def failing_qoe(*args, **kwargs):
+            raise RuntimeError("conviva down")
+        
+        monkeypatch.setattr(streaming.get_conviva(), "get_qoe_metrics_async", failing_qoe)
+        response = client.get("/api/streaming/overview")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["qoe_metrics"] is None
+        assert data["errors"]["qoe_metrics"] == "conviva down"
+        assert isinstance(data["services"], list)
+
+
+class TestQoESnapshotRefresh:
+    """Test the background QoE snapshot refresher."""
+    
+    @pytest.mark.asyncio
+    async def test_refresher_fills_snapshot(self):
+        """Test that the refresher publishes an encoded QoE snapshot."""
+        from mcp.api import streaming
+        
+        streaming.start_background_refresh()
+        try:
+            body = await streaming._get_qoe_snapshot()
+            assert body is not None
+            metrics = json.loads(body)
+            assert [m["metric_name"] for m in metrics] == [
+                "buffering_rate", "video_start_failures", "average_bitrate"
+            ]
+        finally:
+            await streaming.stop_background_refresh()
+        
+        assert await streaming._get_qoe_snapshot() is None
+    
+    @pytest.mark.asyncio
+    async def test_failed_first_refresh_releases_readers(self, monkeypatch):
+        """Test that readers go live at once when the first refresh fails."""
+        import time
+        from mcp.api import streaming
+        
+        class DownConviva:
+            async def get_qoe_metrics_async(self, *args):
+                raise RuntimeError("conviva down")
+        
+        monkeypatch.setattr(streaming, "get_conviva", DownConviva)
+        streaming.start_background_refresh()
+        try:
+            started = time.monotonic()
+            assert await streaming._get_qoe_snapshot() is None
+            assert time.monotonic() - started < streaming.QOE_SNAPSHOT_WAIT
+        finally:
+            await streaming.stop_background_refresh()
+    
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_not_served(self, monkeypatch):
+        """Test that a snapshot past its maximum age falls back to live data."""
+        from mcp.api import streaming
+        
+        streaming.start_background_refresh()
+        try:
+            assert await streaming._get_qoe_snapshot() is not None
+            monkeypatch.setitem(
+                streaming._qoe_snapshot, "updated",
+                streaming._qoe_snapshot["updated"] - streaming.QOE_SNAPSHOT_MAX_AGE - 1
+            )
+            assert await streaming._get_qoe_snapshot() is None
+        finally:
+            await streaming.stop_background_refresh()
+
+
 class TestStreamingAPIDataValidation:
     """Test data validation in Streaming API."""
     
@@ -186,6 +320,63 @@ class TestStreamingAPIQueryParameters:
             assert response.status_code == 200
 
 
+class TestStreamingAPICaching:
+    """Test HTTP caching headers on monitoring endpoints."""
+    
+    def test_qoe_metrics_cache_control(self):
+        """Test that QoE metrics are cacheable for 30 seconds."""
+        response = client.get("/api/streaming/qoe/metrics")
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=30, stale-while-revalidate=60"
+    
+    def test_operational_health_etag(self):
+        """Test that an unchanged operational health summary returns 304."""
+        response = client.get("/api/streaming/infrastructure/operational-health")
+        
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        
+        cached = client.get(
+            "/api/streaming/infrastructure/operational-health",
+            headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+    
+    def test_operational_health_memoized_within_cache_window(self, monkeypatch):
+        """Test that revalidations inside the cache window skip the upstream fan-out."""
+        from mcp.api import streaming
+        
+        monkeypatch.setitem(streaming._health_cache, "expires", 0.0)
+        calls = []
+        newrelic = streaming.get_newrelic()
+        summary = newrelic.get_operational_health_summary_async
+        
+        async def counting_summary():
+            calls.append(1)
+            return await summary()
+        
+        monkeypatch.setattr(newrelic, "get_operational_health_summary_async", counting_summary)
+        etag = client.get("/api/streaming/infrastructure/operational-health").headers["etag"]
+        cached = client.get(
+            "/api/streaming/infrastructure/operational-health",
+            headers={"If-None-Match": etag}
+        )
+        
+        assert cached.status_code == 304
+        assert calls == [1]
+    
+    def test_incidents_cache_control(self):
+        """Test that incidents use a short cache lifetime."""
+        response = client.get("/api/streaming/infrastructure/incidents")
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=5"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -150,6 +150,124 @@ class TestConvivaClient:
         
         # Plays should be positive
         assert overall["plays"] > 0
+    
+    @staticmethod
+    def _breakdown_row(dimension, value, buffering_ratio):
+        return {
+            "dimension": dimension,
+            "value": value,
+            "metrics": {"buffering_ratio": buffering_ratio},
+            "churn_impact": buffering_ratio * 10,
+        }
+    
+    @staticmethod
+    def _mock_async_client(monkeypatch, handler):
+        import httpx
+        
+        async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, "AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(handler))
+        )
+    
+    @pytest.mark.asyncio
+    async def test_buffering_hotspots_batch_dimensions(self, monkeypatch):
+        """Live hotspot analysis fetches country and device in one request."""
+        import httpx
+        from mcp.integrations import ConvivaClient
+        
+        dimensions = []
+        
+        def handler(request):
+            dimensions.append(request.url.params["dimensions"])
+            return httpx.Response(200, json={"data": {"plays": 100, "breakdown": [
+                self._breakdown_row("country", "IN", 0.05),
+                self._breakdown_row("device_type", "mobile", 0.03),
+                self._breakdown_row("country", "US", 0.01),
+            ]}})
+        
+        self._mock_async_client(monkeypatch, handler)
+        client = ConvivaClient(mock_mode=False)
+        client.invalidate_cache()
+        result = await client.get_buffering_hotspots_async()
+        await client.close()
+        
+        assert dimensions == ["country,device_type"]
+        assert [row["value"] for row in result["geographic_hotspots"]] == ["IN", "US"]
+        assert [row["value"] for row in result["device_hotspots"]] == ["mobile"]
+    
+    @pytest.mark.asyncio
+    async def test_buffering_hotspots_refetch_missing_dimension(self, monkeypatch):
+        """A dimension absent from the batched response is fetched on its own."""
+        import httpx
+        from mcp.integrations import ConvivaClient
+        
+        dimensions = []
+        
+        def handler(request):
+            requested = request.url.params["dimensions"]
+            dimensions.append(requested)
+            rows = [self._breakdown_row("country", "BR", 0.04)]
+            if requested == "device_type":
+                rows = [self._breakdown_row("device_type", "web", 0.02)]
+            return httpx.Response(200, json={"data": {"plays": 100, "breakdown": rows}})
+        
+        self._mock_async_client(monkeypatch, handler)
+        client = ConvivaClient(mock_mode=False)
+        client.invalidate_cache()
+        result = await client.get_buffering_hotspots_async()
+        await client.close()
+        
+        assert dimensions == ["country,device_type", "device_type"]
+        assert [row["value"] for row in result["geographic_hotspots"]] == ["BR"]
+        assert [row["value"] for row in result["device_hotspots"]] == ["web"]
+    
+    def test_client_from_previous_loop_is_closed(self):
+        """Rebuilding the HTTP client for a new loop closes the old pool."""
+        import asyncio
+        from mcp.integrations import ConvivaClient
+        
+        client = ConvivaClient(mock_mode=False)
+        first = asyncio.run(client._ensure_client())
+        second = asyncio.run(client._ensure_client())
+        
+        assert second is not first
+        assert first.is_closed
+        asyncio.run(client.close())
+        assert second.is_closed
+    
+    def test_live_qoe_metrics_use_ttl_cache(self, monkeypatch):
+        """Repeat live QoE queries are served from the TTL cache until invalidated."""
+        import httpx
+        from mcp.integrations import ConvivaClient
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.url.params.get("dimensions"))
+            return httpx.Response(200, json={"data": {"plays": 100}})
+        
+        self._mock_async_client(monkeypatch, handler)
+        client = ConvivaClient(mock_mode=False)
+        client.invalidate_cache()
+        
+        first = client.get_qoe_metrics(dimension="cdn")
+        first["overall"]["plays"] = -1
+        second = client.get_qoe_metrics(dimension="cdn")
+        assert second["overall"]["plays"] == 100
+        client.get_qoe_metrics(dimension="isp")
+        assert requests_seen == ["cdn", "isp"]
+        
+        # Clients for another account do not share cached responses
+        other = ConvivaClient(mock_mode=False)
+        other.customer_key = "other-customer"
+        other.get_qoe_metrics(dimension="cdn")
+        assert requests_seen == ["cdn", "isp", "cdn"]
+        other.invalidate_cache()
+        
+        client.invalidate_cache()
+        client.get_qoe_metrics(dimension="cdn")
+        assert requests_seen == ["cdn", "isp", "cdn", "cdn"]
 
 
 class TestNewRelicClient:
@@ -162,6 +280,19 @@ class TestNewRelicClient:
         client = NewRelicClient(mock_mode=True)
         assert client.mock_mode is True
     
+    def test_client_from_previous_loop_is_closed(self):
+        """Rebuilding the HTTP client for a new loop closes the old pool."""
+        import asyncio
+        from mcp.integrations import NewRelicClient
+        
+        client = NewRelicClient(mock_mode=False)
+        first = asyncio.run(client._ensure_client())
+        second = asyncio.run(client._ensure_client())
+        
+        assert second is not first
+        assert first.is_closed
+        asyncio.run(client.close())
+    
     def test_get_apm_metrics(self):
         """Test fetching APM metrics."""
         from mcp.integrations import NewRelicClient
@@ -274,6 +405,99 @@ class TestAnalyticsClient:
         # Check actual structure
         assert "total_ltv_at_risk" in ltv
         assert "cohort_ltv_ranking" in ltv
+    
+    def test_cohorts_generated_once_until_invalidated(self, monkeypatch):
+        """Test chained metric calls reuse one cohort generation."""
+        from mcp.integrations import AnalyticsClient
+        
+        client = AnalyticsClient(mock_mode=True)
+        calls = []
+        generate = client.generator.generate
+        monkeypatch.setattr(
+            client.generator, "generate",
+            lambda num_cohorts: calls.append(num_cohorts) or generate(num_cohorts=num_cohorts)
+        )
+        
+        client.get_retention_metrics()
+        client.get_engagement_metrics()
+        client.get_ltv_analysis()
+        client.get_churn_cohorts(risk_threshold=0.9)
+        assert calls == [5]
+        
+        client.invalidate_cache()
+        client.get_cohort_by_id("COHORT-001")
+        assert calls == [5, 5]
+    
+    def test_live_cohorts_use_ttl_cache(self, monkeypatch):
+        """Test live cohorts are fetched once and filtered per call."""
+        from mcp.integrations import AnalyticsClient
+        
+        client = AnalyticsClient(mock_mode=False)
+        client.invalidate_cache()
+        calls = []
+        cohorts = [
+            {"cohort_id": "COHORT-001", "churn_risk_score": 0.8, "size": 50000},
+            {"cohort_id": "COHORT-002", "churn_risk_score": 0.4, "size": 5000},
+        ]
+        monkeypatch.setattr(client, "_fetch_from_analytics", lambda: calls.append(1) or cohorts)
+        
+        assert len(client.get_churn_cohorts(risk_threshold=0.0, min_cohort_size=0)) == 2
+        assert [c["cohort_id"] for c in client.get_churn_cohorts()] == ["COHORT-001", "COHORT-002"]
+        assert [c["cohort_id"] for c in client.get_churn_cohorts(risk_threshold=0.5)] == ["COHORT-001"]
+        assert calls == [1]
+        client.invalidate_cache()
+    
+    def test_aggregates_match_cohort_sums(self):
+        """Test vectorized retention and LTV aggregates match per-cohort sums."""
+        from mcp.integrations import AnalyticsClient
+        
+        client = AnalyticsClient(mock_mode=True)
+        cohorts = client.get_churn_cohorts(risk_threshold=0.0, min_cohort_size=0)
+        metrics = client.get_retention_metrics()
+        ltv = client.get_ltv_analysis()
+        
+        total = sum(c["size"] for c in cohorts)
+        assert metrics["total_subscribers"] == total
+        assert metrics["total_at_risk_30d"] == sum(c["projected_churners_30d"] for c in cohorts)
+        assert metrics["weighted_avg_risk_score"] == round(
+            sum(c["churn_risk_score"] * c["size"] for c in cohorts) / total, 2
+        )
+        assert ltv["total_ltv_at_risk"] == pytest.approx(
+            sum(c["avg_lifetime_value"] * c["projected_churners_30d"] for c in cohorts)
+        )
+        assert ltv["high_value_cohorts"] == sum(c["avg_lifetime_value"] >= 500 for c in cohorts)
+        assert type(metrics["total_subscribers"]) is int
+        assert type(ltv["total_ltv_at_risk"]) is float
+    
+    def test_ltv_analysis_zero_impact(self, monkeypatch):
+        """Test LTV analysis ranks cohorts and tolerates zero financial impact."""
+        from mcp.integrations import AnalyticsClient
+        
+        client = AnalyticsClient(mock_mode=True)
+        cohorts = [
+            {"cohort_id": f"COHORT-00{i}", "name": f"C{i}", "size": 1000, "churn_risk_score": 0.5,
+             "projected_churners_30d": 0, "financial_impact_30d": 0.0, "avg_lifetime_value": ltv}
+            for i, ltv in enumerate([200.0, 900.0, 200.0], start=1)
+        ]
+        monkeypatch.setattr(client, "_load_all_cohorts", lambda: cohorts)
+        
+        ltv = client.get_ltv_analysis()
+        assert ltv["high_value_impact_pct"] == 0
+        assert ltv["high_value_cohorts"] == 1
+        assert [c["cohort_id"] for c in ltv["cohort_ltv_ranking"]] == ["COHORT-002", "COHORT-001", "COHORT-003"]
+    
+    def test_aggregate_kernels_agree(self):
+        """Test the single-pass kernel matches the NumPy fallback."""
+        from mcp.integrations import analytics_client
+        
+        client = analytics_client.AnalyticsClient(mock_mode=True)
+        arrays = client._cohort_arrays(client.get_churn_cohorts(risk_threshold=0.0, min_cohort_size=0))
+        columns = [arrays[name] for name in analytics_client.COHORT_ARRAY_FIELDS]
+        
+        loop = analytics_client._aggregate_cohorts_loop(*columns)
+        vectorized = analytics_client._aggregate_cohorts_numpy(*columns)
+        assert loop == pytest.approx(vectorized)
+        assert loop[5] == 1  # one cohort at or above the high-value LTV
 
 
 class TestContentAPIClient:
@@ -292,6 +516,57 @@ class TestContentAPIClient:
         show = catalog[0]
         assert "show_id" in show
         assert "name" in show
+    
+    def test_catalog_generated_once_until_invalidated(self, monkeypatch):
+        """Test summary methods share one catalog generation."""
+        from mcp.integrations import ContentAPIClient
+        
+        client = ContentAPIClient(mock_mode=True)
+        calls = []
+        generate = client.generator.generate
+        monkeypatch.setattr(
+            client.generator, "generate",
+            lambda num_shows: calls.append(num_shows) or generate(num_shows=num_shows)
+        )
+        
+        summary = client.get_performance_summary()
+        client.get_genre_analysis()
+        client.get_monetization_summary()
+        top = summary["top_by_viewing_hours"][0]
+        assert client.get_show_by_id(top["show_id"])["name"] == top["name"]
+        assert client.get_show_by_name(top["name"].upper())["show_id"] == top["show_id"]
+        assert calls == [50]
+        
+        client.invalidate_cache()
+        client.get_content_catalog(genre="Drama")
+        assert calls == [50, 50]
+
+    def test_live_fractional_values_not_truncated(self, monkeypatch):
+        """Test float metrics from the live API keep their precision in totals and rankings."""
+        from mcp.integrations import ContentAPIClient
+
+        shows = [
+            {
+                "show_id": f"SHOW-{i}", "name": f"Show {i}", "genre": "Drama", "tier": "catalog",
+                "is_original": False, "viewing_hours_30d": hours, "unique_viewers_30d": 10,
+                "completion_rate": 0.5, "avg_rating": 4.0, "retention_contribution": 0.1,
+                "monetization": {
+                    "ad_revenue_30d": revenue, "subscription_attribution": 2,
+                    "licensing_revenue_annual": 0,
+                },
+            }
+            for i, (hours, revenue) in enumerate([(1.7, 100.25), (1.2, 0.5)])
+        ]
+        client = ContentAPIClient(mock_mode=False)
+        monkeypatch.setattr(client, "_fetch_from_api", lambda genre, tier, limit: shows)
+
+        summary = client.get_performance_summary()
+        assert summary["total_viewing_hours_30d"] == pytest.approx(2.9)
+        assert summary["total_unique_viewers_30d"] == 20
+        assert isinstance(summary["total_unique_viewers_30d"], int)
+        assert [s["show_id"] for s in summary["top_by_viewing_hours"]] == ["SHOW-0", "SHOW-1"]
+        assert client.get_monetization_summary()["total_ad_revenue_30d"] == pytest.approx(100.75)
+        assert client.get_genre_analysis()["by_genre"]["Drama"]["total_viewing_hours"] == pytest.approx(2.9)
 
 
 class TestEmailParser:
@@ -385,6 +660,606 @@ class TestFigmaClient:
         assert components[0].name is not None
 
 
+class TestAtlassianClient:
+    """Tests for the JIRA/Confluence client against a mocked transport."""
+    
+    @staticmethod
+    def _live_client(handler):
+        """Build a live-mode client whose HTTP calls hit ``handler``."""
+        import httpx
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient(
+            jira_url="https://jira.test",
+            jira_username="bot",
+            jira_api_token="token",
+            confluence_url="https://wiki.test",
+            confluence_username="bot",
+            confluence_api_token="token",
+            mock_mode=False
+        )
+        client._sync_client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+    
+    def test_sync_calls_reuse_pooled_client(self, monkeypatch):
+        """Sync entrypoints share one HTTP client instead of spinning up event loops."""
+        import asyncio
+        import httpx
+        
+        def fail_run(*args, **kwargs):
+            raise AssertionError("asyncio.run should not be used")
+        
+        monkeypatch.setattr(asyncio, "run", fail_run)
+        seen = []
+        
+        def handler(request):
+            seen.append((request.method, request.url.path))
+            if request.url.path.endswith("/search/jql"):
+                return httpx.Response(200, json={"issues": [
+                    {"key": "PROD-1", "fields": {"summary": "Broken", "status": {"name": "Open"}}}
+                ]})
+            if request.url.path.endswith("/project"):
+                return httpx.Response(200, json=[{"key": "PROD"}])
+            return httpx.Response(200, json={"id": "42", "title": "Runbook", "space": {"key": "OPS"}})
+        
+        client = self._live_client(handler)
+        pooled = client._sync_client
+        
+        issues = client.search_issues(project="PROD")
+        assert [i.key for i in issues] == ["PROD-1"]
+        assert client.get_projects() == [{"key": "PROD"}]
+        assert client.get_page("42").title == "Runbook"
+        assert client._ensure_sync_client() is pooled
+        assert seen == [
+            ("POST", "/rest/api/3/search/jql"),
+            ("GET", "/rest/api/3/project"),
+            ("GET", "/wiki/rest/api/content/42"),
+        ]
+    
+    def test_sync_search_falls_back_on_http_error(self):
+        """HTTP errors on the sync path fall back to mock issues."""
+        import httpx
+        
+        client = self._live_client(lambda request: httpx.Response(500))
+        issues = client.search_issues(project="STREAM")
+        
+        assert issues and all(i.project == "STREAM" for i in issues)
+        assert client.get_issue("PROD-1") is None
+    
+    def test_rate_limiter_spaces_requests_once_bucket_is_empty(self):
+        """Requests beyond the burst capacity wait for the bucket to refill."""
+        from mcp.integrations.atlassian_client import AtlassianRateLimiter
+        
+        limiter = AtlassianRateLimiter(fill_rate=2, interval=1.0)
+        waits = [limiter._reserve() for _ in range(3)]
+        
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.5, abs=0.05)
+    
+    def test_rate_limiter_adopts_server_headers(self):
+        """x-ratelimit-* headers retune the bucket and trigger a pause when low."""
+        import httpx
+        from mcp.integrations.atlassian_client import AtlassianRateLimiter
+        
+        limiter = AtlassianRateLimiter()
+        limiter.update(httpx.Headers({
+            "x-ratelimit-fillrate": "5",
+            "x-ratelimit-interval-seconds": "2",
+            "x-ratelimit-limit": "40",
+            "x-ratelimit-remaining": "30",
+        }))
+        assert (limiter.fill_rate, limiter.interval, limiter.capacity) == (5, 2, 40)
+        assert limiter._reserve() == 0.0
+        
+        limiter.update(httpx.Headers({"x-ratelimit-remaining": "2"}))
+        assert limiter._reserve() == pytest.approx(0.4, abs=0.05)
+    
+    def test_transient_errors_are_retried_with_backoff(self, monkeypatch):
+        """429/5xx responses are retried, honoring Retry-After before falling back to 2**n."""
+        import httpx
+        from mcp.integrations import atlassian_client
+        
+        sleeps = []
+        monkeypatch.setattr(atlassian_client.time, "sleep", sleeps.append)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(200, json=[{"key": "PROD"}]),
+        ])
+        
+        client = self._live_client(lambda request: next(responses))
+        
+        assert client.get_projects() == [{"key": "PROD"}]
+        assert sleeps == [3.0, 2, 4]
+    
+    def test_post_retried_only_when_throttled(self, monkeypatch):
+        """A 5xx after a POST may follow a committed write, so only 429 is retried."""
+        import httpx
+        from mcp.integrations import atlassian_client
+        
+        sleeps = []
+        monkeypatch.setattr(atlassian_client.time, "sleep", sleeps.append)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "600"}),
+            httpx.Response(504),
+            httpx.Response(201, json={"id": "1", "key": "PROD-1"}),
+        ])
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return next(responses)
+        
+        client = self._live_client(handler)
+        
+        assert client.create_issue("PROD", "Outage") is None
+        assert calls == ["POST", "POST"]
+        assert sleeps == [atlassian_client.BACKOFF_MAX]
+    
+    def test_retries_stop_at_wait_budget(self, monkeypatch):
+        """Retry waits are capped in total so one request cannot block for minutes."""
+        import httpx
+        from mcp.integrations import atlassian_client
+        
+        sleeps = []
+        monkeypatch.setattr(atlassian_client.time, "sleep", sleeps.append)
+        client = self._live_client(
+            lambda request: httpx.Response(503, headers={"Retry-After": "25"})
+        )
+        
+        assert client.get_projects() == []
+        assert sum(sleeps) <= atlassian_client.RETRY_WAIT_BUDGET
+        assert sleeps == [25.0, 25.0]
+    
+    def test_client_errors_are_not_retried(self, monkeypatch):
+        """Non-transient errors fail fast."""
+        import httpx
+        from mcp.integrations import atlassian_client
+        
+        monkeypatch.setattr(atlassian_client.time, "sleep", lambda s: None)
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+        
+        client = self._live_client(handler)
+        
+        assert client.get_issue("PROD-404") is None
+        assert len(calls) == 1
+    
+    def test_aimd_limit_grows_additively_and_halves_on_throttle(self):
+        """Fast responses add 0.5 to the limit; throttling halves it."""
+        from mcp.integrations.atlassian_client import AIMDSemaphore
+        
+        aimd = AIMDSemaphore(initial=4, maximum=5, target_latency=0.1)
+        for _ in range(4):
+            aimd.record(0.05)
+        assert aimd.limit == 5
+        
+        aimd.record(0.05, throttled=True)
+        assert aimd.limit == 2
+        
+        aimd.record(5.0)
+        assert aimd.limit == 1
+    
+    @pytest.mark.asyncio
+    async def test_aimd_caps_concurrent_requests(self):
+        """No more than ``limit`` requests run at once."""
+        import asyncio
+        from mcp.integrations.atlassian_client import AIMDSemaphore
+        
+        aimd = AIMDSemaphore(initial=2)
+        active = peak = 0
+        
+        async def call():
+            nonlocal active, peak
+            async with aimd:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+        
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+    
+    def test_get_issue_caches_parsed_object_and_revalidates_etag(self):
+        """Fresh hits skip the network; expired entries revalidate via If-None-Match."""
+        import httpx
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"', "Cache-Control": "max-age=120"},
+                json={"key": "PROD-7", "fields": {"summary": "Cached"}},
+            )
+        
+        client = self._live_client(handler)
+        first = client.get_issue("PROD-7")
+        assert client.get_issue("PROD-7") is first
+        assert requests_seen == [None]
+        
+        expires_at, value, etag = client._response_cache[("issue", "PROD-7")]
+        assert etag == '"v1"'
+        client._response_cache[("issue", "PROD-7")] = (0.0, value, etag)
+        
+        assert client.get_issue("PROD-7") is first
+        assert requests_seen == [None, '"v1"']
+    
+    def test_not_modified_without_cached_entry_refetches(self):
+        """A 304 arriving after the entry was dropped triggers an unconditional GET."""
+        import httpx
+        
+        requests_seen = []
+        
+        def handler(request):
+            etag = request.headers.get("If-None-Match")
+            requests_seen.append(etag)
+            if etag:
+                client.invalidate_cache()
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"ETag": '"v1"'},
+                json={"key": "PROD-8", "fields": {"summary": "Refetched"}},
+            )
+        
+        client = self._live_client(handler)
+        client.get_issue("PROD-8")
+        expires_at, value, etag = client._response_cache[("issue", "PROD-8")]
+        client._response_cache[("issue", "PROD-8")] = (0.0, value, etag)
+        
+        issue = client.get_issue("PROD-8")
+        assert issue.summary == "Refetched"
+        assert requests_seen == [None, '"v1"', None]
+
+    def test_response_cache_is_thread_safe(self, monkeypatch):
+        """Concurrent lookups, stores and evictions from worker threads keep the LRU intact."""
+        from concurrent.futures import ThreadPoolExecutor
+        from mcp.integrations import atlassian_client
+
+        monkeypatch.setattr(atlassian_client, "RESPONSE_CACHE_SIZE", 8)
+        client = self._live_client(lambda request: None)
+
+        def worker(offset):
+            for i in range(2000):
+                key = ("issue", (offset + i) % 16)
+                client._cache_lookup(key)
+                client._cache_store(key, [i], 60)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+        assert len(client._response_cache) == 8
+    
+    def test_search_results_are_cached_until_invalidated(self):
+        """Repeated searches reuse parsed issues until the cache is cleared."""
+        import httpx
+        
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"issues": [{"key": "PROD-1", "fields": {}}]})
+        
+        client = self._live_client(handler)
+        first = client.search_issues(project="PROD")
+        first.clear()
+        second = client.search_issues(project="PROD")
+        assert [issue.key for issue in second] == ["PROD-1"]
+        assert len(calls) == 1
+        
+        client.search_issues(project="STREAM")
+        client.invalidate_cache()
+        client.search_issues(project="PROD")
+        assert len(calls) == 3
+    
+    def test_pareto_batches_project_searches(self, monkeypatch):
+        """Several projects are searched concurrently in a single batch."""
+        import json
+        import httpx
+        
+        from mcp.integrations.atlassian_client import _PARETO_JIRA_FIELDS
+        
+        seen = []
+        requested_fields = []
+        
+        def handler(request):
+            body = json.loads(request.content)
+            project = body["jql"].split('"')[1]
+            seen.append(project)
+            requested_fields.append(body["fields"])
+            return httpx.Response(200, json={"issues": [
+                {"key": f"{project}-1", "fields": {"project": {"key": project}}}
+            ]})
+        
+        async_client = httpx.AsyncClient
+        opened = []
+        monkeypatch.setattr(
+            httpx, "AsyncClient",
+            lambda **kwargs: opened.append(async_client(transport=httpx.MockTransport(handler))) or opened[-1]
+        )
+        client = self._live_client(handler)
+        data = client.get_issues_for_pareto_analysis(projects=["PROD", "STREAM"])
+        
+        assert sorted(seen) == ["PROD", "STREAM"]
+        assert sorted(item["item_id"] for item in data) == ["PROD-1", "STREAM-1"]
+        assert requested_fields == [list(_PARETO_JIRA_FIELDS)] * 2
+        
+        # Each batch closes the client bound to its loop; AIMD keeps learning
+        learned = client._aimd.limit
+        client.invalidate_cache()
+        client.get_issues_for_pareto_analysis(projects=["PROD", "STREAM"])
+        assert client._client is None
+        assert len(opened) == 2 and all(http.is_closed for http in opened)
+        assert client._aimd.limit > learned
+    
+    def test_create_issue_uses_post_response_without_refetch(self):
+        """Creating an issue costs one round-trip; the result comes from the POST."""
+        import httpx
+        
+        calls = []
+        
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(201, json={"id": "10001", "key": "PROD-900", "self": "https://jira.test"})
+        
+        client = self._live_client(handler)
+        issue = client.create_issue("PROD", "New outage", priority="High", labels=["p1"])
+        
+        assert calls == ["POST"]
+        assert (issue.key, issue.summary, issue.priority, issue.labels) == (
+            "PROD-900", "New outage", "High", ["p1"]
+        )
+    
+    def test_extract_description_walks_nested_adf(self):
+        """Paragraph text is collected in order, including inside lists."""
+        from mcp.integrations import AtlassianClient
+        
+        def paragraph(*texts):
+            return {"type": "paragraph", "content": [{"type": "text", "text": t} for t in texts]}
+        
+        doc = {"type": "doc", "content": [
+            paragraph("Playback", "fails"),
+            {"type": "heading", "content": [{"type": "text", "text": "skipped"}]},
+            {"type": "bulletList", "content": [
+                {"type": "listItem", "content": [paragraph("on Roku")]},
+                {"type": "listItem", "content": [paragraph("on web")]},
+            ]},
+            paragraph("since 9am"),
+        ]}
+        
+        client = AtlassianClient()
+        assert client._extract_description(doc) == "Playback fails on Roku on web since 9am"
+        assert client._extract_description("plain") == "plain"
+        assert client._extract_description(None) == ""
+    
+    def test_issue_cost_summary_aggregates_in_one_pass(self):
+        """Totals, per-show rollups and the top-5 ranking agree with the issues."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient()
+        issues = client.search_issues(max_results=100)
+        summary = client.get_issue_cost_summary()
+        
+        assert summary["total_issues"] == len(issues)
+        assert summary["total_cost_impact"] == sum(i.cost_impact for i in issues)
+        assert sum(s["count"] for s in summary["by_show"].values()) == len(issues)
+        assert [i["key"] for i in summary["top_issues"]] == [
+            i.key for i in sorted(issues, key=lambda x: x.cost_impact, reverse=True)[:5]
+        ]
+    
+    def test_issue_and_page_records_use_slots(self):
+        """Issue/page records carry no per-instance __dict__."""
+        from mcp.integrations.atlassian_client import JiraIssue, ConfluencePage
+        
+        issue = JiraIssue(key="PROD-1", summary="", status="Open", priority="High",
+                          issue_type="Bug", project="PROD")
+        page = ConfluencePage(id="1", title="Runbook", space_key="OPS", status="current")
+        
+        assert not hasattr(issue, "__dict__")
+        assert not hasattr(page, "__dict__")
+    
+    def test_search_jql_is_joined_before_order_by(self):
+        """Filters are AND-ed together and the ORDER BY clause follows once."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient()
+        
+        assert client._search_payload("labels = p1", "PROD", "Open", 10)["jql"] == (
+            'project = "PROD" AND status = "Open" AND (labels = p1) ORDER BY created DESC'
+        )
+        assert client._search_payload("", None, None, 10)["jql"] == (
+            "project in (PROD, STREAM, CONTENT) ORDER BY created DESC"
+        )
+    
+    def test_build_jql_is_memoized(self):
+        """Repeated filter combinations reuse the same composed JQL string."""
+        from mcp.integrations.atlassian_client import _build_jql
+        
+        first = _build_jql("PROD", "Open", "")
+        assert _build_jql("PROD", "Open", "") is first
+        assert _build_jql.cache_info().hits >= 1
+    
+    def test_create_page_sends_preencoded_json(self):
+        """Outbound payloads are serialized once and labelled as JSON."""
+        import json
+        import httpx
+        
+        sent = []
+        
+        def handler(request):
+            sent.append((request.headers["Content-Type"], json.loads(request.content)))
+            return httpx.Response(200, json={"id": "77", "title": "Postmortem", "space": {"key": "OPS"}})
+        
+        client = self._live_client(handler)
+        page = client.create_page("OPS", "Postmortem", "<p>Root cause</p>", parent_id="5")
+        
+        assert page.id == "77"
+        content_type, body = sent[0]
+        assert content_type == "application/json"
+        assert body["ancestors"] == [{"id": "5"}]
+        assert body["body"]["storage"]["value"] == "<p>Root cause</p>"
+    
+    @pytest.mark.asyncio
+    async def test_async_client_uses_tuned_http2_pool(self):
+        """The shared async client is built once per loop with the tuned timeouts."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient(mock_mode=False)
+        http = await client._ensure_client()
+        
+        assert await client._ensure_client() is http
+        assert (http.timeout.connect, http.timeout.read, http.timeout.pool) == (5.0, 30.0, 5.0)
+        await client.close()
+        assert client._client is None
+    
+    def test_mock_lookups_use_prebuilt_indexes(self):
+        """Mock issues/pages are built once and looked up by key, project and space."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient()
+        
+        assert client.get_issue("STREAM-201") is client.get_issue("STREAM-201")
+        assert client.get_issue("NOPE-1") is None
+        assert [i.key for i in client.search_issues(project="PROD", status="open")] == [
+            "PROD-102", "PROD-105"
+        ]
+        assert client.search_issues(project="MISSING") == []
+        assert [i.key for i in client.search_issues(status="CRITICAL")] == []
+        assert [i.key for i in client.search_issues(status="in review", max_results=1)] == ["PROD-103"]
+        assert client.get_page("page-004").space_key == "OPS"
+        assert [p.id for p in client.search_pages(query="qoe", space_key="STREAM")] == ["page-002"]
+    
+    @staticmethod
+    def _paged_search_handler(total, pages):
+        """Serve ``total`` issues over search/jql using nextPageToken paging."""
+        import json
+        import httpx
+        
+        def handler(request):
+            body = json.loads(request.content)
+            start = int(body.get("nextPageToken", 0))
+            pages.append((start, body["maxResults"]))
+            end = min(total, start + body["maxResults"])
+            data = {"issues": [{"key": f"PROD-{n}", "fields": {}} for n in range(start, end)]}
+            if end < total:
+                data["nextPageToken"] = str(end)
+            return httpx.Response(200, json=data)
+        
+        return handler
+    
+    def test_search_is_fetched_in_pages_of_25(self):
+        """Large searches follow nextPageToken in 25-issue pages up to max_results."""
+        pages = []
+        client = self._live_client(self._paged_search_handler(200, pages))
+        
+        issues = client.search_issues(project="PROD", max_results=60)
+        
+        assert pages == [(0, 25), (25, 25), (50, 10)]
+        assert [i.key for i in issues] == [f"PROD-{n}" for n in range(60)]
+    
+    @pytest.mark.asyncio
+    async def test_async_search_pipelines_pages(self, monkeypatch):
+        """The async search stops when the server reports no further pages."""
+        import httpx
+        
+        pages = []
+        handler = self._paged_search_handler(40, pages)
+        async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx, "AsyncClient",
+            lambda **kwargs: async_client(transport=httpx.MockTransport(handler))
+        )
+        client = self._live_client(handler)
+        
+        issues = await client.search_issues_async(project="PROD", max_results=100)
+        
+        assert pages == [(0, 25), (25, 25)]
+        assert len(issues) == 40
+    
+    def test_parse_jira_issue_tolerates_missing_and_null_fields(self):
+        """Absent or null nested objects fall back to defaults."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient()
+        issue = client._parse_jira_issue({"key": "PROD-5", "fields": {
+            "summary": "Null everywhere",
+            "status": None,
+            "assignee": None,
+            "reporter": {"displayName": "Ops Bot"},
+            "components": [{"name": "CDN"}, {"id": "9"}],
+        }})
+        
+        assert (issue.status, issue.priority, issue.issue_type) == ("Unknown", "Medium", "Task")
+        assert (issue.assignee, issue.reporter) == (None, "Ops Bot")
+        assert issue.components == ["CDN"]
+        assert issue.labels == []
+        assert client._parse_jira_issue({}).key == ""
+    
+    @pytest.mark.asyncio
+    async def test_public_async_api_in_mock_mode(self):
+        """The *_async methods serve mock data without touching the network."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient()
+        
+        assert [i.key for i in await client.search_issues_async(project="STREAM")] == ["STREAM-201"]
+        assert (await client.get_issue_async("PROD-101")).show_name == "Yellowstone"
+        assert len(await client.get_projects_async()) == 3
+        assert (await client.get_page_async("page-001")).space_key == "PROD"
+        assert (await client.create_issue_async("OPS", "Async ticket")).key == "OPS-999"
+        assert (await client.create_page_async("OPS", "Notes", "<p/>")).id == "mock-999"
+        assert (await client.create_issue_async("OPS", "Again")).created == (
+            client.create_page("OPS", "Notes", "<p/>").created
+        ) == "2024-12-17T12:00:00"
+        rows = await client.get_issues_for_pareto_analysis_async(projects=["PROD", "STREAM"])
+        assert rows == client.get_issues_for_pareto_analysis(projects=["PROD", "STREAM"])
+    
+    @pytest.mark.asyncio
+    async def test_sync_batch_refuses_running_loop(self):
+        """Sync batch wrappers point async callers at the *_async variant."""
+        from mcp.integrations import AtlassianClient
+        
+        client = AtlassianClient(jira_url="https://jira.test", mock_mode=False)
+        
+        with pytest.raises(RuntimeError, match="_async"):
+            client.get_issues_for_pareto_analysis(projects=["PROD"])
+    
+    def test_basic_auth_is_built_once_and_sent(self):
+        """One BasicAuth per service is reused for every request."""
+        import base64
+        import httpx
+        
+        seen = []
+        
+        def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json=[])
+        
+        client = self._live_client(handler)
+        assert client._get_jira_auth() is client._get_jira_auth()
+        
+        client.get_projects()
+        client.invalidate_cache()
+        client.get_projects()
+        
+        expected = "Basic " + base64.b64encode(b"bot:token").decode()
+        assert seen == [expected, expected]
+    
+    def test_pareto_projects_in_mock_mode(self):
+        """Mock mode combines the mock issues of each requested project."""
+        from mcp.integrations import AtlassianClient
+        
+        data = AtlassianClient().get_issues_for_pareto_analysis(projects=["STREAM", "CONTENT"])
+        assert {item["category"] for item in data} == {"STREAM", "CONTENT"}
+
+
 class TestIntegrationConsistency:
     """Tests for consistency across integrations."""
     